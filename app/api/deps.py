@@ -1,9 +1,19 @@
+import time
 from typing import AsyncGenerator
 
+from fastapi import Request
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
-from app.db.session import get_session
+from app.db.engine import has_read_replica
+from app.db.session import get_read_sessionmaker, get_session, get_sessionmaker
+from app.models import Project, Track
+
+# 쓰기 직후 primary로 조회를 고정하는 시각(epoch 초)을 담는 쿠키
+READ_PRIMARY_COOKIE = "cb_read_primary_until"
+# 클라이언트가 마지막으로 본 프로젝트 revision (replica가 이보다 뒤처지면 primary 사용)
+MIN_REVISION_HEADER = "X-Min-Project-Revision"
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -12,7 +22,63 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def _sticky_primary(request: Request) -> bool:
+    """최근 쓰기를 한 클라이언트인지 (sticky-primary window 이내)"""
+    until = request.cookies.get(READ_PRIMARY_COOKIE)
+    if not until:
+        return False
+    try:
+        return time.time() < float(until)
+    except ValueError:
+        return False
+
+
+async def _replica_lags(session: AsyncSession, request: Request) -> bool:
+    """replica의 프로젝트 revision이 클라이언트가 본 revision보다 뒤처졌는지"""
+    header = request.headers.get(MIN_REVISION_HEADER)
+    if not header:
+        return False
+    try:
+        min_revision = int(header)
+    except ValueError:
+        return False
+
+    project_id = request.path_params.get("project_id")
+    track_id = request.path_params.get("track_id")
+    if project_id is not None:
+        query = select(Project.revision).where(Project.id == int(project_id))
+    elif track_id is not None:
+        query = (
+            select(Project.revision)
+            .join(Track, Track.project_id == Project.id)
+            .where(Track.id == int(track_id))
+        )
+    else:
+        return False
+
+    result = await session.execute(query)
+    revision = result.scalar_one_or_none()
+    # replica에 아직 없는 행도 뒤처진 것으로 간주
+    return revision is None or revision < min_revision
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """조회용 session (read replica 우선, read-your-writes 보장)
+
+    다음 경우에는 primary를 사용합니다.
+    - read replica가 설정되지 않은 경우
+    - 쓰기 직후 sticky-primary window 이내인 경우 (READ_PRIMARY_COOKIE)
+    - X-Min-Project-Revision 헤더보다 replica의 프로젝트 revision이 낮은 경우
+    """
+    if has_read_replica() and not _sticky_primary(request):
+        async with get_read_sessionmaker()() as session:
+            if not await _replica_lags(session, request):
+                yield session
+                return
+    async with get_sessionmaker()() as session:
+        yield session
+
+
 def get_settings_dep() -> Settings:
     """Dependency for getting settings"""
     return get_settings()
-
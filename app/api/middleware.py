@@ -0,0 +1,86 @@
+import time
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.api.deps import READ_PRIMARY_COOKIE
+from app.core.config import get_settings
+from app.core.metrics import Histogram, register
+from app.db.engine import has_read_replica
+from app.db.query_stats import QueryStats, collect_queries
+
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+db_queries_histogram = register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL queries executed per request",
+        label_names=("method", "route"),
+        buckets=(1, 2, 3, 5, 10, 20, 50, 100),
+    )
+)
+db_seconds_histogram = register(
+    Histogram(
+        "http_request_db_seconds",
+        "Total DB time per request",
+        label_names=("method", "route"),
+    )
+)
+db_slowest_histogram = register(
+    Histogram(
+        "http_request_db_slowest_seconds",
+        "Slowest SQL statement per request",
+        label_names=("method", "route"),
+    )
+)
+
+
+def _server_timing(stats: QueryStats) -> str:
+    value = f'db;dur={stats.total_sec * 1000:.2f};desc="{stats.count} queries"'
+    if stats.slowest_statement:
+        # 헤더에 넣을 수 있도록 공백/따옴표 정리 후 잘라냄
+        statement = " ".join(stats.slowest_statement.split()).replace('"', "'")[:120]
+        value += f', db-slowest;dur={stats.slowest_sec * 1000:.2f};desc="{statement}"'
+    return value
+
+
+async def query_stats_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """요청별 SQL 쿼리 수 / DB 시간 기록
+
+    debug 모드에서는 Server-Timing 헤더로, 그 외에는 route 템플릿별 histogram으로 노출합니다.
+    """
+    with collect_queries() as stats:
+        response = await call_next(request)
+
+    if get_settings().debug:
+        response.headers["Server-Timing"] = _server_timing(stats)
+
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", "unmatched")
+    db_queries_histogram.observe(stats.count, method=request.method, route=route_path)
+    db_seconds_histogram.observe(stats.total_sec, method=request.method, route=route_path)
+    if stats.count:
+        db_slowest_histogram.observe(stats.slowest_sec, method=request.method, route=route_path)
+    return response
+
+
+async def sticky_primary_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """쓰기 요청이 성공하면 잠시 동안 같은 클라이언트의 조회를 primary로 고정"""
+    response = await call_next(request)
+    if request.method not in _READ_METHODS and response.status_code < 400 and has_read_replica():
+        sticky_sec = get_settings().db_read_sticky_sec
+        if sticky_sec > 0:
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                f"{time.time() + sticky_sec:.3f}",
+                max_age=int(sticky_sec) + 1,
+                httponly=True,
+                samesite="lax",
+            )
+    return response
@@ -3,6 +3,9 @@ from app.api.routers.music import router as music_router
 from app.api.routers.layers import router as layers_router
 from app.api.routers.keyframes import router as keyframes_router
 from app.api.routers.assets import router as assets_router
+from app.api.routers.timeline import router as timeline_router
+from app.api.routers.jobs import router as jobs_router
+from app.api.routers.sources import router as sources_router
 
 __all__ = [
     "projects_router",
@@ -10,5 +13,8 @@ __all__ = [
     "layers_router",
     "keyframes_router",
     "assets_router",
+    "timeline_router",
+    "jobs_router",
+    "sources_router",
 ]
 
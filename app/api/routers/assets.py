@@ -24,14 +24,14 @@ async def get_presigned_url(
     data: AssetPresignRequest,
 ) -> AssetPresignResponse:
     """자산 presigned GET URL 발급"""
-    url = AssetsService.get_presigned_url(
-        object_key=data.object_key,
-        expires_hours=1,
+    urls, expires_in = AssetsService.get_presigned_urls_with_expiry(
+        object_keys=[data.object_key],
+        expires_sec=int(timedelta(hours=1).total_seconds()),
     )
 
     return AssetPresignResponse(
-        url=url,
-        expires_in=int(timedelta(hours=1).total_seconds()),
+        url=urls[data.object_key],
+        expires_in=expires_in,
     )
 
 
@@ -45,13 +45,13 @@ async def get_presigned_urls_batch(
     data: AssetPresignBatchRequest,
 ) -> AssetPresignBatchResponse:
     """자산 presigned GET URL 일괄 발급"""
-    urls = AssetsService.get_presigned_urls_batch(
+    urls, expires_in = AssetsService.get_presigned_urls_with_expiry(
         object_keys=data.object_keys,
-        expires_hours=1,
+        expires_sec=int(timedelta(hours=1).total_seconds()),
     )
 
     return AssetPresignBatchResponse(
         urls=urls,
-        expires_in=int(timedelta(hours=1).total_seconds()),
+        expires_in=expires_in,
     )
 
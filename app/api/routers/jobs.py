@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_read_db
+from app.core.errors import ErrorResponse
+from app.schemas.job import JobResponse
+from app.services.jobs_service import JobsService
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse}},
+)
+async def get_job(
+    job_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> JobResponse:
+    """작업 상태 조회"""
+    return await JobsService.get_job(db, job_id)
@@ -1,29 +1,54 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.core.errors import ErrorResponse
-from app.schemas.keyframe import KeyframeUpsert, KeyframeResponse
+from app.api.deps import get_db, get_read_db
+from app.core.errors import ErrorResponse, ValidationError
+from app.schemas.keyframe import KeyframeUpsert, KeyframeResponse, KeyframeSampleResponse
 from app.services.keyframes_service import KeyframesService
 
 router = APIRouter(prefix="/tracks/{track_id}/position-keyframes", tags=["keyframes"])
 
 
+def _parse_revision_etag(value: str) -> int:
+    """If-Match 헤더 값(`"3"`, `W/"3"`, `3`)에서 revision 추출"""
+    raw = value.strip()
+    if raw.startswith("W/"):
+        raw = raw[2:]
+    try:
+        return int(raw.strip('"'))
+    except ValueError as exc:
+        raise ValidationError(f"Invalid If-Match header: {value}") from exc
+
+
 @router.put(
     "",
     response_model=list[KeyframeResponse],
     status_code=200,
-    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+    responses={
+        404: {"model": ErrorResponse},
+        412: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+    },
 )
 async def upsert_keyframes(
     track_id: int,
     data: KeyframeUpsert,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
+    if_match: Annotated[str | None, Header(alias="If-Match")] = None,
 ) -> list[KeyframeResponse]:
-    """키프레임 전체 교체 (upsert)"""
-    return await KeyframesService.upsert_keyframes(db, track_id, data)
+    """키프레임 전체 교체 (upsert)
+
+    If-Match 헤더로 트랙 revision을 전달하면 불일치 시 412를 반환합니다.
+    """
+    expected_revision = _parse_revision_etag(if_match) if if_match and if_match.strip() != "*" else None
+    keyframes, revision = await KeyframesService.upsert_keyframes(
+        db, track_id, data, expected_revision=expected_revision
+    )
+    response.headers["ETag"] = f'"{revision}"'
+    return keyframes
 
 
 @router.get(
@@ -33,8 +58,61 @@ async def upsert_keyframes(
 )
 async def get_keyframes(
     track_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> list[KeyframeResponse]:
     """키프레임 목록 조회"""
-    return await KeyframesService.get_keyframes(db, track_id)
+    keyframes, revision = await KeyframesService.get_keyframes(db, track_id)
+    response.headers["ETag"] = f'"{revision}"'
+    return keyframes
+
+
+@router.get(
+    "/sample",
+    response_model=KeyframeSampleResponse,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+    },
+)
+async def sample_keyframes(
+    track_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    fps: Annotated[float, Query(gt=0, le=240)] = 30.0,
+    from_sec: Annotated[float | None, Query(alias="from", ge=0)] = None,
+    to_sec: Annotated[float | None, Query(alias="to", ge=0)] = None,
+    response_format: Annotated[Literal["json", "binary"], Query(alias="format")] = "json",
+) -> KeyframeSampleResponse | Response:
+    """트랙 위치를 fps 간격으로 샘플링 (STEP/LINEAR 보간 반영)
+
+    format=binary 이면 (num_samples, 2) float32 little-endian 배열(x, y 교차)을 반환합니다.
+    """
+    samples, revision, start = await KeyframesService.sample_track_positions(
+        db, track_id, fps, from_sec=from_sec, to_sec=to_sec
+    )
+    headers = {"ETag": f'"{revision}"'}
+
+    if response_format == "binary":
+        headers.update(
+            {
+                "X-Sample-Fps": str(fps),
+                "X-Sample-From": str(start),
+                "X-Sample-Count": str(len(samples)),
+            }
+        )
+        return Response(content=samples.astype("<f4").tobytes(), media_type="application/octet-stream", headers=headers)
 
+    return Response(
+        content=KeyframeSampleResponse(
+            track_id=track_id,
+            revision=revision,
+            fps=fps,
+            from_sec=start,
+            num_samples=len(samples),
+            x=samples[:, 0].tolist(),
+            y=samples[:, 1].tolist(),
+        ).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
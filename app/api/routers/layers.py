@@ -1,13 +1,14 @@
 from typing import Annotated
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
 from app.core.errors import ErrorResponse
 from app.schemas.layer import LayerUploadResponse, LayerUpdate, LayerResponse
 from app.services.layers_service import LayersService
+from app.services.outbox_service import OutboxService
 
 router = APIRouter(prefix="/tracks/{track_id}/layers", tags=["layers"])
 
@@ -16,20 +17,24 @@ router = APIRouter(prefix="/tracks/{track_id}/layers", tags=["layers"])
     "/upload",
     response_model=LayerUploadResponse,
     status_code=201,
-    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}, 429: {"model": ErrorResponse}},
 )
 async def upload_layer(
     track_id: int,
     file: Annotated[UploadFile, File(...)],
     start_sec: Annotated[Decimal, Form(...)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
     priority: Annotated[int, Form()] = 0,
     label: Annotated[str | None, Form()] = None,
 ) -> LayerUploadResponse:
     """레이어 파일 업로드, 프로젝트 연결, 워커 enqueue
     
     서버에서 비디오 파일을 분석하여 end_sec을 자동으로 계산합니다.
+    추출 큐가 밀려 있으면 429와 Retry-After를 반환하고, 받은 경우 큐 위치와 예상 대기 시간을 함께 반환합니다.
     """
+    # 응답 후 outbox 발행 (실패해도 dispatcher 루프가 재시도)
+    background_tasks.add_task(OutboxService.dispatch_now)
     return await LayersService.upload_layer(
         db=db,
         track_id=track_id,
@@ -40,6 +45,21 @@ async def upload_layer(
     )
 
 
+@router.get(
+    "",
+    response_model=list[LayerResponse],
+    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def list_layers(
+    track_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    from_sec: Annotated[Decimal | None, Query(alias="from", ge=0)] = None,
+    to_sec: Annotated[Decimal | None, Query(alias="to", ge=0)] = None,
+) -> list[LayerResponse]:
+    """구간과 겹치는 레이어 목록 조회 (from/to 생략 시 전체)"""
+    return await LayersService.list_layers(db, track_id, from_sec=from_sec, to_sec=to_sec)
+
+
 @router.get(
     "/{layer_id}",
     response_model=LayerResponse,
@@ -48,7 +68,7 @@ async def upload_layer(
 async def get_layer(
     track_id: int,
     layer_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> LayerResponse:
     """레이어 조회 (상태 포함)"""
     return await LayersService.get_layer(db, layer_id)
@@ -1,12 +1,20 @@
-from typing import Annotated
+from decimal import Decimal
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query
+import numpy as np
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
 from app.core.errors import ErrorResponse
 from app.schemas.common import CursorResponse
+from app.schemas.job import JobResponse
+from app.schemas.keyframe import KeyframeSampleResponse, ProjectKeyframeSampleResponse
+from app.schemas.layer import LayerBatchRequest, LayerBatchResponse, LayerResponse
 from app.schemas.project import ProjectCreate, ProjectResponse, EditStateResponse
+from app.services.jobs_service import JobsService
+from app.services.keyframes_service import KeyframesService
+from app.services.layers_service import LayersService
 from app.services.projects_service import ProjectsService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -32,7 +40,7 @@ async def create_project(
     responses={422: {"model": ErrorResponse}},
 )
 async def list_projects(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     cursor: Annotated[str | None, Query()] = None,
 ) -> CursorResponse[ProjectResponse]:
@@ -59,7 +67,7 @@ async def list_projects(
 )
 async def get_project(
     project_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> ProjectResponse:
     """프로젝트 조회"""
     return await ProjectsService.get_project(db, project_id)
@@ -72,8 +80,143 @@ async def get_project(
 )
 async def get_edit_state(
     project_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    include_urls: Annotated[bool, Query(description="자산 presigned GET URL 포함 여부")] = False,
+    include_timeline: Annotated[bool, Query(description="트랙별 활성 레이어 구간 포함 여부")] = False,
+    lod: Annotated[
+        int | None, Query(ge=1, description="타임라인 미리보기용 LOD (이 factor 이하 중 가장 거친 레벨 선택)")
+    ] = None,
 ) -> EditStateResponse:
     """프로젝트 edit-state 조회 (프론트 렌더링용 전체 상태)"""
-    return await ProjectsService.get_edit_state(db, project_id)
+    return await ProjectsService.get_edit_state(
+        db,
+        project_id,
+        include_urls=include_urls,
+        include_timeline=include_timeline,
+        lod=lod,
+    )
+
+
+@router.get(
+    "/{project_id}/position-keyframes/sample",
+    response_model=ProjectKeyframeSampleResponse,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+    },
+)
+async def sample_project_keyframes(
+    project_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    fps: Annotated[float, Query(gt=0, le=240)] = 30.0,
+    from_sec: Annotated[float | None, Query(alias="from", ge=0)] = None,
+    to_sec: Annotated[float | None, Query(alias="to", ge=0)] = None,
+    response_format: Annotated[Literal["json", "binary"], Query(alias="format")] = "json",
+) -> ProjectKeyframeSampleResponse | Response:
+    """프로젝트 전체 트랙 위치를 동일한 시각 배열로 샘플링
+
+    format=binary 이면 (num_tracks, num_samples, 2) float32 little-endian 배열을 반환하며,
+    트랙 순서는 X-Track-Ids 헤더(slot 순)를 따릅니다. ETag는 프로젝트 revision입니다.
+    """
+    tracks, start, revision = await KeyframesService.sample_project_positions(
+        db, project_id, fps, from_sec=from_sec, to_sec=to_sec
+    )
+    num_samples = len(next(iter(tracks.values()))[0]) if tracks else 0
+    headers = {"ETag": f'"{revision}"'}
+
+    if response_format == "binary":
+        stacked = (
+            np.stack([samples for samples, _ in tracks.values()])
+            if tracks
+            else np.zeros((0, num_samples, 2), dtype=np.float32)
+        )
+        headers.update(
+            {
+                "X-Sample-Fps": str(fps),
+                "X-Sample-From": str(start),
+                "X-Sample-Count": str(num_samples),
+                "X-Track-Ids": ",".join(str(track_id) for track_id in tracks),
+                "X-Track-Revisions": ",".join(str(track_revision) for _, track_revision in tracks.values()),
+            }
+        )
+        return Response(content=stacked.astype("<f4").tobytes(), media_type="application/octet-stream", headers=headers)
+
+    return Response(
+        content=ProjectKeyframeSampleResponse(
+            project_id=project_id,
+            fps=fps,
+            from_sec=start,
+            num_samples=num_samples,
+            tracks=[
+                KeyframeSampleResponse(
+                    track_id=track_id,
+                    revision=track_revision,
+                    fps=fps,
+                    from_sec=start,
+                    num_samples=len(samples),
+                    x=samples[:, 0].tolist(),
+                    y=samples[:, 1].tolist(),
+                )
+                for track_id, (samples, track_revision) in tracks.items()
+            ],
+        ).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get(
+    "/{project_id}/layers",
+    response_model=list[LayerResponse],
+    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def list_project_layers(
+    project_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    from_sec: Annotated[Decimal | None, Query(alias="from", ge=0)] = None,
+    to_sec: Annotated[Decimal | None, Query(alias="to", ge=0)] = None,
+) -> list[LayerResponse]:
+    """프로젝트 전체 트랙에서 구간과 겹치는 레이어 조회 (타임라인 가시 영역 lazy load용)"""
+    return await LayersService.list_project_layers(db, project_id, from_sec=from_sec, to_sec=to_sec)
+
 
+@router.patch(
+    "/{project_id}/layers:batch",
+    response_model=LayerBatchResponse,
+    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def batch_update_layers(
+    project_id: int,
+    data: LayerBatchRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> LayerBatchResponse:
+    """레이어 일괄 업데이트/삭제 (한 트랜잭션, 프로젝트 revision 1회 증가)"""
+    return await LayersService.batch_update_layers(db, project_id, data)
+
+
+@router.get(
+    "/{project_id}/jobs",
+    response_model=CursorResponse[JobResponse],
+    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def list_project_jobs(
+    project_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: Annotated[str | None, Query()] = None,
+) -> CursorResponse[JobResponse]:
+    """프로젝트의 스켈레톤 추출 작업 목록 조회 (최신순)"""
+    jobs = await JobsService.list_project_jobs(db, project_id, limit=limit, cursor=cursor)
+
+    next_cursor = None
+    has_more = False
+    if len(jobs) == limit:
+        next_cursor = str(jobs[-1].id)
+        has_more = True
+
+    return CursorResponse(
+        items=jobs,
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
@@ -0,0 +1,29 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_read_db
+from app.core.errors import ErrorResponse
+from app.schemas.source import SourceFramesResponse
+from app.services.sources_service import SourcesService
+
+router = APIRouter(prefix="/sources", tags=["sources"])
+
+
+@router.get(
+    "/{source_id}/frames",
+    response_model=SourceFramesResponse,
+    responses={404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def get_source_frames(
+    source_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    from_sec: Annotated[float | None, Query(alias="from", ge=0, description="소스 기준 시작 시각(초)")] = None,
+    to_sec: Annotated[float | None, Query(alias="to", ge=0, description="소스 기준 끝 시각(초)")] = None,
+) -> SourceFramesResponse:
+    """구간과 겹치는 스켈레톤 프레임 chunk의 presigned URL 조회
+
+    chunk가 없는 소스(추출 전, 실패, chunk 저장 이전에 추출된 소스)는 409를 반환합니다.
+    """
+    return await SourcesService.get_frames(db, source_id, from_sec=from_sec, to_sec=to_sec)
@@ -0,0 +1,28 @@
+from decimal import Decimal
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_read_db
+from app.core.errors import ErrorResponse
+from app.schemas.timeline import TimelineResponse
+from app.services.timeline_service import TimelineService
+
+router = APIRouter(prefix="/tracks/{track_id}/timeline", tags=["timeline"])
+
+
+@router.get(
+    "",
+    response_model=TimelineResponse,
+    responses={404: {"model": ErrorResponse}, 422: {"model": ErrorResponse}},
+)
+async def get_timeline(
+    track_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    at: Annotated[Decimal | None, Query(ge=0, description="해당 시각의 활성 구간만 조회")] = None,
+    from_sec: Annotated[Decimal | None, Query(alias="from", ge=0)] = None,
+    to_sec: Annotated[Decimal | None, Query(alias="to", ge=0)] = None,
+) -> TimelineResponse:
+    """트랙 활성 레이어 타임라인 조회 (겹치는 레이어 중 priority가 가장 높은 레이어만 활성)"""
+    return await TimelineService.get_track_timeline(db, track_id, at=at, from_sec=from_sec, to_sec=to_sec)
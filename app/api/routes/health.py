@@ -3,6 +3,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.db.engine import get_pool_status
 from app.db.health import check_db
 from app.storage.health import check_minio
 
@@ -28,6 +29,12 @@ async def health_db() -> dict:
     return {"status": "ok", "db": "ok"}
 
 
+@router.get("/health/db/pool")
+async def health_db_pool() -> dict:
+    """커넥션 풀 사용량 / checkout 대기 시간 (replica sizing용)"""
+    return {"status": "ok", "pool": get_pool_status()}
+
+
 @router.get("/health/minio")
 async def health_minio() -> dict:
     try:
@@ -0,0 +1,81 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_read_db
+from app.core.config import get_settings
+from app.core.metrics import Gauge, register, render_metrics
+from app.services.jobs_service import JobsService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+queue_wait_gauge = register(
+    Gauge(
+        "extract_queue_wait_seconds",
+        "Queue wait (queued -> started) of extraction jobs started in the recent window",
+        label_names=("queue", "quantile"),
+    )
+)
+queue_started_gauge = register(
+    Gauge(
+        "extract_queue_started_jobs",
+        "Extraction jobs started in the recent window",
+        label_names=("queue",),
+    )
+)
+queue_backlog_gauge = register(
+    Gauge(
+        "extract_queue_backlog_jobs",
+        "Extraction jobs waiting for or running inference",
+        label_names=("queue", "state"),
+    )
+)
+queue_drain_gauge = register(
+    Gauge(
+        "extract_queue_drain_seconds",
+        "Estimated time to finish all queued extraction jobs at the current worker count (autoscaling signal)",
+        label_names=("queue",),
+    )
+)
+
+
+async def _refresh_queue_backlog(db: AsyncSession) -> None:
+    settings = get_settings()
+    backlog = await JobsService.queue_backlog(
+        db, settings.extract_queue_wait_window_sec, settings.extract_default_duration_sec
+    )
+    queue_backlog_gauge.clear()
+    queue_drain_gauge.clear()
+    for row in backlog:
+        queue_backlog_gauge.set(row.waiting, queue=row.queue, state="waiting")
+        queue_backlog_gauge.set(row.running, queue=row.queue, state="running")
+        queue_drain_gauge.set(JobsService.estimate_drain_sec(backlog, row.queue), queue=row.queue)
+    queue_drain_gauge.set(JobsService.estimate_drain_sec(backlog), queue="all")
+
+
+async def _refresh_queue_wait(db: AsyncSession) -> None:
+    stats = await JobsService.queue_wait_stats(db, get_settings().extract_queue_wait_window_sec)
+    queue_wait_gauge.clear()
+    queue_started_gauge.clear()
+    for row in stats:
+        queue_wait_gauge.set(row.p50_sec, queue=row.queue, quantile="0.5")
+        queue_wait_gauge.set(row.p95_sec, queue=row.queue, quantile="0.95")
+        queue_wait_gauge.set(row.max_sec, queue=row.queue, quantile="1")
+        queue_started_gauge.set(row.started, queue=row.queue)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(db: Annotated[AsyncSession, Depends(get_read_db)]) -> str:
+    """Prometheus 형식 메트릭"""
+    try:
+        await _refresh_queue_wait(db)
+        await _refresh_queue_backlog(db)
+    except Exception:
+        # DB 장애 시에도 프로세스 메트릭은 노출
+        logger.warning("Failed to refresh queue metrics", exc_info=True)
+    return render_metrics()
@@ -7,8 +7,21 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_ignore_empty=True, extra="ignore")
 
+    # 디버그 모드 (Server-Timing 헤더 등 진단 정보 노출)
+    debug: bool = False
+
     # Database
     database_url: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_sec: float = 30.0
+    db_pool_recycle_sec: int = 1800  # -1이면 recycle 안 함
+    db_pool_pre_ping: bool = True  # checkout마다 ping (끄면 recycle로 stale 연결 관리)
+    db_pgbouncer_mode: bool = False  # PgBouncer transaction pooling 호환 (asyncpg statement cache off)
+
+    # Read replica (미설정 시 모든 조회가 primary 사용)
+    database_read_url: str | None = None
+    db_read_sticky_sec: float = 5.0  # 쓰기 직후 이 시간 동안 해당 클라이언트의 조회는 primary 사용
 
     # MinIO / S3 compatible object storage
     minio_endpoint: str | None = None
@@ -17,12 +30,66 @@ class Settings(BaseSettings):
     minio_bucket: str | None = None
     minio_secure: bool = False
 
+    # Presigned GET URL
+    presign_expires_sec: int = 3600
+    presign_cache_margin_sec: int = 300  # 만료 이 시간 전까지만 캐시된 URL 재사용
+    presign_batch_workers: int = 8  # 일괄 서명 시 병렬 워커 수
+
     # Celery
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
 
+    # Skeleton extraction worker
+    worker_cpu_budget: int = 0  # prefork 자식들이 나눠 쓸 코어 수 (0이면 사용 가능한 코어 전체)
+    worker_threads_per_process: int = 0  # 자식별 OpenCV 스레드 수 (0이면 예산 / concurrency)
+    worker_pin_cores: bool = False  # 자식별로 겹치지 않는 코어에 affinity 고정 (MediaPipe 스레드 포함)
+    extract_work_dir: str = "/tmp/collabography-extract"  # 단계 간 공유 작업 디렉터리 (I/O·CPU 워커가 같은 볼륨 마운트)
+    worker_video_cache_dir: str = "/tmp/collabography-video-cache"  # 원본 영상 LRU 캐시 (work_dir과 같은 파일 시스템 권장)
+    worker_video_cache_max_bytes: int = 10 * 1024**3  # 0이면 캐시 끄기
+    extract_cancel_check_frames: int = 150  # 이 프레임 수마다 취소 요청 확인
+    extract_checkpoint_frames: int = 900  # 이 프레임 수마다 checkpoint chunk 업로드 (재시도 시 이어서 진행)
+    extract_rewarm_frames: int = 30  # 재개 시 tracking 상태 복원을 위해 다시 처리하는 이전 프레임 수
+    skeleton_content_encoding: str = "gzip"  # 스켈레톤 JSON 저장 압축 (identity | gzip | zstd, zstd는 zstandard 필요)
+    skeleton_compression_level: int = 0  # 0이면 codec 기본값 (gzip 6, zstd 10)
+    skeleton_chunk_sec: float = 10.0  # 구간 조회용 프레임 chunk 길이 (0이면 chunk를 만들지 않음)
+    skeleton_lod_factors: str = "4,16"  # 타임라인 미리보기용 LOD 레벨 (약 1/factor 프레임, 쉼표 구분, 비우면 끄기)
+    skeleton_lod_motion_weight: float = 0.5  # LOD 프레임 선택 시 움직임 가중치 (0이면 균등 간격)
+    extract_short_max_sec: float = 60.0  # 이 길이 이하 영상은 extract.short 큐
+    extract_medium_max_sec: float = 300.0  # 이 길이 이하 영상은 extract.medium 큐 (초과 시 extract.long)
+    extract_project_fairness: bool = True  # 진행 중 작업이 많은 프로젝트의 새 작업은 priority를 낮춤
+    extract_queue_wait_window_sec: int = 900  # /metrics 큐 대기 시간, 최근 작업 소요 시간 집계 구간
+    extract_default_duration_sec: float = 120.0  # 최근 완료 작업이 없을 때 가정하는 추론 소요 시간
+
+    # 업로드 backpressure (예상 큐 소진 시간이 이 값을 넘으면 429, 0이면 끄기)
+    upload_max_queue_drain_sec: float = 3600.0
+    upload_retry_after_min_sec: int = 30
+
+    # Storage GC (참조되지 않는 MinIO 객체 / SkeletonSource 정리)
+    storage_gc_interval_sec: int = 6 * 3600  # 워커 beat 실행 주기 (0이면 beat에 등록 안 함)
+    storage_gc_grace_sec: int = 24 * 3600  # 참조가 사라지거나 업로드된 지 이 시간이 지난 것만 삭제
+    storage_gc_batch_size: int = 1000  # 한 번에 잠그고 삭제하는 행/객체 수 (최대 1000)
+    storage_gc_prefixes: str = "media/,music/,skeleton/,checkpoints/"  # sweep 대상 prefix (쉼표 구분, DB가 참조를 기록하지 않는 videos/는 제외)
+
+    # Outbox dispatcher
+    outbox_dispatch_in_api: bool = True  # API 프로세스에서 dispatcher 루프 실행 (별도 프로세스 사용 시 false)
+    outbox_poll_interval_sec: float = 2.0
+    outbox_batch_size: int = 100
+    outbox_max_attempts: int = 10
+    outbox_retry_base_sec: float = 2.0  # 발행 실패 후 재시도 간격 (시도마다 2배)
+    outbox_retry_max_sec: float = 300.0  # 재시도 간격 상한 (기본값으로 약 15분 동안 재시도 후 FAILED)
+    outbox_sent_retention_sec: int = 7 * 24 * 3600  # 발행된(SENT) 행 보관 기간 (0이면 삭제 안 함)
+
     def sqlalchemy_database_url(self) -> str:
-        url = self.database_url.strip()
+        return self._to_sqlalchemy_url(self.database_url)
+
+    def sqlalchemy_database_read_url(self) -> str | None:
+        if not self.database_read_url:
+            return None
+        return self._to_sqlalchemy_url(self.database_read_url)
+
+    @staticmethod
+    def _to_sqlalchemy_url(database_url: str) -> str:
+        url = database_url.strip()
         if url.startswith("postgres://"):
             url = "postgresql://" + url[len("postgres://") :]
         if url.startswith("postgresql://") and "+asyncpg" not in url:
@@ -32,6 +99,7 @@ class Settings(BaseSettings):
     def redacted(self) -> dict[str, Any]:
         return {
             "database_url": "<redacted>",
+            "database_read_url": "<redacted>" if self.database_read_url else None,
             "minio_endpoint": self.minio_endpoint,
             "minio_bucket": self.minio_bucket,
         }
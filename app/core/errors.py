@@ -40,3 +40,23 @@ class ConflictError(HTTPException):
             detail=detail,
         )
 
+
+class PreconditionFailedError(HTTPException):
+    """조건부 요청 실패 (예: If-Match revision 불일치)"""
+
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=detail,
+        )
+
+
+class TooManyRequestsError(HTTPException):
+    """과부하로 요청을 받을 수 없음 (Retry-After 초 후 재시도)"""
+
+    def __init__(self, detail: str, retry_after_sec: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after_sec)},
+        )
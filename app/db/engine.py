@@ -1,20 +1,151 @@
+import threading
+import time
 from functools import lru_cache
+from typing import Any
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.db.query_stats import install_query_hooks
+
+
+class PoolStats:
+    """커넥션 풀 checkout 대기 시간 통계"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_sec = 0.0
+            self.max_wait_sec = 0.0
+
+    def record(self, wait_sec: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_sec += wait_sec
+            self.max_wait_sec = max(self.max_wait_sec, wait_sec)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_sec / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_sec * 1000, 3),
+            }
+
+
+pool_stats = PoolStats()
+read_pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """checkout 대기 시간을 기록하는 QueuePool"""
+
+    stats = pool_stats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except Exception:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return conn
+
+
+class InstrumentedReadQueuePool(InstrumentedQueuePool):
+    """read replica용 QueuePool (통계 분리)"""
+
+    stats = read_pool_stats
+
+
+def engine_connect_args(settings: Settings) -> dict[str, Any]:
+    """asyncpg connect_args (PgBouncer 모드 반영)"""
+    if not settings.db_pgbouncer_mode:
+        return {}
+    # transaction pooling에서는 서버 측 prepared statement가 다른 backend로 넘어갈 수 있으므로
+    # statement cache를 끄고 prepared statement 이름을 매번 고유하게 생성
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+def _create_engine(url: str, settings: Settings, poolclass: type[InstrumentedQueuePool]) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=poolclass,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_sec,
+        pool_recycle=settings.db_pool_recycle_sec,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=engine_connect_args(settings),
+    )
+    install_query_hooks(engine.sync_engine)
+    return engine
 
 
 @lru_cache(maxsize=1)
 def get_engine() -> AsyncEngine:
     settings = get_settings()
-    return create_async_engine(
-        settings.sqlalchemy_database_url(),
-        pool_pre_ping=True,
-    )
+    return _create_engine(settings.sqlalchemy_database_url(), settings, InstrumentedQueuePool)
+
+
+@lru_cache(maxsize=1)
+def get_read_engine() -> AsyncEngine:
+    """read replica engine (database_read_url 미설정 시 primary engine)"""
+    settings = get_settings()
+    read_url = settings.sqlalchemy_database_read_url()
+    if read_url is None:
+        return get_engine()
+    return _create_engine(read_url, settings, InstrumentedReadQueuePool)
+
+
+def has_read_replica() -> bool:
+    return get_read_engine() is not get_engine()
+
+
+def _pool_status(engine: AsyncEngine, stats: PoolStats) -> dict[str, Any]:
+    settings = get_settings()
+    pool = engine.pool
+    checked_out = pool.checkedout()
+    capacity = settings.db_pool_size + max(settings.db_max_overflow, 0)
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.db_max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": pool.overflow(),
+        "utilization": round(checked_out / capacity, 3) if capacity else 0.0,
+        **stats.snapshot(),
+    }
+
+
+def get_pool_status() -> dict[str, Any]:
+    """풀 사용량 및 대기 시간 통계"""
+    status = _pool_status(get_engine(), pool_stats)
+    if has_read_replica():
+        status["read"] = _pool_status(get_read_engine(), read_pool_stats)
+    return status
 
 
 async def dispose_engine() -> None:
+    if get_read_engine.cache_info().currsize and has_read_replica():
+        await get_read_engine().dispose()
     if get_engine.cache_info().currsize == 0:
         return
     await get_engine().dispose()
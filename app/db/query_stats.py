@@ -0,0 +1,80 @@
+"""요청 단위 SQL 쿼리 수 / DB 시간 측정"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """쿼리 수, 총 DB 시간, 가장 느린 statement"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_sec = 0.0
+        self.slowest_sec = 0.0
+        self.slowest_statement: str | None = None
+
+    def record(self, statement: str, elapsed_sec: float) -> None:
+        self.count += 1
+        self.total_sec += elapsed_sec
+        if elapsed_sec >= self.slowest_sec:
+            self.slowest_sec = elapsed_sec
+            self.slowest_statement = statement
+
+
+# 현재 활성 수집기 목록 (요청 미들웨어와 테스트 헬퍼가 중첩될 수 있으므로 목록으로 관리)
+_collectors: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats_collectors", default=())
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 쿼리를 수집"""
+    stats = QueryStats()
+    token = _collectors.set(_collectors.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """블록 안의 쿼리 수가 max_queries를 넘으면 AssertionError (N+1 회귀 방지용)"""
+    with collect_queries() as stats:
+        yield stats
+    assert stats.count <= max_queries, (
+        f"Expected at most {max_queries} queries, got {stats.count} "
+        f"(slowest {stats.slowest_sec * 1000:.1f}ms: {stats.slowest_statement})"
+    )
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    for stats in _collectors.get():
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context: Any) -> None:
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """engine에 쿼리 측정 이벤트 등록 (AsyncEngine은 sync_engine 전달)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -1,17 +1,38 @@
+from functools import lru_cache
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.engine import get_engine
+from app.db.engine import get_engine, get_read_engine
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database session"""
-    async_session = async_sessionmaker(
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """프로세스 전체에서 공유하는 session factory"""
+    return async_sessionmaker(
         get_engine(),
         class_=AsyncSession,
         expire_on_commit=False,
     )
-    async with async_session() as session:
+
+
+@lru_cache(maxsize=1)
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """read replica session factory (replica 미설정 시 primary)"""
+    return async_sessionmaker(
+        get_read_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database session"""
+    async with get_sessionmaker()() as session:
         yield session
 
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 session (read replica)"""
+    async with get_read_sessionmaker()() as session:
+        yield session
@@ -1,5 +1,5 @@
 from app.integrations.minio_client import get_minio_client, get_presigned_put_url, get_presigned_get_url, ensure_bucket_exists
-from app.integrations.celery_client import get_celery_app, enqueue_skeleton_extraction
+from app.integrations.celery_client import get_celery_app, publish_tasks, revoke_tasks
 
 __all__ = [
     "get_minio_client",
@@ -7,6 +7,7 @@ __all__ = [
     "get_presigned_get_url",
     "ensure_bucket_exists",
     "get_celery_app",
-    "enqueue_skeleton_extraction",
+    "publish_tasks",
+    "revoke_tasks",
 ]
 
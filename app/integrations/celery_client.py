@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Any
 
 from celery import Celery
 
@@ -25,43 +26,36 @@ def get_celery_app() -> Celery:
         task_track_started=True,
         task_time_limit=30 * 60,  # 30 minutes
         task_soft_time_limit=25 * 60,  # 25 minutes
+        # 워커 설정과 같게 유지 (큐 사이 round robin, 큐 안에서는 message priority 적용)
+        broker_transport_options={"queue_order_strategy": "round_robin"},
     )
 
     return celery_app
 
 
-def enqueue_skeleton_extraction(
-    source_id: int,
-    video_object_key: str,
-    project_id: int,
-    track_slot: int,
-) -> str:
-    """스켈레톤 추출 작업을 Celery에 enqueue
-    
+def publish_tasks(tasks: list[tuple[str, str, dict, dict[str, Any]]]) -> list[Exception | None]:
+    """여러 task를 하나의 broker 연결/producer로 이름 기반 발행
+
     Args:
-        source_id: SkeletonSource ID
-        video_object_key: MinIO에 저장된 비디오 object key
-        project_id: 프로젝트 ID
-        track_slot: 트랙 슬롯 (1-3)
-    
+        tasks: (task_name, task_id, kwargs, options) 목록 - options는 send_task 옵션 (queue, priority 등)
+
     Returns:
-        Celery task ID
+        task별 발행 오류 (성공 시 None)
     """
     celery_app = get_celery_app()
-
-    # worker/tasks/extract_skeleton.py의 task를 동적 import
-    # 이렇게 하면 API 서버에서 worker 모듈을 import할 때
-    # worker/celery_app.py가 로드되지 않아 nest_asyncio 충돌 방지
-    import importlib
-    extract_skeleton_module = importlib.import_module("worker.tasks.extract_skeleton")
-    extract_skeleton_task = extract_skeleton_module.extract_skeleton_task
-
-    task = extract_skeleton_task.delay(
-        source_id=source_id,
-        video_object_key=video_object_key,
-        project_id=project_id,
-        track_slot=track_slot,
-    )
-
-    return task.id
-
+    errors: list[Exception | None] = []
+    with celery_app.producer_or_acquire() as producer:
+        for task_name, task_id, kwargs, options in tasks:
+            try:
+                celery_app.send_task(task_name, kwargs=kwargs, task_id=task_id, producer=producer, **options)
+                errors.append(None)
+            except Exception as exc:  # noqa: BLE001
+                errors.append(exc)
+    return errors
+
+
+def revoke_tasks(task_ids: list[str]) -> None:
+    """아직 시작되지 않은 task 취소 (워커가 받으면 실행하지 않고 버림)"""
+    if not task_ids:
+        return
+    get_celery_app().control.revoke(task_ids)
@@ -0,0 +1,59 @@
+"""저장 객체 압축 (HTTP Content-Encoding) 인코딩 / 디코딩
+
+객체를 Content-Encoding 헤더와 함께 저장하면 presigned GET 응답에 같은 헤더가 붙어
+브라우저가 압축을 투명하게 해제합니다. API와 워커 양쪽에서 import되며,
+zstd는 선택 의존성(zstandard)이므로 사용할 때만 import합니다.
+"""
+
+import gzip
+
+IDENTITY = "identity"
+GZIP = "gzip"
+ZSTD = "zstd"
+CONTENT_ENCODINGS = (IDENTITY, GZIP, ZSTD)
+
+_DEFAULT_LEVELS = {GZIP: 6, ZSTD: 10}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError("zstd content encoding requires the zstandard package") from exc
+    return zstandard
+
+
+def normalize_encoding(encoding: str | None) -> str:
+    """Content-Encoding 값 정규화 (없으면 identity)"""
+    value = (encoding or IDENTITY).strip().lower()
+    if value not in CONTENT_ENCODINGS:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    return value
+
+
+def encode_content(payload: bytes, encoding: str | None, level: int | None = None) -> bytes:
+    """payload 압축 (level이 없거나 0이면 codec 기본값)"""
+    encoding = normalize_encoding(encoding)
+    if encoding == IDENTITY:
+        return payload
+    level = level or _DEFAULT_LEVELS[encoding]
+    if encoding == GZIP:
+        # mtime=0: 같은 입력이면 같은 바이트 (ETag 안정)
+        return gzip.compress(payload, compresslevel=level, mtime=0)
+    return _zstandard().ZstdCompressor(level=level).compress(payload)
+
+
+def decode_content(data: bytes, encoding: str | None) -> bytes:
+    """encode_content의 역변환"""
+    encoding = normalize_encoding(encoding)
+    if encoding == IDENTITY:
+        return data
+    if encoding == GZIP:
+        return gzip.decompress(data)
+    return _zstandard().ZstdDecompressor().decompress(data)
+
+
+def content_encoding_headers(encoding: str | None) -> dict[str, str]:
+    """put_object metadata로 전달할 헤더 (identity면 빈 dict)"""
+    encoding = normalize_encoding(encoding)
+    return {} if encoding == IDENTITY else {"Content-Encoding": encoding}
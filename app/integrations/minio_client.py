@@ -78,8 +78,9 @@ def get_presigned_put_url(
 def get_presigned_get_url(
     object_key: str,
     expires: timedelta = timedelta(hours=1),
+    response_headers: dict[str, str] | None = None,
 ) -> str:
-    """Presigned GET URL 발급 (다운로드용)"""
+    """Presigned GET URL 발급 (다운로드용, response_headers로 응답 헤더 override)"""
     settings = get_settings()
     bucket = settings.minio_bucket
     if not bucket:
@@ -92,6 +93,7 @@ def get_presigned_get_url(
             bucket_name=bucket,
             object_name=object_key,
             expires=expires,
+            response_headers=response_headers,
         )
         return url
     except S3Error as e:
@@ -0,0 +1,41 @@
+"""프레임 chunk / LOD 레벨 스켈레톤 저장 레이아웃 (API와 워커가 공유)
+
+워커는 추출 결과를 고정 길이(chunk_frames) chunk로 나눠 `{prefix}chunks/{index:05d}.kpd`에,
+chunk 목록을 `{prefix}index.json`에 저장합니다. chunk i는 프레임 [i * chunk_frames, (i + 1) * chunk_frames)를
+담으므로 API는 index를 읽지 않고 DB의 fps / num_frames / chunk_frames만으로 필요한 chunk를 계산합니다.
+chunk 본문은 worker/pipelines/keypoint_codec.py 형식(kpd1)이며 Content-Encoding으로 압축되어 저장됩니다.
+LOD 레벨은 `{prefix}lod/x{factor}.kpl`(worker/pipelines/skeleton_lod.py 형식)에 저장되며 skeleton_source_levels가 참조합니다.
+"""
+
+import math
+
+SKELETON_CHUNK_FORMAT = "kpd1"
+
+
+def chunk_prefix(project_id: int, track_slot: int, source_id: int) -> str:
+    return f"skeleton/{project_id}/track_{track_slot}/{source_id}/"
+
+
+def chunk_object_key(prefix: str, index: int) -> str:
+    return f"{prefix}chunks/{index:05d}.kpd"
+
+
+def chunk_index_key(prefix: str) -> str:
+    return f"{prefix}index.json"
+
+
+def lod_object_key(prefix: str, factor: int) -> str:
+    return f"{prefix}lod/x{factor}.kpl"
+
+
+def frames_per_chunk(fps: float, chunk_sec: float) -> int:
+    return max(1, round(fps * chunk_sec))
+
+
+def overlapping_chunks(num_frames: int, chunk_frames: int, start_frame: int, end_frame: int) -> range:
+    """프레임 [start_frame, end_frame)과 겹치는 chunk 번호"""
+    start_frame = max(start_frame, 0)
+    end_frame = min(end_frame, num_frames)
+    if end_frame <= start_frame:
+        return range(0)
+    return range(start_frame // chunk_frames, math.ceil(end_frame / chunk_frames))
@@ -0,0 +1,77 @@
+"""API와 워커가 공유하는 Celery task 이름 / 인자 계약
+
+API는 task 이름으로 send_task만 하므로 worker 모듈(및 cv2, mediapipe 등)을 import하지 않습니다.
+이 모듈은 API와 워커 양쪽에서 import되므로 무거운 의존성을 추가하지 마세요.
+"""
+
+from typing import TypedDict
+
+# 추출은 download(I/O) -> infer(CPU) -> finalize(I/O) 3단계 chain으로 실행됨
+# API는 첫 단계만 발행하고, 첫 단계가 나머지 chain을 발행함
+EXTRACT_SKELETON_TASK = "extract_skeleton"
+EXTRACT_SKELETON_INFER_TASK = "extract_skeleton.infer"
+EXTRACT_SKELETON_FINALIZE_TASK = "extract_skeleton.finalize"
+
+# download/finalize 단계 큐 (threads 풀 워커)
+EXTRACT_QUEUE_IO = "extract.io"
+
+# 추론 단계 영상 길이별 큐 (prefork 풀 워커, 짧은 작업이 긴 작업 뒤에서 기다리지 않도록 분리)
+EXTRACT_QUEUE_SHORT = "extract.short"
+EXTRACT_QUEUE_MEDIUM = "extract.medium"
+EXTRACT_QUEUE_LONG = "extract.long"
+EXTRACT_QUEUES = (EXTRACT_QUEUE_SHORT, EXTRACT_QUEUE_MEDIUM, EXTRACT_QUEUE_LONG)
+
+# 워커 beat가 주기적으로 실행하는 저장소 GC (API는 발행하지 않음)
+STORAGE_GC_TASK = "storage.gc"
+
+# 기존 스켈레톤 객체를 현재 설정의 Content-Encoding으로 재압축 (1회성, 수동 발행)
+SKELETON_RECOMPRESS_TASK = "skeleton.recompress"
+
+# Redis broker priority (0이 가장 먼저 소비됨, kombu 기본 priority_steps 0/3/6/9)
+TASK_PRIORITY_STEPS = (0, 3, 6, 9)
+
+
+class _ExtractSkeletonRouting(TypedDict, total=False):
+    infer_queue: str  # 추론 단계 큐 (없으면 extract.medium)
+    infer_priority: int
+
+
+class ExtractSkeletonKwargs(_ExtractSkeletonRouting):
+    """extract_skeleton task 인자"""
+
+    source_id: int
+    video_object_key: str
+    project_id: int
+    track_slot: int
+
+
+def extract_skeleton_queue(duration_sec: float | None, short_max_sec: float, medium_max_sec: float) -> str:
+    """영상 길이로 추출 큐 선택 (길이를 모르면 medium)"""
+    if duration_sec is None:
+        return EXTRACT_QUEUE_MEDIUM
+    if duration_sec <= short_max_sec:
+        return EXTRACT_QUEUE_SHORT
+    if duration_sec <= medium_max_sec:
+        return EXTRACT_QUEUE_MEDIUM
+    return EXTRACT_QUEUE_LONG
+
+
+def extract_skeleton_kwargs(
+    source_id: int,
+    video_object_key: str,
+    project_id: int,
+    track_slot: int,
+    infer_queue: str | None = None,
+    infer_priority: int | None = None,
+) -> ExtractSkeletonKwargs:
+    kwargs = ExtractSkeletonKwargs(
+        source_id=source_id,
+        video_object_key=video_object_key,
+        project_id=project_id,
+        track_slot=track_slot,
+    )
+    if infer_queue is not None:
+        kwargs["infer_queue"] = infer_queue
+    if infer_priority is not None:
+        kwargs["infer_priority"] = infer_priority
+    return kwargs
@@ -1,9 +1,13 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.api.middleware import query_stats_middleware, sticky_primary_middleware
 from app.api.router import api_router
+from app.core.config import get_settings
 from app.db.engine import dispose_engine
+from app.services.outbox_service import OutboxService
 
 
 tags_metadata = [
@@ -17,7 +21,14 @@ tags_metadata = [
 def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(_: FastAPI):
+        stop_event = asyncio.Event()
+        dispatcher = None
+        if get_settings().outbox_dispatch_in_api:
+            dispatcher = asyncio.create_task(OutboxService.run_dispatcher(stop_event))
         yield
+        stop_event.set()
+        if dispatcher is not None:
+            await dispatcher
         await dispose_engine()
 
     app = FastAPI(
@@ -30,6 +41,8 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",
         lifespan=lifespan,
     )
+    app.middleware("http")(sticky_primary_middleware)
+    app.middleware("http")(query_stats_middleware)
     app.include_router(api_router)
     return app
 
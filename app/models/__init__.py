@@ -1,19 +1,29 @@
-from app.models.enums import AssetStatus, InterpType
+from app.models.enums import AssetStatus, InterpType, JobStatus, OutboxStatus
 from app.models.project import Project
 from app.models.track import Track
 from app.models.skeleton_source import SkeletonSource
+from app.models.skeleton_source_level import SkeletonSourceLevel
 from app.models.skeleton_layer import SkeletonLayer
 from app.models.keyframe import TrackPositionKeyframe
 from app.models.video import Video
+from app.models.outbox import OutboxJob
+from app.models.job import Job
+from app.models.media_object import MediaObject
 
 __all__ = [
     "AssetStatus",
     "InterpType",
+    "JobStatus",
+    "OutboxStatus",
     "Project",
     "Track",
     "SkeletonSource",
+    "SkeletonSourceLevel",
     "SkeletonLayer",
     "TrackPositionKeyframe",
     "Video",
+    "OutboxJob",
+    "Job",
+    "MediaObject",
 ]
 
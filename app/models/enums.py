@@ -16,3 +16,23 @@ class InterpType(str, enum.Enum):
     STEP = "STEP"
     LINEAR = "LINEAR"
 
+
+class OutboxStatus(str, enum.Enum):
+    """outbox 작업 상태"""
+
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class JobStatus(str, enum.Enum):
+    """비동기 작업 상태"""
+
+    PENDING = "PENDING"  # outbox에 기록됨 (아직 broker로 발행 전)
+    QUEUED = "QUEUED"
+    STARTED = "STARTED"
+    RETRYING = "RETRYING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    REVOKED = "REVOKED"  # 시작 전 취소
+    CANCELLED = "CANCELLED"  # 실행 중 취소 요청을 워커가 확인하고 중단
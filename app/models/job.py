@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+from app.models.enums import JobStatus
+
+
+class Job(Base):
+    """SkeletonSource별 Celery 작업 추적 정보"""
+
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    skeleton_source_id: Mapped[int] = mapped_column(ForeignKey("skeleton_sources.id", ondelete="CASCADE"), nullable=False)
+    task_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    task_id: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    queue: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    status: Mapped[JobStatus] = mapped_column(default=JobStatus.PENDING)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    worker_hostname: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    queued_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    # 실행 중인 작업의 취소 요청 시각 (워커가 프레임 루프에서 주기적으로 확인)
+    cancel_requested_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    # Relationships
+    source: Mapped["SkeletonSource"] = relationship("SkeletonSource", back_populates="jobs")
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_jobs_source", "skeleton_source_id"),
+        Index("idx_jobs_started_at", "started_at"),
+    )
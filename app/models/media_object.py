@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class MediaObject(Base):
+    """content-addressed 미디어 객체 (같은 내용은 한 번만 저장, 참조 수로 수명 관리)"""
+
+    __tablename__ = "media_objects"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    object_key: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)  # media/sha256/ab/cdef...
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    released_at: Mapped[datetime | None] = mapped_column(nullable=True)  # ref_count가 0이 된 시각
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_media_objects_unreferenced", "released_at", postgresql_where=text("ref_count = 0")),
+    )
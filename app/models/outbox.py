@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import OutboxStatus
+
+
+class OutboxJob(Base):
+    """Celery로 발행할 작업 (도메인 변경과 같은 트랜잭션에 기록)"""
+
+    __tablename__ = "outbox_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    task_id: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)  # 발행 시 Celery task id로 사용
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[OutboxStatus] = mapped_column(default=OutboxStatus.PENDING)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    sent_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(nullable=True)  # 발행 실패 후 다음 재시도 시각 (backoff)
+    queue: Mapped[str | None] = mapped_column(String(64), nullable=True)  # None이면 기본 큐
+    priority: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_outbox_jobs_pending", "id", postgresql_where=text("status = 'PENDING'")),
+        Index("idx_outbox_jobs_sent_at", "sent_at", postgresql_where=text("status = 'SENT'")),
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Numeric, String
+from sqlalchemy import Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -15,6 +15,7 @@ class Project(Base):
     music_object_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
     music_duration_sec: Mapped[Decimal | None] = mapped_column(Numeric(10, 3), nullable=True)
     music_bpm: Mapped[Decimal | None] = mapped_column(Numeric(6, 2), nullable=True)
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # 프로젝트 편집 시 증가
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow)
 
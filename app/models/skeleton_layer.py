@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy import Computed, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import NUMRANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -18,6 +19,12 @@ class SkeletonLayer(Base):
     priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     label: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    # [start_sec, end_sec) 범위 (DB generated column, 시간 구간 겹침 질의용)
+    time_range: Mapped[Range[Decimal]] = mapped_column(
+        NUMRANGE,
+        Computed("numrange(start_sec, end_sec, '[)')", persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     track: Mapped["Track"] = relationship("Track", back_populates="layers")
@@ -27,5 +34,6 @@ class SkeletonLayer(Base):
     __table_args__ = (
         Index("idx_skeleton_layers_track_start", "track_id", "start_sec"),
         Index("idx_skeleton_layers_track_priority", "track_id", "priority"),
+        Index("idx_skeleton_layers_track_time_range", "track_id", "time_range", postgresql_using="gist"),
     )
 
@@ -13,6 +13,10 @@ class SkeletonSource(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     track_id: Mapped[int] = mapped_column(ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False)
     object_key: Mapped[str | None] = mapped_column(String(512), nullable=True)  # MinIO key (READY일 때 유효)
+    video_object_key: Mapped[str | None] = mapped_column(String(512), nullable=True)  # 원본 영상 (media_objects 참조)
+    content_encoding: Mapped[str | None] = mapped_column(String(16), nullable=True)  # object_key의 Content-Encoding (NULL이면 비압축)
+    chunk_prefix: Mapped[str | None] = mapped_column(String(512), nullable=True)  # 프레임 chunk 저장 위치 (NULL이면 chunk 없음)
+    chunk_frames: Mapped[int | None] = mapped_column(Integer, nullable=True)  # chunk당 프레임 수
     fps: Mapped[float | None] = mapped_column(nullable=True)
     num_frames: Mapped[int | None] = mapped_column(Integer, nullable=True)
     num_joints: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -24,4 +28,11 @@ class SkeletonSource(Base):
     # Relationships
     track: Mapped["Track"] = relationship("Track", back_populates="sources")
     layers: Mapped[list["SkeletonLayer"]] = relationship("SkeletonLayer", back_populates="source")
+    jobs: Mapped[list["Job"]] = relationship("Job", back_populates="source", cascade="all, delete-orphan")
+    levels: Mapped[list["SkeletonSourceLevel"]] = relationship(
+        "SkeletonSourceLevel",
+        back_populates="source",
+        cascade="all, delete-orphan",
+        order_by="SkeletonSourceLevel.factor",
+    )
 
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class SkeletonSourceLevel(Base):
+    """스켈레톤 소스의 다운샘플 LOD 레벨 (타임라인 미리보기용, 약 1/factor 프레임)"""
+
+    __tablename__ = "skeleton_source_levels"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    skeleton_source_id: Mapped[int] = mapped_column(
+        ForeignKey("skeleton_sources.id", ondelete="CASCADE"), nullable=False
+    )
+    factor: Mapped[int] = mapped_column(Integer, nullable=False)  # 프레임 간격 배수 (4면 약 1/4 프레임)
+    object_key: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    num_frames: Mapped[int] = mapped_column(Integer, nullable=False)  # 레벨에 포함된 프레임 수
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_encoding: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+
+    # Relationships
+    source: Mapped["SkeletonSource"] = relationship("SkeletonSource", back_populates="levels")
+
+    __table_args__ = (UniqueConstraint("skeleton_source_id", "factor", name="uq_skeleton_source_levels_factor"),)
@@ -13,6 +13,8 @@ class Track(Base):
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     slot: Mapped[int] = mapped_column(Integer, nullable=False)  # 1~3
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # 키프레임 편집 시 증가 (ETag)
+    layers_revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # 레이어 편집 시 증가
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
     # Relationships
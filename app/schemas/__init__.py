@@ -1,9 +1,20 @@
 from app.schemas.common import CursorResponse, ErrorResponse
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
 from app.schemas.music import MusicUploadRequest, MusicUploadResponse
-from app.schemas.layer import LayerUploadRequest, LayerUploadResponse, LayerResponse, LayerUpdate
+from app.schemas.layer import (
+    LayerUploadRequest,
+    LayerUploadResponse,
+    LayerResponse,
+    LayerUpdate,
+    LayerBatchUpdateItem,
+    LayerBatchRequest,
+    LayerBatchResponse,
+)
 from app.schemas.asset import AssetPresignRequest, AssetPresignResponse, AssetPresignBatchRequest
 from app.schemas.keyframe import KeyframeUpsert, KeyframeResponse
+from app.schemas.timeline import TimelineSegment, TimelineResponse
+from app.schemas.job import JobResponse
+from app.schemas.source import SourceFrameChunk, SourceFramesResponse
 
 __all__ = [
     "ErrorResponse",
@@ -17,10 +28,18 @@ __all__ = [
     "LayerUploadResponse",
     "LayerResponse",
     "LayerUpdate",
+    "LayerBatchUpdateItem",
+    "LayerBatchRequest",
+    "LayerBatchResponse",
     "AssetPresignRequest",
     "AssetPresignResponse",
     "AssetPresignBatchRequest",
     "KeyframeUpsert",
     "KeyframeResponse",
+    "TimelineSegment",
+    "TimelineResponse",
+    "JobResponse",
+    "SourceFrameChunk",
+    "SourceFramesResponse",
 ]
 
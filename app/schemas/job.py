@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.models.enums import JobStatus
+
+
+class JobResponse(BaseModel):
+    """비동기 작업 상태 응답"""
+
+    id: int
+    skeleton_source_id: int
+    task_name: str
+    task_id: str
+    queue: str | None = None
+    status: JobStatus
+    attempts: int
+    worker_hostname: str | None = None
+    error_message: str | None = None
+    created_at: datetime
+    queued_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    cancel_requested_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
@@ -33,3 +33,25 @@ class KeyframeItem(BaseModel):
     y: Decimal
     interp: InterpType = Field(default=InterpType.LINEAR)
 
+
+
+class KeyframeSampleResponse(BaseModel):
+    """트랙 위치 샘플링 응답 (t_i = from_sec + i / fps)"""
+
+    track_id: int
+    revision: int
+    fps: float
+    from_sec: float
+    num_samples: int
+    x: list[float]
+    y: list[float]
+
+
+class ProjectKeyframeSampleResponse(BaseModel):
+    """프로젝트 전체 트랙 위치 샘플링 응답"""
+
+    project_id: int
+    fps: float
+    from_sec: float
+    num_samples: int
+    tracks: list[KeyframeSampleResponse]
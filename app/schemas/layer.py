@@ -33,6 +33,11 @@ class LayerUploadResponse(BaseModel):
     source_num_joints: int | None = None
     source_error_message: str | None = None
 
+    # 추출 작업 정보
+    job_id: int | None = None
+    queue_position: int | None = None  # 같은 추론 큐에서 앞선 대기 작업 수 + 1
+    estimated_wait_sec: int | None = None  # 추론 시작까지 예상 대기 시간
+
 
 class LayerUpdate(BaseModel):
     """레이어 업데이트 요청"""
@@ -65,3 +70,25 @@ class LayerResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+
+class LayerBatchUpdateItem(LayerUpdate):
+    """레이어 일괄 업데이트 항목"""
+
+    id: int
+
+
+class LayerBatchRequest(BaseModel):
+    """레이어 일괄 업데이트/삭제 요청 (한 트랜잭션으로 적용)"""
+
+    updates: list[LayerBatchUpdateItem] = Field(default_factory=list, max_length=500)
+    deletes: list[int] = Field(default_factory=list, max_length=500)
+
+
+class LayerBatchResponse(BaseModel):
+    """레이어 일괄 업데이트/삭제 응답"""
+
+    project_revision: int
+    layers: list[LayerResponse]  # 업데이트된 레이어
+    deleted_ids: list[int]
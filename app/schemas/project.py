@@ -4,6 +4,7 @@ from decimal import Decimal
 from pydantic import BaseModel, Field
 
 from app.schemas.keyframe import KeyframeResponse
+from app.schemas.timeline import TimelineSegment
 
 
 class ProjectCreate(BaseModel):
@@ -26,6 +27,7 @@ class ProjectResponse(BaseModel):
     music_object_key: str | None = None
     music_duration_sec: Decimal | None = None
     music_bpm: Decimal | None = None
+    revision: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -47,6 +49,10 @@ class LayerEditState(BaseModel):
     source_fps: float | None = None
     source_num_frames: int | None = None
     source_num_joints: int | None = None
+    # lod 요청 시에만 채워짐 (요청 factor 이하 중 가장 거친 LOD 레벨, 없으면 전체 프레임 object 사용)
+    source_lod_factor: int | None = None
+    source_lod_object_key: str | None = None
+    source_lod_num_frames: int | None = None
 
 
 class TrackEditState(BaseModel):
@@ -55,8 +61,10 @@ class TrackEditState(BaseModel):
     id: int
     slot: int
     display_name: str | None = None
+    revision: int = 0  # 키프레임 PUT의 If-Match 값으로 사용
     layers: list[LayerEditState]
     keyframes: list[KeyframeResponse]
+    timeline: list[TimelineSegment] | None = None  # include_timeline=true 일 때만 채워짐
 
 
 class EditStateResponse(BaseModel):
@@ -65,3 +73,7 @@ class EditStateResponse(BaseModel):
     project: ProjectResponse
     tracks: list[TrackEditState]
 
+    # include_urls=true 일 때만 채워짐
+    urls: dict[str, str] | None = None  # object_key -> presigned GET URL
+    urls_expires_in: int | None = None
+
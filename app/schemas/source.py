@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+
+class SourceFrameChunk(BaseModel):
+    """프레임 chunk (프레임 [start_frame, end_frame), kpd1 형식, Content-Encoding으로 압축됨)"""
+
+    index: int
+    start_frame: int
+    end_frame: int
+    start_sec: float
+    end_sec: float
+    url: str  # presigned GET URL
+
+
+class SourceFramesResponse(BaseModel):
+    """스켈레톤 소스의 구간 조회 응답 (요청 구간과 겹치는 chunk만 포함)"""
+
+    source_id: int
+    format: str
+    fps: float
+    num_frames: int
+    num_joints: int | None = None
+    chunk_frames: int
+    chunks: list[SourceFrameChunk]
+    expires_in: int  # URL 중 가장 짧은 남은 유효 시간(초)
@@ -0,0 +1,19 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class TimelineSegment(BaseModel):
+    """활성 레이어 구간 ([start_sec, end_sec) 동안 layer_id가 활성)"""
+
+    start_sec: Decimal
+    end_sec: Decimal
+    layer_id: int
+
+
+class TimelineResponse(BaseModel):
+    """트랙 활성 레이어 타임라인 응답"""
+
+    track_id: int
+    revision: int  # 트랙 layers_revision
+    segments: list[TimelineSegment]
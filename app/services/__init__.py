@@ -3,6 +3,12 @@ from app.services.music_service import MusicService
 from app.services.layers_service import LayersService
 from app.services.assets_service import AssetsService
 from app.services.keyframes_service import KeyframesService
+from app.services.timeline_service import TimelineService
+from app.services.outbox_service import OutboxService
+from app.services.jobs_service import JobsService
+from app.services.media_service import MediaService
+from app.services.storage_gc_service import StorageGcService
+from app.services.sources_service import SourcesService
 
 __all__ = [
     "ProjectsService",
@@ -10,5 +16,11 @@ __all__ = [
     "LayersService",
     "AssetsService",
     "KeyframesService",
+    "TimelineService",
+    "OutboxService",
+    "JobsService",
+    "MediaService",
+    "StorageGcService",
+    "SourcesService",
 ]
 
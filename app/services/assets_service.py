@@ -1,25 +1,127 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
+from app.core.config import get_settings
 from app.integrations.minio_client import get_presigned_get_url
+from app.services.media_service import is_content_addressed
+
+# 병렬 서명을 시작하는 최소 키 개수 (그 이하는 순차 서명이 더 빠름)
+_PARALLEL_SIGN_THRESHOLD = 8
+
+
+class _PresignedUrlCache:
+    """object_key별 presigned GET URL 캐시
+
+    URL은 만료 시각까지 유효하므로, 만료 safety margin 전까지는 재서명 없이 재사용한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, int], tuple[str, float]] = {}  # (key, expires_sec) -> (url, expires_at)
+
+    def get(self, object_key: str, expires_sec: int, margin_sec: int) -> tuple[str, float] | None:
+        with self._lock:
+            entry = self._entries.get((object_key, expires_sec))
+        if entry is None:
+            return None
+        if entry[1] - time.time() <= margin_sec:
+            return None
+        return entry
+
+    def put(self, object_key: str, expires_sec: int, url: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[(object_key, expires_sec)] = (url, expires_at)
+
+    def prune(self, margin_sec: int) -> None:
+        """재사용할 수 없는 항목 제거"""
+        now = time.time()
+        with self._lock:
+            stale = [k for k, (_, expires_at) in self._entries.items() if expires_at - now <= margin_sec]
+            for k in stale:
+                del self._entries[k]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_url_cache = _PresignedUrlCache()
 
 
 class AssetsService:
+    @staticmethod
+    def _sign(object_key: str, expires_sec: int) -> tuple[str, float]:
+        """캐시를 거치지 않고 서명 후 캐시에 저장
+
+        content-addressed 객체는 내용이 바뀌지 않으므로 URL 유효 시간 동안 브라우저 캐시를 허용합니다.
+        """
+        expires_at = time.time() + expires_sec
+        response_headers = None
+        if is_content_addressed(object_key):
+            response_headers = {"response-cache-control": f"private, max-age={expires_sec}, immutable"}
+        url = get_presigned_get_url(
+            object_key=object_key,
+            expires=timedelta(seconds=expires_sec),
+            response_headers=response_headers,
+        )
+        _url_cache.put(object_key, expires_sec, url, expires_at)
+        return url, expires_at
+
+    @staticmethod
+    def get_presigned_urls_with_expiry(
+        object_keys: list[str],
+        expires_sec: int | None = None,
+    ) -> tuple[dict[str, str], int]:
+        """Presigned GET URL 일괄 발급 (캐시 사용)
+
+        Returns:
+            (object_key -> url, 반환된 URL 중 가장 짧은 남은 유효 시간(초)) 튜플
+        """
+        settings = get_settings()
+        expires = expires_sec or settings.presign_expires_sec
+        margin = min(settings.presign_cache_margin_sec, expires // 2)
+
+        urls: dict[str, str] = {}
+        expiries: list[float] = []
+        missing: list[str] = []
+        for key in dict.fromkeys(object_keys):
+            cached = _url_cache.get(key, expires, margin)
+            if cached is None:
+                missing.append(key)
+                continue
+            urls[key], expires_at = cached
+            expiries.append(expires_at)
+
+        if missing:
+            _url_cache.prune(margin)
+            if len(missing) >= _PARALLEL_SIGN_THRESHOLD and settings.presign_batch_workers > 1:
+                with ThreadPoolExecutor(max_workers=settings.presign_batch_workers) as executor:
+                    signed = list(executor.map(lambda k: AssetsService._sign(k, expires), missing))
+            else:
+                signed = [AssetsService._sign(k, expires) for k in missing]
+            for key, (url, expires_at) in zip(missing, signed):
+                urls[key] = url
+                expiries.append(expires_at)
+
+        expires_in = int(min(expiries) - time.time()) if expiries else expires
+        return urls, max(expires_in, 0)
+
     @staticmethod
     def get_presigned_url(object_key: str, expires_hours: int = 1) -> str:
         """Presigned GET URL 발급"""
-        return get_presigned_get_url(
-            object_key=object_key,
-            expires=timedelta(hours=expires_hours),
+        urls, _ = AssetsService.get_presigned_urls_with_expiry(
+            [object_key],
+            expires_sec=int(timedelta(hours=expires_hours).total_seconds()),
         )
+        return urls[object_key]
 
     @staticmethod
     def get_presigned_urls_batch(object_keys: list[str], expires_hours: int = 1) -> dict[str, str]:
         """Presigned GET URL 일괄 발급"""
-        urls = {}
-        for key in object_keys:
-            urls[key] = get_presigned_get_url(
-                object_key=key,
-                expires=timedelta(hours=expires_hours),
-            )
+        urls, _ = AssetsService.get_presigned_urls_with_expiry(
+            object_keys,
+            expires_sec=int(timedelta(hours=expires_hours).total_seconds()),
+        )
         return urls
-
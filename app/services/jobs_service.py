@@ -0,0 +1,266 @@
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import NotFoundError
+from app.integrations.task_contracts import TASK_PRIORITY_STEPS
+from app.models import AssetStatus, Job, JobStatus, OutboxJob, OutboxStatus, Project, SkeletonSource, Track
+from app.schemas.job import JobResponse
+
+_ACTIVE_STATUSES = (JobStatus.PENDING, JobStatus.QUEUED, JobStatus.STARTED, JobStatus.RETRYING)
+_WAITING_STATUSES = (JobStatus.PENDING, JobStatus.QUEUED, JobStatus.RETRYING)
+
+
+class QueueBacklog(NamedTuple):
+    """큐별 적체 현황"""
+
+    queue: str
+    waiting: int  # 추론 시작 전 (outbox, download 단계, 재시도 대기 포함)
+    running: int  # 추론 중
+    avg_duration_sec: float  # 최근 완료 작업의 평균 추론 소요 시간
+
+
+class QueueWaitStats(NamedTuple):
+    """큐별 대기 시간 (queued_at -> started_at, 초)"""
+
+    queue: str
+    started: int
+    p50_sec: float
+    p95_sec: float
+    max_sec: float
+
+
+class JobsService:
+    @staticmethod
+    def add_job(db: AsyncSession, source_id: int, outbox_job: OutboxJob, queue: str | None = None) -> Job:
+        """outbox 작업에 대응하는 Job 기록 (같은 task_id 사용)
+
+        queue는 대기 시간 집계에 쓰는 추론 단계 큐이며, 없으면 outbox 발행 큐를 기록합니다.
+        """
+        job = Job(
+            skeleton_source_id=source_id,
+            task_name=outbox_job.task_name,
+            task_id=outbox_job.task_id,
+            queue=queue or outbox_job.queue,
+            status=JobStatus.PENDING,
+            attempts=0,
+            created_at=datetime.utcnow(),
+        )
+        db.add(job)
+        return job
+
+    @staticmethod
+    async def fairness_priority(db: AsyncSession, project_id: int) -> int:
+        """프로젝트의 진행 중 작업 수에 따른 새 작업 priority
+
+        진행 중 작업이 없으면 가장 높은 priority(0)를 받고, 많을수록 낮아지므로
+        한 프로젝트가 대량으로 올려도 다른 프로젝트의 작업이 먼저 소비됩니다.
+        """
+        result = await db.execute(
+            select(func.count(Job.id))
+            .join(SkeletonSource, SkeletonSource.id == Job.skeleton_source_id)
+            .join(Track, Track.id == SkeletonSource.track_id)
+            .where(Track.project_id == project_id, Job.status.in_(_ACTIVE_STATUSES))
+        )
+        active = result.scalar_one()
+        return TASK_PRIORITY_STEPS[min(active, len(TASK_PRIORITY_STEPS) - 1)]
+
+    @staticmethod
+    async def queue_backlog(db: AsyncSession, window_sec: int, default_duration_sec: float) -> list[QueueBacklog]:
+        """큐별 대기/실행 중 작업 수와 최근 평균 소요 시간
+
+        broker 큐 길이 대신 jobs 테이블을 사용하므로 outbox에 남은 작업과
+        download 단계에 있는 작업까지 추론 대기로 집계됩니다.
+        """
+        counts = await db.execute(
+            select(
+                Job.queue,
+                func.count(case((Job.status.in_(_WAITING_STATUSES), Job.id))),
+                func.count(case((Job.status == JobStatus.STARTED, Job.id))),
+            )
+            .where(Job.status.in_(_ACTIVE_STATUSES))
+            .group_by(Job.queue)
+        )
+        durations = await db.execute(
+            select(Job.queue, func.avg(func.extract("epoch", Job.finished_at - Job.started_at)))
+            .where(
+                Job.status == JobStatus.SUCCEEDED,
+                Job.finished_at >= datetime.utcnow() - timedelta(seconds=window_sec),
+                Job.started_at.is_not(None),
+            )
+            .group_by(Job.queue)
+        )
+        avg_by_queue = {queue: float(avg) for queue, avg in durations.all() if avg is not None}
+
+        return [
+            QueueBacklog(
+                queue or "celery",
+                waiting,
+                running,
+                avg_by_queue.get(queue, default_duration_sec),
+            )
+            for queue, waiting, running in counts.all()
+        ]
+
+    @staticmethod
+    def estimate_drain_sec(backlog: list[QueueBacklog], queue: str | None = None) -> float:
+        """현재 적체를 모두 처리하는 데 걸리는 예상 시간 (queue 지정 시 그 큐의 대기 작업만)
+
+        큐에 작업이 쌓여 있으면 워커는 포화 상태이므로 실행 중 작업 수를 워커 슬롯 수로 간주합니다.
+        """
+        slots = max(sum(row.running for row in backlog), 1)
+        if queue is not None:
+            work = sum(row.waiting * row.avg_duration_sec for row in backlog if row.queue == queue)
+        else:
+            work = sum((row.waiting + row.running) * row.avg_duration_sec for row in backlog)
+        return work / slots
+
+    @staticmethod
+    async def queue_wait_stats(db: AsyncSession, window_sec: int) -> list[QueueWaitStats]:
+        """최근 window_sec 동안 시작된 첫 시도 작업의 큐별 대기 시간 분포
+
+        started_at은 추론 단계 시작 시각이므로 대기 시간에는 download 단계가 포함됩니다.
+        """
+        wait = func.extract("epoch", Job.started_at - Job.queued_at)
+        result = await db.execute(
+            select(
+                Job.queue,
+                func.count(Job.id),
+                func.percentile_cont(0.5).within_group(wait),
+                func.percentile_cont(0.95).within_group(wait),
+                func.max(wait),
+            )
+            .where(
+                Job.started_at >= datetime.utcnow() - timedelta(seconds=window_sec),
+                Job.queued_at.is_not(None),
+                Job.attempts == 1,
+            )
+            .group_by(Job.queue)
+        )
+        return [
+            QueueWaitStats(queue or "celery", count, float(p50), float(p95), float(max_wait))
+            for queue, count, p50, p95, max_wait in result.all()
+        ]
+
+    @staticmethod
+    async def mark_queued(db: AsyncSession, task_ids: list[str], queued_at: datetime) -> None:
+        """broker로 발행된 작업을 QUEUED로 표시"""
+        if not task_ids:
+            return
+        await db.execute(
+            update(Job)
+            .where(Job.task_id.in_(task_ids), Job.status == JobStatus.PENDING)
+            .values(status=JobStatus.QUEUED, queued_at=queued_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def mark_failed(db: AsyncSession, task_ids: list[str], error_message: str) -> None:
+        """발행하지 못하고 포기한 작업을 FAILED로 표시하고, 해당 소스도 FAILED로 표시
+
+        워커가 실행하지 않으므로 PROCESSING으로 남지 않도록 outbox 상태 전환과 같은 트랜잭션에서 호출합니다.
+        """
+        if not task_ids:
+            return
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(Job)
+            .where(Job.task_id.in_(task_ids), Job.status == JobStatus.PENDING)
+            .values(status=JobStatus.FAILED, error_message=error_message[:500], finished_at=now)
+            .returning(Job.skeleton_source_id)
+            .execution_options(synchronize_session=False)
+        )
+        source_ids = set(result.scalars().all())
+        if source_ids:
+            await db.execute(
+                update(SkeletonSource)
+                .where(SkeletonSource.id.in_(source_ids), SkeletonSource.status == AssetStatus.PROCESSING)
+                .values(status=AssetStatus.FAILED, error_message=error_message[:500])
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    async def cancel_for_source(db: AsyncSession, source_id: int) -> list[str]:
+        """소스의 끝나지 않은 작업 취소
+
+        아직 시작되지 않은 작업은 REVOKED로 표시합니다. 발행 전(PENDING) 작업은 outbox에서 제거하고,
+        발행된(QUEUED) 작업은 task id를 반환하므로 호출자는 커밋 후 revoke_tasks로 broker에 취소를 알려야 합니다.
+        실행 중(STARTED/RETRYING)인 작업은 cancel_requested_at만 기록하며, 워커가 이를 확인하고 CANCELLED로 중단합니다.
+        """
+        now = datetime.utcnow()
+        await db.execute(
+            update(Job)
+            .where(
+                Job.skeleton_source_id == source_id,
+                Job.status.in_([JobStatus.STARTED, JobStatus.RETRYING]),
+                Job.cancel_requested_at.is_(None),
+            )
+            .values(cancel_requested_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await db.execute(
+            update(Job)
+            .where(
+                Job.skeleton_source_id == source_id,
+                Job.status.in_([JobStatus.PENDING, JobStatus.QUEUED]),
+            )
+            .values(status=JobStatus.REVOKED, finished_at=now)
+            .returning(Job.task_id)
+            .execution_options(synchronize_session=False)
+        )
+        task_ids = list(result.scalars().all())
+        if task_ids:
+            await db.execute(
+                delete(OutboxJob).where(
+                    OutboxJob.task_id.in_(task_ids),
+                    OutboxJob.status == OutboxStatus.PENDING,
+                )
+            )
+        return task_ids
+
+    @staticmethod
+    async def get_job(db: AsyncSession, job_id: int) -> JobResponse:
+        """작업 조회"""
+        result = await db.execute(select(Job).where(Job.id == job_id))
+        job = result.scalar_one_or_none()
+
+        if not job:
+            raise NotFoundError("Job", job_id)
+
+        return JobResponse.model_validate(job)
+
+    @staticmethod
+    async def list_project_jobs(
+        db: AsyncSession,
+        project_id: int,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> list[JobResponse]:
+        """프로젝트의 작업 목록 조회 (최신순)"""
+        project_result = await db.execute(select(Project.id).where(Project.id == project_id))
+        if project_result.scalar_one_or_none() is None:
+            raise NotFoundError("Project", project_id)
+
+        query = (
+            select(Job)
+            .join(SkeletonSource, SkeletonSource.id == Job.skeleton_source_id)
+            .join(Track, Track.id == SkeletonSource.track_id)
+            .where(Track.project_id == project_id)
+            .order_by(Job.id.desc())
+            .limit(limit)
+        )
+
+        if cursor:
+            try:
+                cursor_id = int(cursor)
+                query = query.where(Job.id < cursor_id)
+            except ValueError:
+                pass
+
+        result = await db.execute(query)
+        jobs = result.scalars().all()
+
+        return [JobResponse.model_validate(job) for job in jobs]
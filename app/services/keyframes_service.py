@@ -1,52 +1,151 @@
+from collections import OrderedDict
 from datetime import datetime
+from decimal import Decimal
 
+import numpy as np
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.errors import NotFoundError
-from app.models import Track, TrackPositionKeyframe
+from app.core.errors import NotFoundError, PreconditionFailedError, ValidationError
+from app.models import InterpType, Project, Track, TrackPositionKeyframe
 from app.schemas.keyframe import KeyframeUpsert, KeyframeResponse
+from app.services.projects_service import ProjectsService
+
+# 컬럼 scale(Numeric(10, 3) / Numeric(10, 4))에 맞춰 비교해야 diff가 정확함
+_TIME_QUANT = Decimal("0.001")
+_POS_QUANT = Decimal("0.0001")
+
+# 샘플링 요청 1회당 최대 샘플 수 (30fps 기준 약 1시간 50분)
+MAX_SAMPLES = 200_000
+
+# (track_id, revision, fps, from_sec, num_samples) -> (num_samples, 2) float32
+# revision이 키에 포함되므로 트랙이 수정되면 자연스럽게 무효화됨
+_SAMPLE_CACHE_SIZE = 256
+_sample_cache: OrderedDict[tuple[int, int, float, float, int], np.ndarray] = OrderedDict()
 
 
 class KeyframesService:
     @staticmethod
-    async def upsert_keyframes(db: AsyncSession, track_id: int, data: KeyframeUpsert) -> list[KeyframeResponse]:
-        """키프레임 전체 교체 (upsert)"""
-        # 트랙 확인
-        track_result = await db.execute(select(Track).where(Track.id == track_id))
+    async def upsert_keyframes(
+        db: AsyncSession,
+        track_id: int,
+        data: KeyframeUpsert,
+        expected_revision: int | None = None,
+    ) -> tuple[list[KeyframeResponse], int]:
+        """키프레임 전체 교체 (upsert)
+
+        기존 (track_id, time_sec) 행과 diff를 계산하여 변경/추가된 행만
+        INSERT ... ON CONFLICT DO UPDATE 한 번, 사라진 행만 DELETE 한 번으로 반영합니다.
+
+        Args:
+            expected_revision: If-Match로 전달된 트랙 revision (None이면 검사하지 않음)
+
+        Returns:
+            (키프레임 목록, 트랙 revision) 튜플
+        """
+        # 트랙 확인 (동시 upsert 직렬화를 위해 행 잠금, 다른 편집과 같은 Project -> Track 순서)
+        await ProjectsService.lock_project(db, track_id=track_id)
+        track_result = await db.execute(select(Track).where(Track.id == track_id).with_for_update())
         track = track_result.scalar_one_or_none()
 
         if not track:
             raise NotFoundError("Track", track_id)
 
-        # 기존 키프레임 삭제
-        await db.execute(delete(TrackPositionKeyframe).where(TrackPositionKeyframe.track_id == track_id))
+        if expected_revision is not None and track.revision != expected_revision:
+            raise PreconditionFailedError(
+                f"Track {track_id} revision mismatch (expected {expected_revision}, current {track.revision})"
+            )
 
-        # 새 키프레임 생성
-        keyframes = []
+        # 요청 키프레임 정규화
+        desired: dict[Decimal, tuple[Decimal, Decimal, InterpType]] = {}
         for item in data.keyframes:
-            kf = TrackPositionKeyframe(
-                track_id=track_id,
-                time_sec=item.time_sec,
-                x=item.x,
-                y=item.y,
-                interp=item.interp,
-                created_at=datetime.utcnow(),
+            time_sec = item.time_sec.quantize(_TIME_QUANT)
+            if time_sec in desired:
+                raise ValidationError(f"Duplicate keyframe time_sec: {time_sec}")
+            desired[time_sec] = (item.x.quantize(_POS_QUANT), item.y.quantize(_POS_QUANT), item.interp)
+
+        # 기존 키프레임 조회
+        existing_result = await db.execute(
+            select(TrackPositionKeyframe).where(TrackPositionKeyframe.track_id == track_id)
+        )
+        existing = {kf.time_sec: kf for kf in existing_result.scalars().all()}
+
+        # diff 계산
+        unchanged: list[KeyframeResponse] = []
+        changed_rows = []
+        now = datetime.utcnow()
+        for time_sec, (x, y, interp) in desired.items():
+            kf = existing.get(time_sec)
+            if kf is not None and (kf.x, kf.y, kf.interp) == (x, y, interp):
+                unchanged.append(KeyframeResponse.model_validate(kf))
+                continue
+            changed_rows.append(
+                {
+                    "track_id": track_id,
+                    "time_sec": time_sec,
+                    "x": x,
+                    "y": y,
+                    "interp": interp,
+                    "created_at": now,
+                }
             )
-            db.add(kf)
-            keyframes.append(kf)
+        removed_times = [t for t in existing if t not in desired]
 
-        await db.commit()
+        if not changed_rows and not removed_times:
+            return sorted(unchanged, key=lambda k: k.time_sec), track.revision
+
+        # 사라진 키프레임 삭제
+        if removed_times:
+            await db.execute(
+                delete(TrackPositionKeyframe).where(
+                    TrackPositionKeyframe.track_id == track_id,
+                    TrackPositionKeyframe.time_sec.in_(removed_times),
+                )
+            )
+
+        # 변경/추가된 키프레임 upsert
+        upserted: list[KeyframeResponse] = []
+        if changed_rows:
+            stmt = insert(TrackPositionKeyframe).values(changed_rows)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_track_position_keyframes_track_time",
+                set_={
+                    "x": stmt.excluded.x,
+                    "y": stmt.excluded.y,
+                    "interp": stmt.excluded.interp,
+                },
+            ).returning(
+                TrackPositionKeyframe.id,
+                TrackPositionKeyframe.track_id,
+                TrackPositionKeyframe.time_sec,
+                TrackPositionKeyframe.x,
+                TrackPositionKeyframe.y,
+                TrackPositionKeyframe.interp,
+            )
+            result = await db.execute(stmt)
+            upserted = [KeyframeResponse.model_validate(dict(row)) for row in result.mappings().all()]
 
-        # 새로 생성된 키프레임 조회
-        for kf in keyframes:
-            await db.refresh(kf)
+        track.revision += 1
+        revision = track.revision
+        await ProjectsService.bump_revision(db, project_id=track.project_id)
+        await db.commit()
 
-        return [KeyframeResponse.model_validate(kf) for kf in keyframes]
+        return sorted(unchanged + upserted, key=lambda k: k.time_sec), revision
 
     @staticmethod
-    async def get_keyframes(db: AsyncSession, track_id: int) -> list[KeyframeResponse]:
-        """키프레임 목록 조회"""
+    async def get_keyframes(db: AsyncSession, track_id: int) -> tuple[list[KeyframeResponse], int]:
+        """키프레임 목록 조회
+
+        Returns:
+            (키프레임 목록, 트랙 revision) 튜플
+        """
+        revision_result = await db.execute(select(Track.revision).where(Track.id == track_id))
+        revision = revision_result.scalar_one_or_none()
+
+        if revision is None:
+            raise NotFoundError("Track", track_id)
+
         result = await db.execute(
             select(TrackPositionKeyframe)
             .where(TrackPositionKeyframe.track_id == track_id)
@@ -54,5 +153,166 @@ class KeyframesService:
         )
         keyframes = result.scalars().all()
 
-        return [KeyframeResponse.model_validate(kf) for kf in keyframes]
+        return [KeyframeResponse.model_validate(kf) for kf in keyframes], revision
+
+    @staticmethod
+    def _evaluate_positions(keyframes: list[TrackPositionKeyframe], t: np.ndarray) -> np.ndarray:
+        """키프레임을 시각 배열 t에서 평가하여 (len(t), 2) float32 배열 반환
+
+        각 키프레임의 interp는 다음 키프레임까지의 구간에 적용됩니다.
+        (STEP: 값 유지, LINEAR: 선형 보간) 첫 키프레임 이전/마지막 이후는 끝 값을 유지하고,
+        키프레임이 없으면 (0, 0)을 반환합니다.
+        """
+        out = np.zeros((len(t), 2), dtype=np.float32)
+        if not keyframes:
+            return out
+
+        times = np.array([float(kf.time_sec) for kf in keyframes], dtype=np.float64)
+        xs = np.array([float(kf.x) for kf in keyframes], dtype=np.float64)
+        ys = np.array([float(kf.y) for kf in keyframes], dtype=np.float64)
+        is_linear = np.array([kf.interp == InterpType.LINEAR for kf in keyframes], dtype=bool)
+
+        # t가 속한 구간의 시작 키프레임 인덱스
+        idx = np.clip(np.searchsorted(times, t, side="right") - 1, 0, len(times) - 1)
+        linear = is_linear[idx]
+
+        out[:, 0] = np.where(linear, np.interp(t, times, xs), xs[idx])
+        out[:, 1] = np.where(linear, np.interp(t, times, ys), ys[idx])
+        return out
+
+    @staticmethod
+    def _sample_window(fps: float, from_sec: float, to_sec: float) -> tuple[np.ndarray, int]:
+        """[from_sec, to_sec] 구간의 샘플 시각 배열 생성"""
+        if to_sec < from_sec:
+            raise ValidationError("'to' must be greater than or equal to 'from'")
+        num_samples = int(np.floor((to_sec - from_sec) * fps + 1e-9)) + 1
+        if num_samples > MAX_SAMPLES:
+            raise ValidationError(f"Too many samples ({num_samples} > {MAX_SAMPLES}); narrow the range or lower fps")
+        return from_sec + np.arange(num_samples, dtype=np.float64) / fps, num_samples
+
+    @staticmethod
+    def _cache_get(key: tuple[int, int, float, float, int]) -> np.ndarray | None:
+        samples = _sample_cache.get(key)
+        if samples is not None:
+            _sample_cache.move_to_end(key)
+        return samples
+
+    @staticmethod
+    def _cache_put(key: tuple[int, int, float, float, int], samples: np.ndarray) -> None:
+        _sample_cache[key] = samples
+        _sample_cache.move_to_end(key)
+        while len(_sample_cache) > _SAMPLE_CACHE_SIZE:
+            _sample_cache.popitem(last=False)
+
+    @staticmethod
+    async def sample_track_positions(
+        db: AsyncSession,
+        track_id: int,
+        fps: float,
+        from_sec: float | None = None,
+        to_sec: float | None = None,
+    ) -> tuple[np.ndarray, int, float]:
+        """트랙 위치를 fps 간격으로 샘플링
+
+        Returns:
+            ((num_samples, 2) float32 배열, 트랙 revision, from_sec) 튜플
+        """
+        revision_result = await db.execute(select(Track.revision).where(Track.id == track_id))
+        revision = revision_result.scalar_one_or_none()
+
+        if revision is None:
+            raise NotFoundError("Track", track_id)
+
+        samples, start = await KeyframesService._sample_tracks(db, {track_id: revision}, fps, from_sec, to_sec)
+        return samples[track_id], revision, start
+
+    @staticmethod
+    async def sample_project_positions(
+        db: AsyncSession,
+        project_id: int,
+        fps: float,
+        from_sec: float | None = None,
+        to_sec: float | None = None,
+    ) -> tuple[dict[int, tuple[np.ndarray, int]], float, int]:
+        """프로젝트의 모든 트랙 위치를 동일한 시각 배열로 샘플링
+
+        to_sec을 생략하면 음악 길이(없으면 마지막 키프레임 시각)까지 샘플링합니다.
+
+        Returns:
+            ({track_id: (샘플 배열, revision)}, from_sec, 프로젝트 revision) 튜플 (트랙은 slot 순)
+            프로젝트 revision은 키프레임 편집과 음악 교체(기본 to_sec) 모두에서 증가하므로 ETag로 사용합니다.
+        """
+        project_result = await db.execute(
+            select(Project.music_duration_sec, Project.revision).where(Project.id == project_id)
+        )
+        row = project_result.one_or_none()
+
+        if row is None:
+            raise NotFoundError("Project", project_id)
+
+        if to_sec is None and row.music_duration_sec is not None:
+            to_sec = float(row.music_duration_sec)
 
+        tracks_result = await db.execute(
+            select(Track.id, Track.revision).where(Track.project_id == project_id).order_by(Track.slot)
+        )
+        revisions = {track_id: revision for track_id, revision in tracks_result.all()}
+
+        samples, start = await KeyframesService._sample_tracks(db, revisions, fps, from_sec, to_sec)
+        tracks = {track_id: (samples[track_id], revisions[track_id]) for track_id in revisions}
+        return tracks, start, row.revision
+
+    @staticmethod
+    async def _sample_tracks(
+        db: AsyncSession,
+        revisions: dict[int, int],
+        fps: float,
+        from_sec: float | None,
+        to_sec: float | None,
+    ) -> tuple[dict[int, np.ndarray], float]:
+        """여러 트랙을 캐시 우선으로 샘플링 (캐시 miss 트랙의 키프레임만 한 번에 조회)"""
+        start = from_sec or 0.0
+        keyframes_by_track: dict[int, list[TrackPositionKeyframe]] | None = None
+
+        if to_sec is None:
+            # 끝 시각이 없으면 마지막 키프레임 시각을 알아야 하므로 전체 조회
+            keyframes_by_track = await KeyframesService._load_keyframes(db, list(revisions))
+            last_times = [float(kfs[-1].time_sec) for kfs in keyframes_by_track.values() if kfs]
+            to_sec = max(last_times + [start])
+
+        t, num_samples = KeyframesService._sample_window(fps, start, to_sec)
+
+        samples: dict[int, np.ndarray] = {}
+        misses: list[int] = []
+        for track_id, revision in revisions.items():
+            cached = KeyframesService._cache_get((track_id, revision, fps, start, num_samples))
+            if cached is None:
+                misses.append(track_id)
+            else:
+                samples[track_id] = cached
+
+        if misses:
+            if keyframes_by_track is None:
+                keyframes_by_track = await KeyframesService._load_keyframes(db, misses)
+            for track_id in misses:
+                evaluated = KeyframesService._evaluate_positions(keyframes_by_track.get(track_id, []), t)
+                KeyframesService._cache_put((track_id, revisions[track_id], fps, start, num_samples), evaluated)
+                samples[track_id] = evaluated
+
+        return samples, start
+
+    @staticmethod
+    async def _load_keyframes(db: AsyncSession, track_ids: list[int]) -> dict[int, list[TrackPositionKeyframe]]:
+        """트랙별 키프레임을 시각 순으로 한 번에 조회"""
+        keyframes_by_track: dict[int, list[TrackPositionKeyframe]] = {track_id: [] for track_id in track_ids}
+        if not track_ids:
+            return keyframes_by_track
+
+        result = await db.execute(
+            select(TrackPositionKeyframe)
+            .where(TrackPositionKeyframe.track_id.in_(track_ids))
+            .order_by(TrackPositionKeyframe.track_id, TrackPositionKeyframe.time_sec)
+        )
+        for kf in result.scalars().all():
+            keyframes_by_track[kf.track_id].append(kf)
+        return keyframes_by_track
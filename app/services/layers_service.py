@@ -1,22 +1,48 @@
+import asyncio
+import logging
 from datetime import datetime
 from decimal import Decimal
 from io import BytesIO
 
 from fastapi import UploadFile
 from mutagen import File as MutagenFile
-from sqlalchemy import select
+from sqlalchemy import Integer, Numeric, String, column, delete, select, update, values
+from sqlalchemy.dialects.postgresql import Range
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.errors import NotFoundError
-from app.models import Track, SkeletonSource, SkeletonLayer, AssetStatus
-from app.schemas.layer import LayerUpdate, LayerResponse
-from app.integrations.minio_client import get_minio_client
-from app.integrations.celery_client import enqueue_skeleton_extraction
+from app.core.errors import NotFoundError, TooManyRequestsError, ValidationError
+from app.models import Project, Track, SkeletonSource, SkeletonLayer, AssetStatus
+from app.schemas.layer import LayerBatchRequest, LayerBatchResponse, LayerUpdate, LayerResponse, LayerUploadResponse
+from app.integrations.celery_client import revoke_tasks
+from app.integrations.task_contracts import (
+    EXTRACT_QUEUE_IO,
+    EXTRACT_SKELETON_TASK,
+    extract_skeleton_kwargs,
+    extract_skeleton_queue,
+)
 from app.core.config import get_settings
+from app.services.jobs_service import JobsService
+from app.services.media_service import MediaService
+from app.services.outbox_service import OutboxService
+from app.services.projects_service import ProjectsService
+from app.services.timeline_service import TimelineService
+
+logger = logging.getLogger(__name__)
 
 
 class LayersService:
+    @staticmethod
+    async def _bump_layers_revision(db: AsyncSession, track_id: int) -> int:
+        """트랙 layers_revision 증가 후 새 값 반환"""
+        result = await db.execute(
+            update(Track)
+            .where(Track.id == track_id)
+            .values(layers_revision=Track.layers_revision + 1)
+            .returning(Track.layers_revision)
+        )
+        return result.scalar_one()
+
     @staticmethod
     def _extract_video_duration(file_content: bytes) -> Decimal | None:
         """비디오 파일에서 duration 추출"""
@@ -40,10 +66,13 @@ class LayersService:
         start_sec: Decimal,
         priority: int = 0,
         label: str | None = None,
-    ) -> LayerResponse:
+    ) -> LayerUploadResponse:
         """레이어 파일 업로드, 프로젝트 연결, 워커 enqueue
         
         서버에서 비디오 파일을 분석하여 end_sec을 자동으로 계산합니다.
+        추출 작업은 같은 트랜잭션의 outbox에 기록되며, 호출자는 커밋 후 OutboxService.dispatch_now로 발행합니다.
+        추출 큐의 예상 소진 시간이 upload_max_queue_drain_sec를 넘으면 429를 반환합니다.
+        (multipart 본문은 FastAPI가 이미 받아 둔 상태이므로 영상 분석, 저장, 추출 작업만 생략됨)
         """
         # 트랙 확인
         track_result = await db.execute(select(Track).where(Track.id == track_id))
@@ -52,16 +81,18 @@ class LayersService:
         if not track:
             raise NotFoundError("Track", track_id)
 
-        # object_key 생성: videos/{track_id}/{filename}
-        object_key = f"videos/{track_id}/{file.filename}"
-
-        # MinIO에 업로드
+        # backpressure: 큐가 밀려 있으면 업로드를 받지 않음
         settings = get_settings()
-        minio_client = get_minio_client()
-        bucket = settings.minio_bucket
-
-        if not bucket:
-            raise ValueError("MinIO bucket not configured")
+        backlog = await JobsService.queue_backlog(
+            db, settings.extract_queue_wait_window_sec, settings.extract_default_duration_sec
+        )
+        drain_sec = JobsService.estimate_drain_sec(backlog)
+        max_drain_sec = settings.upload_max_queue_drain_sec
+        if max_drain_sec > 0 and drain_sec > max_drain_sec:
+            raise TooManyRequestsError(
+                f"Extraction queue is full (estimated drain {int(drain_sec)}s)",
+                retry_after_sec=max(int(drain_sec - max_drain_sec), settings.upload_retry_after_min_sec),
+            )
 
         # 파일 읽기
         file_content = await file.read()
@@ -74,18 +105,18 @@ class LayersService:
             # duration 추출 실패 시 start_sec과 동일하게 설정 (나중에 업데이트 가능)
             end_sec = start_sec
 
-        # MinIO에 업로드
-        minio_client.put_object(
-            bucket_name=bucket,
-            object_name=object_key,
-            data=BytesIO(file_content),
-            length=len(file_content),
-            content_type=file.content_type or "video/mp4",
-        )
+        # content-addressed key로 저장 (같은 내용은 한 번만 업로드, 파일명이 같아도 덮어쓰지 않음)
+        # MinIO 업로드는 잠금 없이 먼저 하고, 트랜잭션에서는 참조 수만 반영
+        media = await MediaService.upload(file_content, file.content_type or "video/mp4")
+
+        # 다른 편집과 같은 순서(Project -> Track / media)로 잠금
+        await ProjectsService.lock_project(db, project_id=track.project_id)
+        object_key = await MediaService.add_reference(db, media, file_content)
 
         # SkeletonSource를 PROCESSING으로 생성
         source = SkeletonSource(
             track_id=track_id,
+            video_object_key=object_key,
             status=AssetStatus.PROCESSING,
             created_at=datetime.utcnow(),
         )
@@ -105,20 +136,49 @@ class LayersService:
         db.add(layer)
         await db.flush()
 
-        # Celery에 스켈레톤 추출 작업 enqueue
-        task_id = enqueue_skeleton_extraction(
-            source_id=source.id,
-            video_object_key=object_key,
-            project_id=track.project_id,
-            track_slot=track.slot,
+        # 추론 단계는 영상 길이로 큐를 나누고, 프로젝트별 진행 중 작업 수로 priority를 정함
+        infer_queue = extract_skeleton_queue(
+            float(video_duration) if video_duration is not None else None,
+            settings.extract_short_max_sec,
+            settings.extract_medium_max_sec,
+        )
+        job_priority = (
+            await JobsService.fairness_priority(db, track.project_id) if settings.extract_project_fairness else None
         )
-        # task_id는 로깅 등에 사용 가능 (필요시)
 
+        # 스켈레톤 추출 작업을 outbox에 기록 (커밋 후 dispatcher가 Celery로 발행)
+        # 커밋 전에 enqueue하면 워커가 아직 보이지 않는 SkeletonSource를 조회할 수 있음
+        outbox_job = OutboxService.add_job(
+            db,
+            EXTRACT_SKELETON_TASK,
+            extract_skeleton_kwargs(
+                source_id=source.id,
+                video_object_key=object_key,
+                project_id=track.project_id,
+                track_slot=track.slot,
+                infer_queue=infer_queue,
+                infer_priority=job_priority,
+            ),
+            queue=EXTRACT_QUEUE_IO,
+            priority=job_priority,
+        )
+        job = JobsService.add_job(db, source.id, outbox_job, queue=infer_queue)
+
+        layers_revision = await LayersService._bump_layers_revision(db, track_id)
+        await ProjectsService.bump_revision(db, project_id=track.project_id)
         await db.commit()
         await db.refresh(layer)
         await db.refresh(source)
 
-        return LayersService._layer_to_response(layer, source)
+        TimelineService.apply_layer_change(track_id, layers_revision, layer.id, TimelineService.to_span(layer))
+
+        waiting_ahead = sum(row.waiting for row in backlog if row.queue == infer_queue)
+        return LayerUploadResponse(
+            **LayersService._layer_to_response(layer, source).model_dump(),
+            job_id=job.id,
+            queue_position=waiting_ahead + 1,
+            estimated_wait_sec=int(JobsService.estimate_drain_sec(backlog, infer_queue)),
+        )
 
     @staticmethod
     async def get_layer(db: AsyncSession, layer_id: int) -> LayerResponse:
@@ -135,6 +195,64 @@ class LayersService:
 
         return LayersService._layer_to_response(layer, layer.source)
 
+    @staticmethod
+    def _time_window_filter(from_sec: Decimal | None, to_sec: Decimal | None):
+        """[from_sec, to_sec]와 겹치는 레이어 조건 (time_range GiST 인덱스 사용)"""
+        if from_sec is not None and to_sec is not None and to_sec < from_sec:
+            raise ValidationError("'to' must be greater than or equal to 'from'")
+        return SkeletonLayer.time_range.overlaps(Range(from_sec, to_sec, bounds="[]"))
+
+    @staticmethod
+    async def list_layers(
+        db: AsyncSession,
+        track_id: int,
+        from_sec: Decimal | None = None,
+        to_sec: Decimal | None = None,
+    ) -> list[LayerResponse]:
+        """트랙의 레이어 중 [from_sec, to_sec] 구간과 겹치는 레이어 조회"""
+        track_result = await db.execute(select(Track.id).where(Track.id == track_id))
+        if track_result.scalar_one_or_none() is None:
+            raise NotFoundError("Track", track_id)
+
+        result = await db.execute(
+            select(SkeletonLayer)
+            .where(
+                SkeletonLayer.track_id == track_id,
+                LayersService._time_window_filter(from_sec, to_sec),
+            )
+            .options(selectinload(SkeletonLayer.source))
+            .order_by(SkeletonLayer.start_sec, SkeletonLayer.id)
+        )
+        layers = result.scalars().all()
+
+        return [LayersService._layer_to_response(layer, layer.source) for layer in layers]
+
+    @staticmethod
+    async def list_project_layers(
+        db: AsyncSession,
+        project_id: int,
+        from_sec: Decimal | None = None,
+        to_sec: Decimal | None = None,
+    ) -> list[LayerResponse]:
+        """프로젝트 전체 트랙에서 [from_sec, to_sec] 구간과 겹치는 레이어 조회"""
+        project_result = await db.execute(select(Project.id).where(Project.id == project_id))
+        if project_result.scalar_one_or_none() is None:
+            raise NotFoundError("Project", project_id)
+
+        result = await db.execute(
+            select(SkeletonLayer)
+            .join(Track, Track.id == SkeletonLayer.track_id)
+            .where(
+                Track.project_id == project_id,
+                LayersService._time_window_filter(from_sec, to_sec),
+            )
+            .options(selectinload(SkeletonLayer.source))
+            .order_by(Track.slot, SkeletonLayer.start_sec, SkeletonLayer.id)
+        )
+        layers = result.scalars().all()
+
+        return [LayersService._layer_to_response(layer, layer.source) for layer in layers]
+
     @staticmethod
     async def update_layer(db: AsyncSession, layer_id: int, data: LayerUpdate) -> LayerResponse:
         """레이어 업데이트"""
@@ -148,6 +266,8 @@ class LayersService:
         if not layer:
             raise NotFoundError("Layer", layer_id)
 
+        await ProjectsService.lock_project(db, track_id=layer.track_id)
+
         if data.start_sec is not None:
             layer.start_sec = data.start_sec
         if data.end_sec is not None:
@@ -157,22 +277,196 @@ class LayersService:
         if data.label is not None:
             layer.label = data.label
 
+        layers_revision = await LayersService._bump_layers_revision(db, layer.track_id)
+        await ProjectsService.bump_revision(db, track_id=layer.track_id)
         await db.commit()
         await db.refresh(layer)
 
+        TimelineService.apply_layer_change(layer.track_id, layers_revision, layer.id, TimelineService.to_span(layer))
+
         return LayersService._layer_to_response(layer, layer.source)
 
     @staticmethod
     async def delete_layer(db: AsyncSession, layer_id: int) -> None:
-        """레이어 삭제"""
+        """레이어 삭제
+
+        소스를 참조하는 다른 레이어가 없으면 추출 작업을 취소하고 (실행 중인 작업은 워커가 중단)
+        원본 영상 참조를 해제합니다.
+        """
         result = await db.execute(select(SkeletonLayer).where(SkeletonLayer.id == layer_id))
         layer = result.scalar_one_or_none()
 
         if not layer:
             raise NotFoundError("Layer", layer_id)
 
+        track_id = layer.track_id
+        source_id = layer.skeleton_source_id
+        await ProjectsService.lock_project(db, track_id=track_id)
         await db.delete(layer)
+        await db.flush()
+
+        revoked_task_ids = await LayersService._release_orphan_sources(db, [source_id])
+
+        layers_revision = await LayersService._bump_layers_revision(db, track_id)
+        await ProjectsService.bump_revision(db, track_id=track_id)
+        await db.commit()
+
+        TimelineService.apply_layer_change(track_id, layers_revision, layer_id, None)
+
+        await LayersService._revoke_tasks(revoked_task_ids)
+
+    @staticmethod
+    async def _release_orphan_sources(db: AsyncSession, source_ids: list[int]) -> list[str]:
+        """레이어가 더 이상 참조하지 않는 소스의 추출 작업 취소, 원본 영상 참조 해제
+
+        Returns:
+            커밋 후 broker에 revoke할 task id
+        """
+        if not source_ids:
+            return []
+        referenced = await db.execute(
+            select(SkeletonLayer.skeleton_source_id)
+            .where(SkeletonLayer.skeleton_source_id.in_(source_ids))
+            .distinct()
+        )
+        orphan_ids = set(source_ids) - set(referenced.scalars().all())
+        if not orphan_ids:
+            return []
+
+        revoked_task_ids: list[str] = []
+        result = await db.execute(select(SkeletonSource).where(SkeletonSource.id.in_(orphan_ids)))
+        for source in result.scalars().all():
+            revoked_task_ids.extend(await JobsService.cancel_for_source(db, source.id))
+            await MediaService.release(db, source.video_object_key)
+            source.video_object_key = None
+        return revoked_task_ids
+
+    @staticmethod
+    async def _revoke_tasks(task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+        # broker I/O는 커밋 후 스레드에서 (실패해도 워커가 REVOKED 상태를 보고 건너뜀)
+        try:
+            await asyncio.to_thread(revoke_tasks, task_ids)
+        except Exception:
+            logger.warning("Failed to revoke tasks %s", task_ids, exc_info=True)
+
+    @staticmethod
+    async def batch_update_layers(db: AsyncSession, project_id: int, data: LayerBatchRequest) -> LayerBatchResponse:
+        """레이어 일괄 업데이트/삭제 (한 트랜잭션)
+
+        모든 항목을 함께 검증한 뒤 UPDATE ... FROM (VALUES ...) 한 번과 DELETE 한 번으로 반영하고
+        프로젝트 revision은 한 번만 증가시킵니다.
+        """
+        update_ids = [item.id for item in data.updates]
+        delete_ids = list(dict.fromkeys(data.deletes))
+        if len(set(update_ids)) != len(update_ids):
+            raise ValidationError("Duplicate layer id in updates")
+        if set(update_ids) & set(delete_ids):
+            raise ValidationError("A layer cannot be both updated and deleted")
+
+        # 대상 레이어 조회 (프로젝트 소속 확인 + 프로젝트 행 잠금으로 동시 편집 직렬화)
+        if await ProjectsService.lock_project(db, project_id=project_id) is None:
+            raise NotFoundError("Project", project_id)
+
+        target_ids = update_ids + delete_ids
+        current: dict[int, SkeletonLayer] = {}
+        if target_ids:
+            result = await db.execute(
+                select(SkeletonLayer)
+                .join(Track, Track.id == SkeletonLayer.track_id)
+                .where(SkeletonLayer.id.in_(target_ids), Track.project_id == project_id)
+            )
+            current = {layer.id: layer for layer in result.scalars().all()}
+        for layer_id in target_ids:
+            if layer_id not in current:
+                raise NotFoundError("Layer", layer_id)
+
+        # 변경 후 값 계산 및 검증
+        rows = []
+        for item in data.updates:
+            layer = current[item.id]
+            start_sec = item.start_sec if item.start_sec is not None else layer.start_sec
+            end_sec = item.end_sec if item.end_sec is not None else layer.end_sec
+            if end_sec < start_sec:
+                raise ValidationError(f"Layer {item.id}: end_sec must be greater than or equal to start_sec")
+            rows.append(
+                (
+                    item.id,
+                    start_sec,
+                    end_sec,
+                    item.priority if item.priority is not None else layer.priority,
+                    item.label if item.label is not None else layer.label,
+                )
+            )
+
+        if rows:
+            v = values(
+                column("id", Integer),
+                column("start_sec", Numeric(10, 3)),
+                column("end_sec", Numeric(10, 3)),
+                column("priority", Integer),
+                column("label", String(255)),
+                name="v",
+            ).data(rows)
+            await db.execute(
+                update(SkeletonLayer)
+                .where(SkeletonLayer.id == v.c.id)
+                .values(start_sec=v.c.start_sec, end_sec=v.c.end_sec, priority=v.c.priority, label=v.c.label)
+                .execution_options(synchronize_session=False)
+            )
+        revoked_task_ids: list[str] = []
+        if delete_ids:
+            await db.execute(
+                delete(SkeletonLayer)
+                .where(SkeletonLayer.id.in_(delete_ids))
+                .execution_options(synchronize_session=False)
+            )
+            revoked_task_ids = await LayersService._release_orphan_sources(
+                db, list({current[layer_id].skeleton_source_id for layer_id in delete_ids})
+            )
+
+        # 영향받은 트랙 layers_revision / 프로젝트 revision 증가
+        track_ids = sorted({current[layer_id].track_id for layer_id in target_ids})
+        track_revisions: dict[int, int] = {}
+        if track_ids:
+            track_result = await db.execute(
+                update(Track)
+                .where(Track.id.in_(track_ids))
+                .values(layers_revision=Track.layers_revision + 1)
+                .returning(Track.id, Track.layers_revision)
+            )
+            track_revisions = {track_id: revision for track_id, revision in track_result.all()}
+        project_revision = await ProjectsService.bump_revision(db, project_id=project_id)
+
         await db.commit()
+        await LayersService._revoke_tasks(revoked_task_ids)
+
+        # 응답용 레이어 조회 (bulk UPDATE는 identity map을 갱신하지 않으므로 다시 읽음)
+        layers: list[SkeletonLayer] = []
+        if update_ids:
+            result = await db.execute(
+                select(SkeletonLayer)
+                .where(SkeletonLayer.id.in_(update_ids))
+                .options(selectinload(SkeletonLayer.source))
+                .order_by(SkeletonLayer.id)
+                .execution_options(populate_existing=True)
+            )
+            layers = list(result.scalars().all())
+
+        changes: dict[int, list] = {track_id: [] for track_id in track_ids}
+        for layer in layers:
+            changes[layer.track_id].append((layer.id, TimelineService.to_span(layer)))
+        for layer_id in delete_ids:
+            changes[current[layer_id].track_id].append((layer_id, None))
+        for track_id, track_changes in changes.items():
+            TimelineService.apply_layer_changes(track_id, track_revisions[track_id], track_changes)
+
+        return LayerBatchResponse(
+            project_revision=project_revision,
+            layers=[LayersService._layer_to_response(layer, layer.source) for layer in layers],
+            deleted_ids=delete_ids,
+        )
 
     @staticmethod
     def _layer_to_response(layer: SkeletonLayer, source: SkeletonSource) -> LayerResponse:
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+from datetime import datetime
+from io import BytesIO
+from typing import NamedTuple
+
+from minio.error import S3Error
+from sqlalchemy import case, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.integrations.minio_client import get_minio_client
+from app.models import MediaObject
+
+CONTENT_ADDRESSED_PREFIX = "media/sha256/"
+
+# content-addressed 객체는 내용이 바뀌지 않으므로 무기한 캐시 가능
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def content_object_key(sha256: str) -> str:
+    return f"{CONTENT_ADDRESSED_PREFIX}{sha256[:2]}/{sha256[2:]}"
+
+
+def is_content_addressed(object_key: str) -> bool:
+    return object_key.startswith(CONTENT_ADDRESSED_PREFIX)
+
+
+class StoredMedia(NamedTuple):
+    """MinIO에 올린 content-addressed 객체 (아직 참조 수에는 반영되지 않음)"""
+
+    sha256: str
+    object_key: str
+    size_bytes: int
+    content_type: str
+
+
+def _object_exists(bucket: str, object_key: str) -> bool:
+    try:
+        get_minio_client().stat_object(bucket, object_key)
+    except S3Error as exc:
+        if exc.code in ("NoSuchKey", "NoSuchObject"):
+            return False
+        raise
+    return True
+
+
+def _put_if_missing(bucket: str, object_key: str, content: bytes, content_type: str) -> None:
+    if _object_exists(bucket, object_key):
+        return
+    get_minio_client().put_object(
+        bucket_name=bucket,
+        object_name=object_key,
+        data=BytesIO(content),
+        length=len(content),
+        content_type=content_type,
+        metadata={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+    )
+
+
+def _bucket() -> str:
+    bucket = get_settings().minio_bucket
+    if not bucket:
+        raise ValueError("MinIO bucket not configured")
+    return bucket
+
+
+class MediaService:
+    @staticmethod
+    async def upload(content: bytes, content_type: str | None) -> StoredMedia:
+        """내용 해시 key로 MinIO에 업로드 (이미 있으면 생략)
+
+        DB 잠금 없이 호출하므로 업로드 중에 다른 편집을 막지 않습니다. 같은 key는 항상 같은 내용이라 중복 업로드해도 안전하며,
+        참조를 기록하지 못한 객체는 GC sweep이 grace 기간 후 삭제합니다. 업로드 후 트랜잭션에서 add_reference를 호출합니다.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        media = StoredMedia(digest, content_object_key(digest), len(content), content_type or "application/octet-stream")
+        await asyncio.to_thread(_put_if_missing, _bucket(), media.object_key, content, media.content_type)
+        return media
+
+    @staticmethod
+    async def add_reference(db: AsyncSession, media: StoredMedia, content: bytes) -> str:
+        """업로드한 객체의 참조 수 1 증가 후 object key 반환 (호출자의 트랜잭션에서 커밋)
+
+        행이 새로 삽입된 경우, upload 이후 GC가 참조 수 0인 이전 행과 함께 객체를 지웠을 수 있으므로
+        객체가 없으면 다시 업로드합니다. (행 잠금을 쥔 상태이므로 GC와 겹치지 않음, 드문 경우에만 발생)
+        """
+        result = await db.execute(
+            insert(MediaObject)
+            .values(
+                sha256=media.sha256,
+                object_key=media.object_key,
+                size_bytes=media.size_bytes,
+                content_type=media.content_type,
+                ref_count=1,
+                created_at=datetime.utcnow(),
+            )
+            .on_conflict_do_update(
+                index_elements=[MediaObject.sha256],
+                set_={"ref_count": MediaObject.ref_count + 1, "released_at": None},
+            )
+            # xmax = 0이면 이번에 새로 삽입된 행
+            .returning(literal_column("xmax = 0").label("inserted"))
+        )
+        if result.scalar_one():
+            await asyncio.to_thread(_put_if_missing, _bucket(), media.object_key, content, media.content_type)
+        return media.object_key
+
+    @staticmethod
+    async def release(db: AsyncSession, object_key: str | None) -> None:
+        """참조 수 1 감소 (0이 되면 released_at 기록, content-addressed가 아닌 예전 key는 무시)"""
+        if not object_key or not is_content_addressed(object_key):
+            return
+        await db.execute(
+            update(MediaObject)
+            .where(MediaObject.object_key == object_key, MediaObject.ref_count > 0)
+            .values(
+                ref_count=MediaObject.ref_count - 1,
+                released_at=case((MediaObject.ref_count == 1, datetime.utcnow()), else_=MediaObject.released_at),
+            )
+            .execution_options(synchronize_session=False)
+        )
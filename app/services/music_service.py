@@ -9,8 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError
 from app.models import Project
-from app.integrations.minio_client import get_minio_client
-from app.core.config import get_settings
+from app.services.media_service import MediaService
 
 
 class MusicService:
@@ -38,6 +37,7 @@ class MusicService:
         """음악 파일 업로드 및 프로젝트에 연결
         
         서버에서 오디오 파일을 분석하여 duration_sec을 자동으로 계산합니다.
+        같은 내용의 파일은 한 번만 저장됩니다 (content-addressed).
         """
         # 프로젝트 확인
         result = await db.execute(select(Project).where(Project.id == project_id))
@@ -46,17 +46,6 @@ class MusicService:
         if not project:
             raise NotFoundError("Project", project_id)
 
-        # object_key 생성: music/{project_id}/{filename}
-        object_key = f"music/{project_id}/{file.filename}"
-
-        # MinIO에 업로드
-        settings = get_settings()
-        minio_client = get_minio_client()
-        bucket = settings.minio_bucket
-
-        if not bucket:
-            raise ValueError("MinIO bucket not configured")
-
         # 파일 읽기
         file_content = await file.read()
 
@@ -66,19 +55,18 @@ class MusicService:
         # bpm은 현재 자동 계산하지 않음 (None으로 저장)
         bpm = None
 
-        # MinIO에 업로드
-        minio_client.put_object(
-            bucket_name=bucket,
-            object_name=object_key,
-            data=BytesIO(file_content),
-            length=len(file_content),
-            content_type=file.content_type or "audio/mpeg",
-        )
+        # content-addressed key로 저장하고 (업로드는 잠금 없이 먼저), 교체되는 이전 음악의 참조 해제
+        media = await MediaService.upload(file_content, file.content_type or "audio/mpeg")
+        # 프로젝트 행 잠금 후 다시 읽음 (업로드 중 다른 요청이 음악을 교체했을 수 있음)
+        await db.refresh(project, with_for_update=True)
+        object_key = await MediaService.add_reference(db, media, file_content)
+        await MediaService.release(db, project.music_object_key)
 
         # 프로젝트에 연결
         project.music_object_key = object_key
         project.music_duration_sec = duration_sec
         project.music_bpm = bpm
+        project.revision += 1
         project.updated_at = datetime.utcnow()
 
         await db.commit()
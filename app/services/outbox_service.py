@@ -0,0 +1,190 @@
+"""Transactional outbox: 도메인 변경과 같은 트랜잭션에 작업을 기록하고, 커밋 후 Celery로 일괄 발행"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import get_sessionmaker
+from app.integrations.celery_client import publish_tasks
+from app.models import OutboxJob, OutboxStatus
+from app.services.jobs_service import JobsService
+
+logger = logging.getLogger(__name__)
+
+# SENT 행 정리 주기 / 한 번에 삭제하는 최대 행 수
+_PRUNE_INTERVAL_SEC = 3600
+_PRUNE_BATCH_SIZE = 10_000
+
+
+class OutboxService:
+    @staticmethod
+    def add_job(
+        db: AsyncSession,
+        task_name: str,
+        payload: dict[str, Any],
+        queue: str | None = None,
+        priority: int | None = None,
+    ) -> OutboxJob:
+        """outbox에 작업 기록 (호출자의 트랜잭션과 함께 커밋됨)"""
+        job = OutboxJob(
+            task_name=task_name,
+            task_id=str(uuid4()),
+            payload=payload,
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            created_at=datetime.utcnow(),
+            queue=queue,
+            priority=priority,
+        )
+        db.add(job)
+        return job
+
+    @staticmethod
+    def _send_options(job: OutboxJob) -> dict[str, Any]:
+        options: dict[str, Any] = {}
+        if job.queue is not None:
+            options["queue"] = job.queue
+        if job.priority is not None:
+            options["priority"] = job.priority
+        return options
+
+    @staticmethod
+    def _retry_delay_sec(attempts: int) -> float:
+        """attempts번 실패한 작업의 다음 재시도까지 대기 시간 (exponential backoff)"""
+        settings = get_settings()
+        return min(settings.outbox_retry_base_sec * 2 ** max(attempts - 1, 0), settings.outbox_retry_max_sec)
+
+    @staticmethod
+    async def dispatch_pending(db: AsyncSession, limit: int | None = None) -> int:
+        """대기 중인 작업을 한 번에 가져와 발행하고 SENT로 표시
+
+        FOR UPDATE SKIP LOCKED로 가져오므로 여러 dispatcher가 동시에 실행되어도 중복 발행하지 않습니다.
+        발행에 실패한 작업은 next_attempt_at까지 건너뜁니다 (broker 장애 동안 시도 횟수를 빠르게 소진하지 않도록).
+
+        Returns:
+            발행한 작업 수
+        """
+        settings = get_settings()
+        result = await db.execute(
+            select(OutboxJob)
+            .where(
+                OutboxJob.status == OutboxStatus.PENDING,
+                or_(OutboxJob.next_attempt_at.is_(None), OutboxJob.next_attempt_at <= datetime.utcnow()),
+            )
+            .order_by(OutboxJob.id)
+            .limit(limit or settings.outbox_batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = result.scalars().all()
+        if not jobs:
+            await db.rollback()
+            return 0
+
+        # 발행은 동기 broker I/O이므로 스레드에서 실행
+        errors = await asyncio.to_thread(
+            publish_tasks,
+            [(job.task_name, job.task_id, job.payload, OutboxService._send_options(job)) for job in jobs],
+        )
+
+        sent_task_ids: list[str] = []
+        failed: dict[str, str] = {}
+        now = datetime.utcnow()
+        for job, error in zip(jobs, errors):
+            job.attempts += 1
+            if error is None:
+                job.status = OutboxStatus.SENT
+                job.sent_at = now
+                job.last_error = None
+                job.next_attempt_at = None
+                sent_task_ids.append(job.task_id)
+            else:
+                job.last_error = str(error)[:500]
+                if job.attempts >= settings.outbox_max_attempts:
+                    job.status = OutboxStatus.FAILED
+                    failed[job.task_id] = job.last_error
+                else:
+                    job.next_attempt_at = now + timedelta(seconds=OutboxService._retry_delay_sec(job.attempts))
+                logger.warning("Outbox publish failed job_id=%s task=%s: %s", job.id, job.task_name, error)
+
+        await JobsService.mark_queued(db, sent_task_ids, now)
+        for task_id, error in failed.items():
+            await JobsService.mark_failed(db, [task_id], f"Outbox publish failed: {error}")
+        await db.commit()
+        return len(sent_task_ids)
+
+    @staticmethod
+    async def prune_sent(db: AsyncSession) -> int:
+        """보관 기간이 지난 SENT 행 삭제 (한 번에 최대 _PRUNE_BATCH_SIZE개)
+
+        Returns:
+            삭제한 행 수
+        """
+        retention_sec = get_settings().outbox_sent_retention_sec
+        if retention_sec <= 0:
+            return 0
+        expired = (
+            select(OutboxJob.id)
+            .where(
+                OutboxJob.status == OutboxStatus.SENT,
+                OutboxJob.sent_at < datetime.utcnow() - timedelta(seconds=retention_sec),
+            )
+            .limit(_PRUNE_BATCH_SIZE)
+        )
+        result = await db.execute(delete(OutboxJob).where(OutboxJob.id.in_(expired.scalar_subquery())))
+        await db.commit()
+        return result.rowcount
+
+    @staticmethod
+    async def dispatch_now() -> None:
+        """새 session으로 한 번 발행 (요청 처리 후 background task로 사용)"""
+        try:
+            async with get_sessionmaker()() as session:
+                while await OutboxService.dispatch_pending(session) >= get_settings().outbox_batch_size:
+                    pass
+        except Exception:
+            logger.exception("Outbox dispatch failed")
+
+    @staticmethod
+    async def run_dispatcher(stop_event: asyncio.Event) -> None:
+        """stop_event가 설정될 때까지 주기적으로 발행 (커밋 직후 발행이 실패한 작업 재시도용)
+
+        _PRUNE_INTERVAL_SEC마다 보관 기간이 지난 SENT 행도 정리합니다.
+        """
+        interval = get_settings().outbox_poll_interval_sec
+        loop = asyncio.get_running_loop()
+        next_prune = loop.time()
+        while not stop_event.is_set():
+            await OutboxService.dispatch_now()
+            if loop.time() >= next_prune:
+                next_prune = loop.time() + _PRUNE_INTERVAL_SEC
+                try:
+                    async with get_sessionmaker()() as session:
+                        pruned = await OutboxService.prune_sent(session)
+                    if pruned:
+                        logger.info("Pruned %d sent outbox jobs", pruned)
+                except Exception:
+                    logger.exception("Outbox prune failed")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+if __name__ == "__main__":
+    # 별도 프로세스로 실행: python -m app.services.outbox_service
+    from app.core.logging import logger as _app_logger  # noqa: F401  (로깅 설정)
+    from app.db.engine import dispose_engine
+
+    async def _main() -> None:
+        try:
+            await OutboxService.run_dispatcher(asyncio.Event())
+        finally:
+            await dispose_engine()
+
+    asyncio.run(_main())
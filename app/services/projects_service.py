@@ -1,13 +1,16 @@
+import asyncio
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.errors import NotFoundError
-from app.models import Project, Track, SkeletonLayer
+from app.models import Project, Track, SkeletonLayer, SkeletonSource
 from app.schemas.project import ProjectCreate, ProjectResponse, EditStateResponse, TrackEditState, LayerEditState
 from app.schemas.keyframe import KeyframeResponse
+from app.services.assets_service import AssetsService
+from app.services.timeline_service import TimelineService
 
 
 class ProjectsService:
@@ -36,6 +39,34 @@ class ProjectsService:
 
         return ProjectResponse.model_validate(project)
 
+    @staticmethod
+    async def lock_project(db: AsyncSession, project_id: int | None = None, track_id: int | None = None) -> int | None:
+        """프로젝트 행 잠금 후 project_id 반환 (없으면 None)
+
+        편집 경로는 모두 Project -> Track 순서로 잠가야 하므로, 트랙 행을 수정하기 전에 먼저 호출합니다.
+        (batch_update_layers와 단일 레이어/키프레임 편집이 반대 순서로 잠그면 deadlock 발생)
+        """
+        if project_id is None:
+            project_id = select(Track.project_id).where(Track.id == track_id).scalar_subquery()
+        result = await db.execute(select(Project.id).where(Project.id == project_id).with_for_update())
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def bump_revision(db: AsyncSession, project_id: int | None = None, track_id: int | None = None) -> int:
+        """프로젝트 revision 증가 후 새 값 반환 (project_id 또는 track_id로 지정)
+
+        클라이언트는 이 값을 X-Min-Project-Revision 헤더로 보내 read-your-writes를 보장받습니다.
+        """
+        if project_id is None:
+            project_id = select(Track.project_id).where(Track.id == track_id).scalar_subquery()
+        result = await db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(revision=Project.revision + 1, updated_at=datetime.utcnow())
+            .returning(Project.revision)
+        )
+        return result.scalar_one()
+
     @staticmethod
     async def get_project(db: AsyncSession, project_id: int) -> ProjectResponse:
         """프로젝트 조회"""
@@ -65,8 +96,20 @@ class ProjectsService:
         return [ProjectResponse.model_validate(p) for p in projects]
 
     @staticmethod
-    async def get_edit_state(db: AsyncSession, project_id: int) -> EditStateResponse:
-        """프로젝트 edit-state 조회 (프론트 렌더링용 전체 상태)"""
+    async def get_edit_state(
+        db: AsyncSession,
+        project_id: int,
+        include_urls: bool = False,
+        include_timeline: bool = False,
+        lod: int | None = None,
+    ) -> EditStateResponse:
+        """프로젝트 edit-state 조회 (프론트 렌더링용 전체 상태)
+
+        include_urls=True 이면 스켈레톤/음악 object key의 presigned GET URL을 함께 반환합니다.
+        include_timeline=True 이면 트랙별 활성 레이어 구간을 함께 반환합니다.
+        lod가 주어지면 레이어마다 factor가 lod 이하인 가장 거친 LOD 레벨을 고르고,
+        include_urls=True 이면 전체 스켈레톤 대신 그 레벨의 URL을 반환합니다.
+        """
         # 프로젝트 조회
         project_result = await db.execute(select(Project).where(Project.id == project_id))
         project = project_result.scalar_one_or_none()
@@ -74,14 +117,14 @@ class ProjectsService:
         if not project:
             raise NotFoundError("Project", project_id)
 
-        # 트랙 조회 (레이어, 소스, 키프레임 포함)
+        # 트랙 조회 (레이어, 소스, 키프레임 포함, lod 요청 시 LOD 레벨 포함)
+        source_loader = selectinload(Track.layers).selectinload(SkeletonLayer.source)
+        if lod is not None:
+            source_loader = source_loader.selectinload(SkeletonSource.levels)
         tracks_result = await db.execute(
             select(Track)
             .where(Track.project_id == project_id)
-            .options(
-                selectinload(Track.layers).selectinload(SkeletonLayer.source),
-                selectinload(Track.keyframes),
-            )
+            .options(source_loader, selectinload(Track.keyframes))
             .order_by(Track.slot)
         )
         tracks = tracks_result.scalars().all()
@@ -93,6 +136,10 @@ class ProjectsService:
             layers = []
             for layer in track.layers:
                 source = layer.source
+                # levels는 factor 오름차순
+                lod_level = None
+                if lod is not None:
+                    lod_level = next((lv for lv in reversed(source.levels) if lv.factor <= lod), None)
                 layers.append(
                     LayerEditState(
                         id=layer.id,
@@ -106,24 +153,54 @@ class ProjectsService:
                         source_fps=source.fps,
                         source_num_frames=source.num_frames,
                         source_num_joints=source.num_joints,
+                        source_lod_factor=lod_level.factor if lod_level else None,
+                        source_lod_object_key=lod_level.object_key if lod_level else None,
+                        source_lod_num_frames=lod_level.num_frames if lod_level else None,
                     )
                 )
 
             # 키프레임 구성
             keyframes = [KeyframeResponse.model_validate(kf) for kf in sorted(track.keyframes, key=lambda k: k.time_sec)]
 
+            timeline = None
+            if include_timeline:
+                timeline = TimelineService.to_segments(
+                    TimelineService.from_layers(track.id, track.layers_revision, track.layers).segments
+                )
+
             track_states.append(
                 TrackEditState(
                     id=track.id,
                     slot=track.slot,
                     display_name=track.display_name,
+                    revision=track.revision,
                     layers=layers,
                     keyframes=keyframes,
+                    timeline=timeline,
                 )
             )
 
-        return EditStateResponse(
+        response = EditStateResponse(
             project=ProjectResponse.model_validate(project),
             tracks=track_states,
         )
 
+        if include_urls:
+            object_keys = [
+                layer.source_lod_object_key or layer.source_object_key
+                for track_state in track_states
+                for layer in track_state.layers
+                if layer.source_lod_object_key or layer.source_object_key
+            ]
+            if project.music_object_key:
+                object_keys.append(project.music_object_key)
+            if object_keys:
+                # presign 서명은 동기 연산이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                response.urls, response.urls_expires_in = await asyncio.to_thread(
+                    AssetsService.get_presigned_urls_with_expiry, object_keys
+                )
+            else:
+                response.urls, response.urls_expires_in = {}, None
+
+        return response
+
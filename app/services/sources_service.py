@@ -0,0 +1,73 @@
+import math
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import ConflictError, NotFoundError, ValidationError
+from app.integrations.skeleton_chunks import SKELETON_CHUNK_FORMAT, chunk_object_key, overlapping_chunks
+from app.models import AssetStatus, SkeletonSource
+from app.schemas.source import SourceFrameChunk, SourceFramesResponse
+from app.services.assets_service import AssetsService
+
+
+class SourcesService:
+    @staticmethod
+    async def get_frames(
+        db: AsyncSession,
+        source_id: int,
+        from_sec: float | None = None,
+        to_sec: float | None = None,
+    ) -> SourceFramesResponse:
+        """소스 시각 [from, to] 구간과 겹치는 프레임 chunk의 presigned URL 조회
+
+        시각은 소스(원본 영상) 기준이며, 생략하면 처음 / 끝까지입니다.
+        """
+        source = await db.get(SkeletonSource, source_id)
+        if not source:
+            raise NotFoundError("SkeletonSource", source_id)
+        if (
+            source.status != AssetStatus.READY
+            or not source.chunk_prefix
+            or not source.chunk_frames
+            or not source.fps
+            or source.num_frames is None
+        ):
+            raise ConflictError(f"SkeletonSource {source_id} has no frame chunks (status={source.status.value})")
+
+        fps = source.fps
+        t0 = from_sec if from_sec is not None else 0.0
+        t1 = to_sec if to_sec is not None else source.num_frames / fps
+        if t1 < t0:
+            raise ValidationError("'to' must be greater than or equal to 'from'")
+
+        # t1 시각에 표시되는 프레임까지 포함
+        indices = overlapping_chunks(
+            source.num_frames, source.chunk_frames, math.floor(t0 * fps), math.floor(t1 * fps) + 1
+        )
+        keys = [chunk_object_key(source.chunk_prefix, index) for index in indices]
+        urls, expires_in = AssetsService.get_presigned_urls_with_expiry(keys) if keys else ({}, 0)
+
+        chunks = []
+        for index, key in zip(indices, keys):
+            start = index * source.chunk_frames
+            end = min(start + source.chunk_frames, source.num_frames)
+            chunks.append(
+                SourceFrameChunk(
+                    index=index,
+                    start_frame=start,
+                    end_frame=end,
+                    start_sec=start / fps,
+                    end_sec=end / fps,
+                    url=urls[key],
+                )
+            )
+
+        return SourceFramesResponse(
+            source_id=source.id,
+            format=SKELETON_CHUNK_FORMAT,
+            fps=fps,
+            num_frames=source.num_frames,
+            num_joints=source.num_joints,
+            chunk_frames=source.chunk_frames,
+            chunks=chunks,
+            expires_in=expires_in,
+        )
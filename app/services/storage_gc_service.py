@@ -0,0 +1,296 @@
+"""참조되지 않는 MinIO 객체 / SkeletonSource 정리 (GC)
+
+워커 beat로 주기 실행되며, 별도로 실행하려면 다음을 사용합니다.
+
+    python -m app.services.storage_gc_service [--dry-run]
+"""
+
+import asyncio
+import logging
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Iterator
+
+from minio.deleteobjects import DeleteObject
+from sqlalchemy import delete, exists, func, select, union
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.integrations.minio_client import get_minio_client
+from app.models import (
+    AssetStatus,
+    Job,
+    JobStatus,
+    MediaObject,
+    Project,
+    SkeletonLayer,
+    SkeletonSource,
+    SkeletonSourceLevel,
+    Video,
+)
+from app.services.media_service import MediaService
+
+logger = logging.getLogger(__name__)
+
+# 아직 워커가 소스를 사용 중일 수 있는 작업 상태
+_ACTIVE_JOB_STATUSES = (JobStatus.PENDING, JobStatus.QUEUED, JobStatus.STARTED, JobStatus.RETRYING)
+
+_CHECKPOINT_KEY = re.compile(r"^checkpoints/skeleton/(\d+)/")
+# 프레임 chunk 객체 ({chunk_prefix}index.json, {chunk_prefix}chunks/...)
+_FRAME_CHUNK_KEY = re.compile(r"^(.+/)(?:index\.json|chunks/[^/]+)$")
+
+# MinIO remove_objects 한 요청의 최대 key 수
+_MAX_DELETE_BATCH = 1000
+
+
+@dataclass
+class StorageGcReport:
+    """GC 실행 결과 (dry_run이면 삭제 대상 수)"""
+
+    dry_run: bool
+    sources_deleted: int = 0
+    media_objects_deleted: int = 0
+    orphan_objects_deleted: int = 0
+    objects_scanned: int = 0
+    bytes_reclaimed: int = 0
+    delete_errors: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _bucket() -> str:
+    bucket = get_settings().minio_bucket
+    if not bucket:
+        raise ValueError("MinIO bucket not configured")
+    return bucket
+
+
+def _remove_objects(bucket: str, object_keys: list[str]) -> set[str]:
+    """객체 일괄 삭제 후 삭제하지 못한 key 반환 (없는 객체는 성공으로 처리됨)"""
+    failed: set[str] = set()
+    client = get_minio_client()
+    for start in range(0, len(object_keys), _MAX_DELETE_BATCH):
+        batch = object_keys[start : start + _MAX_DELETE_BATCH]
+        # remove_objects는 lazy iterator이므로 끝까지 소비해야 실제로 삭제됨
+        for error in client.remove_objects(bucket, [DeleteObject(key) for key in batch]):
+            logger.warning("Failed to delete object %s: %s", error.name, error.message)
+            failed.add(error.name)
+    return failed
+
+
+def _next_batch(objects: Iterator[Any], size: int) -> list[Any]:
+    return list(islice(objects, size))
+
+
+class StorageGcService:
+    @staticmethod
+    async def delete_orphan_sources(
+        db: AsyncSession, cutoff: datetime, batch_size: int, report: StorageGcReport
+    ) -> None:
+        """레이어가 참조하지 않고 진행 중 작업도 없는 SkeletonSource 삭제 (원본 영상 참조 해제)
+
+        스켈레톤 JSON, checkpoint 객체는 참조가 사라지므로 이후 객체 sweep에서 삭제됩니다.
+        """
+        orphan = (
+            ~exists().where(SkeletonLayer.skeleton_source_id == SkeletonSource.id),
+            ~exists().where(Job.skeleton_source_id == SkeletonSource.id, Job.status.in_(_ACTIVE_JOB_STATUSES)),
+            SkeletonSource.created_at < cutoff,
+        )
+        if report.dry_run:
+            result = await db.execute(select(func.count()).select_from(SkeletonSource).where(*orphan))
+            report.sources_deleted = result.scalar_one()
+            return
+
+        while True:
+            # 다른 GC 실행과 겹치지 않도록 잠긴 행은 건너뜀 (새 레이어가 참조하려는 소스는 FK 잠금으로 대기)
+            result = await db.execute(
+                select(SkeletonSource)
+                .where(*orphan)
+                .order_by(SkeletonSource.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            sources = result.scalars().all()
+            if not sources:
+                return
+            for source in sources:
+                await MediaService.release(db, source.video_object_key)
+            await db.execute(delete(SkeletonSource).where(SkeletonSource.id.in_([s.id for s in sources])))
+            await db.commit()
+            report.sources_deleted += len(sources)
+            if len(sources) < batch_size:
+                return
+
+    @staticmethod
+    async def delete_released_media(
+        db: AsyncSession, cutoff: datetime, batch_size: int, report: StorageGcReport
+    ) -> None:
+        """참조 수가 0이 된 지 grace 기간이 지난 content-addressed 객체 삭제
+
+        행을 잠근 채 객체를 먼저 지우고 행을 삭제하므로, 그 사이 같은 내용을 다시 저장하는 업로드는
+        행 잠금을 기다렸다가 새 행을 삽입하고 객체를 다시 업로드합니다.
+        """
+        released = (MediaObject.ref_count == 0, MediaObject.released_at < cutoff)
+        if report.dry_run:
+            result = await db.execute(
+                select(func.count(), func.coalesce(func.sum(MediaObject.size_bytes), 0)).where(*released)
+            )
+            count, size = result.one()
+            report.media_objects_deleted = count
+            report.bytes_reclaimed += int(size)
+            return
+
+        bucket = _bucket()
+        while True:
+            result = await db.execute(
+                select(MediaObject)
+                .where(*released)
+                .order_by(MediaObject.released_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            media = result.scalars().all()
+            if not media:
+                return
+            failed = await asyncio.to_thread(_remove_objects, bucket, [m.object_key for m in media])
+            deleted = [m for m in media if m.object_key not in failed]
+            if deleted:
+                await db.execute(delete(MediaObject).where(MediaObject.id.in_([m.id for m in deleted])))
+            await db.commit()
+            report.media_objects_deleted += len(deleted)
+            report.bytes_reclaimed += sum(m.size_bytes for m in deleted)
+            report.delete_errors += len(failed)
+            # 삭제 실패한 행만 남은 경우 같은 행을 계속 다시 고르지 않도록 종료
+            if len(media) < batch_size or not deleted:
+                return
+
+    @staticmethod
+    async def referenced_keys(db: AsyncSession, object_keys: list[str]) -> set[str]:
+        """주어진 key 중 DB가 참조하는 key
+
+        checkpoint 객체는 해당 소스가 아직 추출 중(PROCESSING)일 때만 참조된 것으로 보고,
+        프레임 chunk 객체는 소스의 chunk_prefix 아래에 있으면 참조된 것으로 봅니다.
+        """
+        columns = (
+            SkeletonSource.object_key,
+            SkeletonSource.video_object_key,
+            Project.music_object_key,
+            Video.object_key,
+            MediaObject.object_key,
+            SkeletonSourceLevel.object_key,
+        )
+        result = await db.execute(union(*(select(column).where(column.in_(object_keys)) for column in columns)))
+        referenced = set(result.scalars().all())
+
+        checkpoint_sources: dict[str, int] = {}
+        for key in object_keys:
+            match = _CHECKPOINT_KEY.match(key)
+            if match:
+                checkpoint_sources[key] = int(match.group(1))
+        if checkpoint_sources:
+            result = await db.execute(
+                select(SkeletonSource.id).where(
+                    SkeletonSource.id.in_(set(checkpoint_sources.values())),
+                    SkeletonSource.status == AssetStatus.PROCESSING,
+                )
+            )
+            processing = set(result.scalars().all())
+            referenced.update(key for key, source_id in checkpoint_sources.items() if source_id in processing)
+
+        chunk_prefixes: dict[str, str] = {}
+        for key in object_keys:
+            match = _FRAME_CHUNK_KEY.match(key)
+            if match:
+                chunk_prefixes[key] = match.group(1)
+        if chunk_prefixes:
+            result = await db.execute(
+                select(SkeletonSource.chunk_prefix).where(SkeletonSource.chunk_prefix.in_(set(chunk_prefixes.values())))
+            )
+            live = set(result.scalars().all())
+            referenced.update(key for key, prefix in chunk_prefixes.items() if prefix in live)
+
+        return referenced
+
+    @staticmethod
+    async def sweep_unreferenced_objects(
+        db: AsyncSession, cutoff: datetime, batch_size: int, report: StorageGcReport
+    ) -> None:
+        """버킷 객체 목록을 스트리밍하며 DB가 참조하지 않는 객체 삭제
+
+        업로드 후 DB 커밋 전에 삭제되지 않도록 grace 기간보다 최근에 수정된 객체는 건너뜁니다.
+        (실패한 업로드, 삭제된 소스의 스켈레톤 JSON / checkpoint 등)
+        """
+        settings = get_settings()
+        bucket = _bucket()
+        client = get_minio_client()
+        prefixes = [p.strip() for p in settings.storage_gc_prefixes.split(",") if p.strip()]
+        cutoff_utc = cutoff.replace(tzinfo=timezone.utc)
+
+        for prefix in prefixes:
+            objects = client.list_objects(bucket, prefix=prefix, recursive=True)
+            while True:
+                batch = await asyncio.to_thread(_next_batch, objects, batch_size)
+                if not batch:
+                    break
+                report.objects_scanned += len(batch)
+                candidates = {
+                    obj.object_name: obj.size or 0
+                    for obj in batch
+                    if not obj.is_dir and obj.last_modified is not None and obj.last_modified < cutoff_utc
+                }
+                if not candidates:
+                    continue
+                referenced = await StorageGcService.referenced_keys(db, list(candidates))
+                # 조회 트랜잭션을 길게 유지하지 않음
+                await db.rollback()
+                orphans = [key for key in candidates if key not in referenced]
+                if not orphans:
+                    continue
+                failed = set() if report.dry_run else await asyncio.to_thread(_remove_objects, bucket, orphans)
+                deleted = [key for key in orphans if key not in failed]
+                report.orphan_objects_deleted += len(deleted)
+                report.bytes_reclaimed += sum(candidates[key] for key in deleted)
+                report.delete_errors += len(failed)
+
+    @staticmethod
+    async def run(sessionmaker: async_sessionmaker[AsyncSession], dry_run: bool = False) -> StorageGcReport:
+        """GC 전체 실행: 고아 소스 삭제 -> 해제된 미디어 삭제 -> 참조 없는 객체 sweep"""
+        settings = get_settings()
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.storage_gc_grace_sec)
+        batch_size = max(1, min(settings.storage_gc_batch_size, _MAX_DELETE_BATCH))
+        report = StorageGcReport(dry_run=dry_run)
+
+        async with sessionmaker() as session:
+            await StorageGcService.delete_orphan_sources(session, cutoff, batch_size, report)
+        async with sessionmaker() as session:
+            await StorageGcService.delete_released_media(session, cutoff, batch_size, report)
+        async with sessionmaker() as session:
+            await StorageGcService.sweep_unreferenced_objects(session, cutoff, batch_size, report)
+
+        logger.info("Storage GC finished: %s", report.as_dict())
+        return report
+
+
+if __name__ == "__main__":
+    # 별도 프로세스로 실행: python -m app.services.storage_gc_service [--dry-run]
+    import argparse
+    import json
+
+    from app.core.logging import logger as _app_logger  # noqa: F401  (로깅 설정)
+    from app.db.engine import dispose_engine
+    from app.db.session import get_sessionmaker
+
+    parser = argparse.ArgumentParser(description="참조되지 않는 MinIO 객체 / SkeletonSource 정리")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 수와 용량만 출력")
+    args = parser.parse_args()
+
+    async def _main() -> StorageGcReport:
+        try:
+            return await StorageGcService.run(get_sessionmaker(), dry_run=args.dry_run)
+        finally:
+            await dispose_engine()
+
+    print(json.dumps(asyncio.run(_main()).as_dict(), indent=2))
@@ -0,0 +1,252 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import NotFoundError
+from app.models import SkeletonLayer, Track
+from app.schemas.timeline import TimelineResponse, TimelineSegment
+
+
+class LayerSpan(NamedTuple):
+    """타임라인 계산에 필요한 레이어 정보"""
+
+    id: int
+    start_sec: Decimal
+    end_sec: Decimal
+    priority: int
+
+
+class Segment(NamedTuple):
+    start_sec: Decimal
+    end_sec: Decimal
+    layer_id: int
+
+
+def resolve_segments(
+    layers: Iterable[LayerSpan],
+    window_start: Decimal | None = None,
+    window_end: Decimal | None = None,
+) -> list[Segment]:
+    """sweep line으로 활성 레이어 구간 계산
+
+    각 시각에서 겹치는 레이어 중 priority가 가장 높은 레이어가 활성이며,
+    priority가 같으면 나중에 생성된(id가 큰) 레이어가 우선합니다.
+    window가 주어지면 그 구간으로 잘라서 계산합니다.
+    """
+    spans = []
+    for span in layers:
+        start = span.start_sec if window_start is None else max(span.start_sec, window_start)
+        end = span.end_sec if window_end is None else min(span.end_sec, window_end)
+        if start < end:
+            spans.append(span._replace(start_sec=start, end_sec=end))
+    if not spans:
+        return []
+
+    spans.sort(key=lambda s: s.start_sec)
+    boundaries = sorted({s.start_sec for s in spans} | {s.end_sec for s in spans})
+
+    segments: list[Segment] = []
+    heap: list[tuple[int, int, Decimal]] = []  # (-priority, -id, end_sec)
+    next_span = 0
+    for left, right in zip(boundaries, boundaries[1:]):
+        while next_span < len(spans) and spans[next_span].start_sec <= left:
+            span = spans[next_span]
+            heapq.heappush(heap, (-span.priority, -span.id, span.end_sec))
+            next_span += 1
+        # 이미 끝난 레이어는 top에 올라올 때 제거 (lazy deletion)
+        while heap and heap[0][2] <= left:
+            heapq.heappop(heap)
+        if not heap:
+            continue
+        layer_id = -heap[0][1]
+        if segments and segments[-1].layer_id == layer_id and segments[-1].end_sec == left:
+            segments[-1] = segments[-1]._replace(end_sec=right)
+        else:
+            segments.append(Segment(left, right, layer_id))
+    return segments
+
+
+class TrackTimeline:
+    """트랙의 평탄화된 활성 레이어 구간 목록과 구간 인덱스
+
+    구간은 서로 겹치지 않고 시작 시각 순으로 정렬되어 있으므로
+    시작 시각 배열에 대한 이진 탐색으로 점/범위 질의를 O(log n)에 처리합니다.
+    """
+
+    def __init__(self, revision: int, layers: Iterable[LayerSpan]):
+        self.revision = revision
+        self._layers: dict[int, LayerSpan] = {span.id: span for span in layers}
+        self._segments = resolve_segments(self._layers.values())
+        self._starts = [seg.start_sec for seg in self._segments]
+
+    @property
+    def segments(self) -> list[Segment]:
+        return list(self._segments)
+
+    def at(self, t: Decimal) -> Segment | None:
+        """시각 t에 활성인 구간"""
+        i = bisect_right(self._starts, t) - 1
+        if i >= 0 and t < self._segments[i].end_sec:
+            return self._segments[i]
+        return None
+
+    def between(self, t0: Decimal, t1: Decimal) -> list[Segment]:
+        """[t0, t1]과 겹치는 구간"""
+        lo = max(bisect_right(self._starts, t0) - 1, 0)
+        if lo < len(self._segments) and self._segments[lo].end_sec <= t0:
+            lo += 1
+        hi = bisect_right(self._starts, t1)
+        if hi > lo and self._segments[hi - 1].start_sec == t1 and t1 > t0:
+            hi -= 1
+        return self._segments[lo:hi]
+
+    def apply(self, revision: int, layer_id: int, span: LayerSpan | None) -> None:
+        """레이어 하나의 추가/수정(span)/삭제(None)를 반영
+
+        변경 전후 레이어가 차지하는 구간만 다시 계산하여 기존 구간 목록에 이어 붙입니다.
+        """
+        old = self._layers.pop(layer_id, None)
+        if span is not None:
+            self._layers[layer_id] = span
+        self.revision = revision
+
+        dirty = [s for s in (old, span) if s is not None and s.start_sec < s.end_sec]
+        if not dirty:
+            return
+        w0 = min(s.start_sec for s in dirty)
+        w1 = max(s.end_sec for s in dirty)
+
+        overlapping = [s for s in self._layers.values() if s.start_sec < w1 and s.end_sec > w0]
+        middle = resolve_segments(overlapping, w0, w1)
+
+        # 구간 [w0, w1] 밖의 기존 구간 유지 (경계를 걸친 구간은 잘라냄)
+        lo = bisect_left(self._starts, w0)
+        head = self._segments[:lo]
+        if head and head[-1].end_sec > w0:
+            crossing = head[-1]
+            head[-1] = crossing._replace(end_sec=w0)
+        else:
+            crossing = None
+        hi = bisect_left(self._starts, w1)
+        tail = self._segments[hi:]
+        if hi > 0 and self._segments[hi - 1].end_sec > w1:
+            tail.insert(0, self._segments[hi - 1]._replace(start_sec=w1))
+        elif crossing is not None and crossing.end_sec > w1:
+            tail.insert(0, crossing._replace(start_sec=w1))
+
+        merged: list[Segment] = []
+        for seg in head + middle + tail:
+            if merged and merged[-1].layer_id == seg.layer_id and merged[-1].end_sec == seg.start_sec:
+                merged[-1] = merged[-1]._replace(end_sec=seg.end_sec)
+            else:
+                merged.append(seg)
+        self._segments = merged
+        self._starts = [seg.start_sec for seg in merged]
+
+
+# track_id -> TrackTimeline (layers_revision이 DB와 다르면 다시 계산)
+_TIMELINE_CACHE_SIZE = 1024
+_timelines: OrderedDict[int, TrackTimeline] = OrderedDict()
+
+
+class TimelineService:
+    @staticmethod
+    def to_span(layer: SkeletonLayer) -> LayerSpan:
+        return LayerSpan(layer.id, layer.start_sec, layer.end_sec, layer.priority)
+
+    @staticmethod
+    def _cache_put(track_id: int, timeline: TrackTimeline) -> None:
+        _timelines[track_id] = timeline
+        _timelines.move_to_end(track_id)
+        while len(_timelines) > _TIMELINE_CACHE_SIZE:
+            _timelines.popitem(last=False)
+
+    @staticmethod
+    def from_layers(track_id: int, revision: int, layers: Iterable[SkeletonLayer]) -> TrackTimeline:
+        """이미 조회된 레이어로 타임라인 반환 (캐시 revision이 같으면 재사용)"""
+        cached = _timelines.get(track_id)
+        if cached is not None and cached.revision == revision:
+            _timelines.move_to_end(track_id)
+            return cached
+        timeline = TrackTimeline(revision, (TimelineService.to_span(layer) for layer in layers))
+        TimelineService._cache_put(track_id, timeline)
+        return timeline
+
+    @staticmethod
+    async def get_timeline(db: AsyncSession, track_id: int) -> TrackTimeline:
+        """트랙 타임라인 조회 (캐시 우선)"""
+        revision_result = await db.execute(select(Track.layers_revision).where(Track.id == track_id))
+        revision = revision_result.scalar_one_or_none()
+
+        if revision is None:
+            raise NotFoundError("Track", track_id)
+
+        cached = _timelines.get(track_id)
+        if cached is not None and cached.revision == revision:
+            _timelines.move_to_end(track_id)
+            return cached
+
+        result = await db.execute(
+            select(SkeletonLayer.id, SkeletonLayer.start_sec, SkeletonLayer.end_sec, SkeletonLayer.priority).where(
+                SkeletonLayer.track_id == track_id
+            )
+        )
+        timeline = TrackTimeline(revision, (LayerSpan(*row) for row in result.all()))
+        TimelineService._cache_put(track_id, timeline)
+        return timeline
+
+    @staticmethod
+    def apply_layer_change(track_id: int, revision: int, layer_id: int, span: LayerSpan | None) -> None:
+        """커밋된 레이어 변경을 캐시에 점진 반영
+
+        캐시가 바로 이전 revision일 때만 점진 갱신하고, 아니면(다른 인스턴스에서 변경 등) 버립니다.
+        """
+        TimelineService.apply_layer_changes(track_id, revision, [(layer_id, span)])
+
+    @staticmethod
+    def apply_layer_changes(track_id: int, revision: int, changes: list[tuple[int, LayerSpan | None]]) -> None:
+        """한 revision에 커밋된 여러 레이어 변경을 캐시에 점진 반영"""
+        cached = _timelines.get(track_id)
+        if cached is None:
+            return
+        if cached.revision != revision - 1:
+            _timelines.pop(track_id, None)
+            return
+        for layer_id, span in changes:
+            cached.apply(revision, layer_id, span)
+
+    @staticmethod
+    def to_segments(segments: Iterable[Segment]) -> list[TimelineSegment]:
+        return [TimelineSegment(start_sec=s.start_sec, end_sec=s.end_sec, layer_id=s.layer_id) for s in segments]
+
+    @staticmethod
+    async def get_track_timeline(
+        db: AsyncSession,
+        track_id: int,
+        at: Decimal | None = None,
+        from_sec: Decimal | None = None,
+        to_sec: Decimal | None = None,
+    ) -> TimelineResponse:
+        """트랙 활성 레이어 타임라인 조회 (at: 점 질의, from/to: 범위 질의)"""
+        timeline = await TimelineService.get_timeline(db, track_id)
+
+        if at is not None:
+            segment = timeline.at(at)
+            segments = [segment] if segment is not None else []
+        elif from_sec is not None or to_sec is not None:
+            t0 = from_sec if from_sec is not None else Decimal(0)
+            t1 = to_sec if to_sec is not None else Decimal("Infinity")
+            segments = timeline.between(t0, t1)
+        else:
+            segments = timeline.segments
+
+        return TimelineResponse(
+            track_id=track_id,
+            revision=timeline.revision,
+            segments=TimelineService.to_segments(segments),
+        )
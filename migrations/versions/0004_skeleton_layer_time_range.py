@@ -0,0 +1,35 @@
+"""add skeleton layer time range with gist index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (track_id, time_range) 복합 GiST 인덱스에 정수 컬럼을 넣기 위해 필요
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute("""
+        ALTER TABLE skeleton_layers
+        ADD COLUMN time_range numrange
+        GENERATED ALWAYS AS (numrange(start_sec, end_sec, '[)')) STORED
+    """)
+    op.execute("""
+        CREATE INDEX idx_skeleton_layers_track_time_range
+        ON skeleton_layers USING gist (track_id, time_range)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_skeleton_layers_track_time_range")
+    op.execute("ALTER TABLE skeleton_layers DROP COLUMN IF EXISTS time_range")
@@ -0,0 +1,56 @@
+"""add jobs
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_STATUSES = ("PENDING", "QUEUED", "STARTED", "RETRYING", "SUCCEEDED", "FAILED", "REVOKED")
+
+
+def upgrade() -> None:
+    op.execute(f"""
+        DO $$ BEGIN
+            CREATE TYPE jobstatus AS ENUM ({", ".join(f"'{s}'" for s in JOB_STATUSES)});
+        EXCEPTION
+            WHEN duplicate_object THEN null;
+        END $$;
+    """)
+
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("skeleton_source_id", sa.Integer(), nullable=False),
+        sa.Column("task_name", sa.String(length=255), nullable=False),
+        sa.Column("task_id", sa.String(length=64), nullable=False),
+        sa.Column("status", postgresql.ENUM(*JOB_STATUSES, name="jobstatus", create_type=False), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("worker_hostname", sa.String(length=255), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("queued_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["skeleton_source_id"], ["skeleton_sources.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("task_id"),
+    )
+    op.create_index("idx_jobs_source", "jobs", ["skeleton_source_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_source", table_name="jobs")
+    op.drop_table("jobs")
+    op.execute("DROP TYPE IF EXISTS jobstatus")
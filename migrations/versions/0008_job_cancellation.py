@@ -0,0 +1,28 @@
+"""add job cancellation
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TYPE jobstatus ADD VALUE IF NOT EXISTS 'CANCELLED'")
+    op.add_column("jobs", sa.Column("cancel_requested_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    # enum 값은 제거할 수 없으므로 CANCELLED는 남겨둠
+    op.execute("UPDATE jobs SET status = 'FAILED' WHERE status = 'CANCELLED'")
+    op.drop_column("jobs", "cancel_requested_at")
@@ -0,0 +1,31 @@
+"""add job queue routing
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("outbox_jobs", sa.Column("queue", sa.String(length=64), nullable=True))
+    op.add_column("outbox_jobs", sa.Column("priority", sa.Integer(), nullable=True))
+    op.add_column("jobs", sa.Column("queue", sa.String(length=64), nullable=True))
+    op.create_index("idx_jobs_started_at", "jobs", ["started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_started_at", table_name="jobs")
+    op.drop_column("jobs", "queue")
+    op.drop_column("outbox_jobs", "priority")
+    op.drop_column("outbox_jobs", "queue")
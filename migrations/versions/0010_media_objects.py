@@ -0,0 +1,49 @@
+"""add content-addressed media objects
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_objects",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("object_key", sa.String(length=512), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("content_type", sa.String(length=255), nullable=True),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("released_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("sha256"),
+        sa.UniqueConstraint("object_key"),
+    )
+    op.create_index(
+        "idx_media_objects_unreferenced",
+        "media_objects",
+        ["released_at"],
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+    # 추출 원본 영상 (media_objects 참조)
+    op.add_column("skeleton_sources", sa.Column("video_object_key", sa.String(length=512), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("skeleton_sources", "video_object_key")
+    op.drop_index("idx_media_objects_unreferenced", table_name="media_objects")
+    op.drop_table("media_objects")
@@ -0,0 +1,26 @@
+"""add skeleton object content encoding
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 객체는 비압축 (NULL), skeleton.recompress 작업으로 재압축
+    op.add_column("skeleton_sources", sa.Column("content_encoding", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("skeleton_sources", "content_encoding")
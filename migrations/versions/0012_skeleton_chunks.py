@@ -0,0 +1,28 @@
+"""add frame-chunked skeleton storage
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 소스는 chunk 없음 (NULL), 전체 JSON(object_key)만 사용
+    op.add_column("skeleton_sources", sa.Column("chunk_prefix", sa.String(length=512), nullable=True))
+    op.add_column("skeleton_sources", sa.Column("chunk_frames", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("skeleton_sources", "chunk_frames")
+    op.drop_column("skeleton_sources", "chunk_prefix")
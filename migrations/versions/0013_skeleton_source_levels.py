@@ -0,0 +1,39 @@
+"""add skeleton LOD levels
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "skeleton_source_levels",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("skeleton_source_id", sa.Integer(), nullable=False),
+        sa.Column("factor", sa.Integer(), nullable=False),
+        sa.Column("object_key", sa.String(length=512), nullable=False),
+        sa.Column("num_frames", sa.Integer(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("content_encoding", sa.String(length=16), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["skeleton_source_id"], ["skeleton_sources.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("object_key"),
+        sa.UniqueConstraint("skeleton_source_id", "factor", name="uq_skeleton_source_levels_factor"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("skeleton_source_levels")
@@ -0,0 +1,33 @@
+"""add outbox retry backoff and sent-row pruning index
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 발행 실패 후 다음 재시도 시각 (NULL이면 즉시)
+    op.add_column("outbox_jobs", sa.Column("next_attempt_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "idx_outbox_jobs_sent_at",
+        "outbox_jobs",
+        ["sent_at"],
+        postgresql_where=sa.text("status = 'SENT'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_outbox_jobs_sent_at", table_name="outbox_jobs")
+    op.drop_column("outbox_jobs", "next_attempt_at")
@@ -0,0 +1,83 @@
+"""
+엔드포인트별 SQL 쿼리 수 상한 테스트 (N+1 회귀 방지)
+
+서버를 DEBUG=true 로 실행해야 합니다. (Server-Timing 헤더의 쿼리 수를 검사)
+
+사용법:
+    DEBUG=true uvicorn app.main:app
+    python tests/test_query_budget.py
+"""
+import re
+
+import httpx
+
+# API 기본 URL
+BASE_URL = "http://localhost:8000"
+
+_QUERY_COUNT_RE = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+def assert_query_budget(response: httpx.Response, max_queries: int) -> int:
+    """Server-Timing 헤더의 쿼리 수가 max_queries 이하인지 확인"""
+    header = response.headers.get("Server-Timing")
+    assert header, "Server-Timing header missing (run the server with DEBUG=true)"
+    match = _QUERY_COUNT_RE.search(header)
+    assert match, f"Unexpected Server-Timing header: {header}"
+    count = int(match.group(1))
+    assert count <= max_queries, (
+        f"{response.request.method} {response.request.url.path}: "
+        f"expected at most {max_queries} queries, got {count} ({header})"
+    )
+    return count
+
+
+def _create_project(client: httpx.Client) -> int:
+    response = client.post(f"{BASE_URL}/projects", json={"title": "쿼리 수 테스트"})
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+    # project insert + track insert + refresh
+    assert_query_budget(response, 6)
+    return response.json()["id"]
+
+
+def test_query_budgets():
+    """주요 엔드포인트 쿼리 수 상한 확인"""
+    print("\n[쿼리 수 상한 테스트]")
+    with httpx.Client() as client:
+        project_id = _create_project(client)
+
+        response = client.get(f"{BASE_URL}/projects")
+        assert response.status_code == 200
+        assert_query_budget(response, 1)
+
+        response = client.get(f"{BASE_URL}/projects/{project_id}/edit-state")
+        assert response.status_code == 200
+        # project + tracks + layers/sources/keyframes selectinload
+        assert_query_budget(response, 5)
+        track_id = response.json()["tracks"][0]["id"]
+
+        response = client.get(f"{BASE_URL}/projects/{project_id}/edit-state", params={"lod": 16})
+        assert response.status_code == 200
+        # LOD 레벨 selectinload 1회 추가
+        assert_query_budget(response, 6)
+
+        keyframes = [
+            {"time_sec": i * 0.5, "x": i * 0.01, "y": 0.5, "interp": "LINEAR"}
+            for i in range(500)
+        ]
+        response = client.put(
+            f"{BASE_URL}/tracks/{track_id}/position-keyframes",
+            json={"keyframes": keyframes},
+        )
+        assert response.status_code == 200
+        # track lock + 기존 조회 + upsert 1회 + track/project revision (키프레임 수와 무관)
+        assert_query_budget(response, 6)
+
+        response = client.get(f"{BASE_URL}/tracks/{track_id}/position-keyframes")
+        assert response.status_code == 200
+        assert_query_budget(response, 2)
+
+    print("✅ 쿼리 수 상한 통과")
+
+
+if __name__ == "__main__":
+    test_query_budgets()
@@ -0,0 +1,95 @@
+"""CPU 예산 벤치마크: concurrency x threads-per-process 조합별 pose 추출 처리량 측정
+
+샘플 영상을 조합마다 concurrency개의 프로세스(prefork와 같은 fork)에서 동시에 추출하고
+전체 처리 프레임 수 / 경과 시간이 가장 큰 조합을 출력합니다.
+
+    python -m worker.benchmark --video sample.mp4 --frames 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import time
+
+from worker.cpu_budget import CpuPlan, apply_cpu_budget, available_cpus, plan_cpu_budget
+
+
+def _powers_of_two(limit: int) -> list[int]:
+    values = []
+    n = 1
+    while n <= limit:
+        values.append(n)
+        n *= 2
+    if values[-1] != limit:
+        values.append(limit)
+    return values
+
+
+def candidate_plans(budget: int) -> list[CpuPlan]:
+    """concurrency, threads를 2의 거듭제곱으로 sweep (예산의 2배를 넘는 oversubscription은 제외)"""
+    plans = []
+    for concurrency in _powers_of_two(budget):
+        for threads in _powers_of_two(budget):
+            if concurrency * threads <= 2 * budget:
+                plans.append(plan_cpu_budget(budget, concurrency, threads))
+    return plans
+
+
+def _child(video: str, frames: int, plan: CpuPlan, index: int, pin_cores: bool, results: mp.Queue) -> None:
+    apply_cpu_budget(plan, index, pin_cores=pin_cores)
+    from worker.pipelines.pose_extractor import extract_pose_to_json
+
+    data = extract_pose_to_json(video, max_frames=frames)
+    results.put(data["meta"]["num_frames"])
+
+
+def measure(video: str, frames: int, plan: CpuPlan, pin_cores: bool) -> float:
+    """plan으로 concurrency개 프로세스를 동시에 돌린 처리량 (frames/sec)"""
+    ctx = mp.get_context("fork")
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_child, args=(video, frames, plan, i, pin_cores, results))
+        for i in range(plan.concurrency)
+    ]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    total = sum(results.get() for _ in procs)
+    for proc in procs:
+        proc.join()
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", required=True, help="샘플 영상 경로")
+    parser.add_argument("--frames", type=int, default=300, help="프로세스당 처리할 프레임 수")
+    parser.add_argument("--budget", type=int, default=0, help="CPU 예산 (0이면 사용 가능한 코어 전체)")
+    parser.add_argument("--pin-cores", action="store_true", help="자식 프로세스별 코어 affinity 고정")
+    args = parser.parse_args()
+
+    from worker.pipelines.pose_extractor import ensure_model
+
+    ensure_model()  # 모델 다운로드는 fork 전에 한 번만
+    budget = args.budget or available_cpus()
+
+    print(f"{'concurrency':>11} {'threads':>7} {'frames/s':>9}")
+    best: tuple[float, CpuPlan] | None = None
+    for plan in candidate_plans(budget):
+        fps = measure(args.video, args.frames, plan, args.pin_cores)
+        print(f"{plan.concurrency:>11} {plan.threads_per_process:>7} {fps:>9.1f}", flush=True)
+        if best is None or fps > best[0]:
+            best = (fps, plan)
+
+    assert best is not None
+    fps, plan = best
+    print(
+        f"\nbest: concurrency={plan.concurrency} threads_per_process={plan.threads_per_process} ({fps:.1f} frames/s)\n"
+        f"  celery ... worker -c {plan.concurrency}  "
+        f"WORKER_CPU_BUDGET={budget} WORKER_THREADS_PER_PROCESS={plan.threads_per_process}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,49 @@
+import logging
+
 from celery import Celery
-from celery.signals import worker_process_init
+from celery.signals import celeryd_init, worker_process_init
+from kombu import Queue
 
 from app.core.config import get_settings
+from app.integrations.task_contracts import EXTRACT_QUEUE_IO, EXTRACT_QUEUES, STORAGE_GC_TASK
+
+logger = logging.getLogger(__name__)
+
+# prefork 자식 프로세스 수 (메인 프로세스에서 기록, fork된 자식이 상속)
+_worker_concurrency = 0
+
+
+@celeryd_init.connect
+def record_concurrency(sender=None, conf=None, options=None, **kwargs):
+    global _worker_concurrency
+    _worker_concurrency = int((options or {}).get("concurrency") or 0)
+
+
+def _apply_cpu_budget() -> None:
+    """CPU 예산을 자식 프로세스에 분배 (cv2 스레드 수, 선택적 코어 affinity)"""
+    from billiard.process import current_process
+
+    from worker.cpu_budget import apply_cpu_budget, available_cpus, plan_cpu_budget
+
+    settings = get_settings()
+    plan = plan_cpu_budget(
+        settings.worker_cpu_budget,
+        _worker_concurrency or available_cpus(),
+        settings.worker_threads_per_process,
+    )
+    apply_cpu_budget(plan, getattr(current_process(), "index", None), pin_cores=settings.worker_pin_cores)
+
 
 # 워커 프로세스 시작 시 nest_asyncio 적용 (한 번만)
 @worker_process_init.connect
 def init_worker(**kwargs):
-    """워커 프로세스 초기화 시 nest_asyncio 적용"""
+    """워커 프로세스 초기화 시 CPU 예산 적용, nest_asyncio 적용"""
+    try:
+        _apply_cpu_budget()
+    except Exception:
+        # CPU 예산 적용 실패해도 계속 진행 (기본 스레드 설정 사용)
+        logger.warning("Failed to apply CPU budget", exc_info=True)
+
     try:
         import nest_asyncio
         import asyncio
@@ -31,7 +68,7 @@ celery_app = Celery(
     "collabography_worker",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=["worker.tasks.extract_skeleton"],
+    include=["worker.tasks.extract_skeleton", "worker.tasks.storage_gc", "worker.tasks.recompress_skeleton"],
 )
 
 celery_app.conf.update(
@@ -43,5 +80,23 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    # 기본적으로 모든 추출 큐를 소비
+    # 운영에서는 -Q extract.io (threads 풀)와 -Q extract.short,... (prefork 풀) 워커로 분리
+    task_queues=[Queue("celery"), Queue(EXTRACT_QUEUE_IO), *(Queue(name) for name in EXTRACT_QUEUES)],
+    # 여러 큐를 소비하는 워커가 extract.long을 굶기지 않도록 큐 사이는 round robin
+    # (큐 안에서는 message priority 순서가 그대로 적용됨)
+    broker_transport_options={"queue_order_strategy": "round_robin"},
+    # 수 분짜리 작업이므로 미리 가져가지 않음 (짧은 작업이 바쁜 워커의 prefetch 버퍼에 갇히지 않도록)
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
 )
 
+if settings.storage_gc_interval_sec > 0:
+    # celery -A worker.celery_app.celery_app beat 로 실행
+    celery_app.conf.beat_schedule = {
+        "storage-gc": {
+            "task": STORAGE_GC_TASK,
+            "schedule": settings.storage_gc_interval_sec,
+            "options": {"queue": EXTRACT_QUEUE_IO, "expires": settings.storage_gc_interval_sec},
+        },
+    }
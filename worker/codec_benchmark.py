@@ -0,0 +1,120 @@
+"""스켈레톤 압축 벤치마크: codec / level별 크기와 인코딩 / 디코딩 시간 측정
+
+실제 추출 결과(JSON, 압축되지 않은 파일)를 주거나, 없으면 같은 구조의 합성 데이터를 사용합니다.
+JSON과 양자화 delta keypoint codec(kpd) 각각에 일반 압축을 적용한 크기를 비교하고, kpd의 복원 오차를 출력합니다.
+디코딩 시간은 압축 해제 + 파싱(json.loads / decode_keypoints)입니다.
+
+    python -m worker.codec_benchmark --input skeleton.json
+    python -m worker.codec_benchmark --frames 9000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from app.integrations.content_encoding import GZIP, IDENTITY, ZSTD, decode_content, encode_content
+from worker.pipelines.keypoint_codec import (
+    decode_keypoints,
+    encode_keypoints,
+    reconstruction_error,
+    skeleton_json_to_arrays,
+)
+
+NUM_JOINTS = 17
+
+# (encoding, level) 조합 (level 0은 codec 기본값)
+CANDIDATES = [(IDENTITY, 0), (GZIP, 1), (GZIP, 6), (GZIP, 9), (ZSTD, 3), (ZSTD, 10), (ZSTD, 19)]
+
+
+def synthetic_skeleton(frames: int, fps: float = 30.0, seed: int = 0) -> dict[str, Any]:
+    """pose_extractor 출력과 같은 구조의 합성 스켈레톤 (관절별 random walk)"""
+    rng = random.Random(seed)
+    pos = [[rng.uniform(0.3, 0.7), rng.uniform(0.3, 0.7), rng.uniform(0.5, 1.0)] for _ in range(NUM_JOINTS)]
+    out = []
+    for i in range(frames):
+        keypoints, pose_vec, valid_mask = [], [], []
+        for j in range(NUM_JOINTS):
+            for k, sigma in ((0, 0.003), (1, 0.003), (2, 0.01)):
+                pos[j][k] = min(max(pos[j][k] + rng.gauss(0, sigma), 0.0), 1.0)
+            x, y, v = pos[j]
+            keypoints.append({"x": x, "y": y, "z": 0.0, "visibility": v})
+            pose_vec.extend([x, y, 0.0])
+            valid_mask.append(1 if v >= 0.5 else 0)
+        out.append(
+            {
+                "frame_idx": i,
+                "time_sec": i / fps,
+                "has_pose": True,
+                "keypoints": keypoints,
+                "pose_vec": pose_vec,
+                "valid_mask": valid_mask,
+            }
+        )
+    return {"meta": {"fps": fps, "num_frames": frames, "num_joints": NUM_JOINTS}, "frames": out}
+
+
+def _best_of(repeat: int, fn: Any) -> tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def measure(payload: bytes, encoding: str, level: int, repeat: int) -> tuple[int, float, float]:
+    """JSON payload의 (압축 크기, 인코딩 ms, 디코딩+파싱 ms)"""
+    encode_sec, encoded = _best_of(repeat, lambda: encode_content(payload, encoding, level))
+    decode_sec, _ = _best_of(repeat, lambda: json.loads(decode_content(encoded, encoding)))
+    return len(encoded), encode_sec * 1000, decode_sec * 1000
+
+
+def measure_keypoints(arrays: tuple[Any, Any, Any], encoding: str, level: int, repeat: int) -> tuple[int, float, float]:
+    """kpd codec + 일반 압축의 (크기, 인코딩 ms, 디코딩 ms)"""
+    encode_sec, encoded = _best_of(repeat, lambda: encode_content(encode_keypoints(*arrays), encoding, level))
+    decode_sec, _ = _best_of(repeat, lambda: decode_keypoints(decode_content(encoded, encoding)))
+    return len(encoded), encode_sec * 1000, decode_sec * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="스켈레톤 JSON 경로 (없으면 합성 데이터)")
+    parser.add_argument("--frames", type=int, default=9000, help="합성 데이터 프레임 수 (30fps 기준 5분)")
+    parser.add_argument("--repeat", type=int, default=3, help="조합별 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    data = json.loads(Path(args.input).read_bytes()) if args.input else synthetic_skeleton(args.frames)
+    indented = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    print(f"indent=2 JSON: {len(indented):,} bytes, compact JSON: {len(payload):,} bytes\n")
+
+    arrays = skeleton_json_to_arrays(data)
+    error = reconstruction_error(arrays[0], arrays[1], decode_keypoints(encode_keypoints(*arrays)))
+    print(
+        f"kpd reconstruction error: coord max {error.coord_max_abs:.2e}, rmse {error.coord_rmse:.2e}, "
+        f"visibility max {error.visibility_max_abs:.2e}\n"
+    )
+
+    print(f"{'format':>6} {'codec':>8} {'level':>5} {'bytes':>12} {'ratio':>6} {'encode ms':>10} {'decode ms':>10}")
+    for fmt, fn, source in (("json", measure, payload), ("kpd", measure_keypoints, arrays)):
+        for encoding, level in CANDIDATES:
+            try:
+                size, encode_ms, decode_ms = fn(source, encoding, level, args.repeat)
+            except RuntimeError as exc:
+                # zstandard 미설치
+                print(f"{fmt:>6} {encoding:>8} {level:>5} skipped: {exc}")
+                continue
+            ratio = len(indented) / size
+            print(
+                f"{fmt:>6} {encoding:>8} {level:>5} {size:>12,} {ratio:>5.1f}x {encode_ms:>10.1f} {decode_ms:>10.1f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""워커 프로세스별 CPU 예산 분배
+
+Celery prefork 자식 프로세스, OpenCV 내부 스레드 풀, MediaPipe(XNNPACK) 스레드가
+각자 모든 코어를 쓰려고 하면 oversubscription으로 처리량이 떨어집니다.
+설정된 CPU 예산을 자식 프로세스 수로 나눠 프로세스마다 스레드 수와 (선택) 코어 affinity를 고정합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CpuPlan:
+    budget: int  # 워커가 사용할 전체 코어 수
+    concurrency: int  # prefork 자식 프로세스 수
+    threads_per_process: int
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # sched_getaffinity가 없는 플랫폼
+        return os.cpu_count() or 1
+
+
+def plan_cpu_budget(budget: int, concurrency: int, threads_per_process: int = 0) -> CpuPlan:
+    """예산(0이면 사용 가능한 코어 전체)을 자식 프로세스에 균등 분배"""
+    budget = budget or available_cpus()
+    concurrency = max(concurrency, 1)
+    threads = threads_per_process or max(budget // concurrency, 1)
+    return CpuPlan(budget=budget, concurrency=concurrency, threads_per_process=threads)
+
+
+def cores_for_child(plan: CpuPlan, index: int) -> set[int]:
+    """index번째 자식 프로세스에 할당할 코어 (예산 안에서 순환)"""
+    allowed = sorted(os.sched_getaffinity(0))[: plan.budget]
+    start = (index * plan.threads_per_process) % len(allowed)
+    return {allowed[(start + i) % len(allowed)] for i in range(plan.threads_per_process)}
+
+
+def apply_cpu_budget(plan: CpuPlan, index: int | None = None, pin_cores: bool = False) -> None:
+    """현재 프로세스에 CPU 계획 적용
+
+    MediaPipe Tasks Python API는 XNNPACK 스레드 수 옵션을 노출하지 않으므로,
+    pin_cores=True면 affinity로 MediaPipe 스레드가 쓰는 코어 범위를 제한합니다.
+    """
+    import cv2
+
+    cv2.setNumThreads(plan.threads_per_process)
+
+    if pin_cores and index is not None and hasattr(os, "sched_setaffinity"):
+        cores = cores_for_child(plan, index)
+        os.sched_setaffinity(0, cores)
+        logger.info("CPU budget applied pid=%s index=%s threads=%s cores=%s", os.getpid(), index, plan.threads_per_process, sorted(cores))
+    else:
+        logger.info("CPU budget applied pid=%s threads=%s", os.getpid(), plan.threads_per_process)
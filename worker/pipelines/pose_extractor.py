@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import tempfile
 import urllib.request
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import cv2
 import numpy as np
@@ -70,6 +72,14 @@ MODEL_URL_LITE = (
 )
 
 
+class ExtractionCancelled(Exception):
+    """Raised when should_cancel() reports a cancellation request."""
+
+    def __init__(self, frame_idx: int):
+        super().__init__(f"extraction cancelled at frame {frame_idx}")
+        self.frame_idx = frame_idx
+
+
 def ensure_model(model_path: str | Path | None = None) -> Path:
     """Download pose model if missing and return its path."""
     target = Path(model_path) if model_path else Path(tempfile.gettempdir()) / "pose_landmarker.task"
@@ -132,12 +142,132 @@ def normalize_pose(kps_norm: np.ndarray) -> np.ndarray:
     return np.clip(kps_view, 0.0, 1.0)
 
 
+@dataclass
+class PoseChunk:
+    """Contiguous block of processed frames (checkpoint unit).
+
+    Serialized as an uncompressed .npz so a retry can reload it without
+    re-running pose estimation for those frames.
+    """
+
+    start_frame: int
+    keypoints: np.ndarray  # (n, J, 2) float32, normalized
+    conf: np.ndarray  # (n, J) float32
+    has_pose: np.ndarray  # (n,) bool
+
+    def __len__(self) -> int:
+        return int(self.has_pose.shape[0])
+
+    @property
+    def end_frame(self) -> int:
+        return self.start_frame + len(self)
+
+    def to_bytes(self) -> bytes:
+        buf = BytesIO()
+        np.savez(
+            buf,
+            start_frame=np.int64(self.start_frame),
+            keypoints=self.keypoints.astype(np.float32, copy=False),
+            conf=self.conf.astype(np.float32, copy=False),
+            has_pose=self.has_pose.astype(bool, copy=False),
+        )
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> PoseChunk:
+        with np.load(BytesIO(payload)) as data:
+            chunk = cls(
+                start_frame=int(data["start_frame"]),
+                keypoints=data["keypoints"],
+                conf=data["conf"],
+                has_pose=data["has_pose"],
+            )
+        if chunk.keypoints.shape != (len(chunk), J, 2) or chunk.conf.shape != (len(chunk), J):
+            raise ValueError(f"invalid pose chunk shape at frame {chunk.start_frame}")
+        return chunk
+
+
+def _contiguous_prefix(chunks: list[PoseChunk]) -> list[PoseChunk]:
+    """Chunks that cover frames [0, n) without gaps, in order."""
+    out: list[PoseChunk] = []
+    next_frame = 0
+    for chunk in sorted(chunks, key=lambda c: c.start_frame):
+        if chunk.start_frame != next_frame or len(chunk) == 0:
+            break
+        out.append(chunk)
+        next_frame = chunk.end_frame
+    return out
+
+
+def _seek(cap: Any, video_path: str, frame_idx: int) -> Any:
+    """Position cap so the next read() returns frame_idx.
+
+    CAP_PROP_POS_FRAMES is not frame-accurate for every codec, so fall back
+    to reopening and grabbing frames when the position does not match.
+    """
+    if frame_idx <= 0:
+        return cap
+    if cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx) and int(cap.get(cv2.CAP_PROP_POS_FRAMES)) == frame_idx:
+        return cap
+    cap.release()
+    cap = cv2.VideoCapture(video_path)
+    for _ in range(frame_idx):
+        if not cap.grab():
+            break
+    return cap
+
+
+def _build_frame(
+    frame_idx: int,
+    fps: float,
+    kps_n: np.ndarray,
+    conf: np.ndarray,
+    has_pose: bool,
+    conf_thr: float,
+) -> dict[str, Any]:
+    keypoints, pose_vec, valid_mask = [], [], []
+    for j in range(J):
+        x, y = float(kps_n[j, 0]), float(kps_n[j, 1])
+        v = float(conf[j])
+        keypoints.append({"x": x, "y": y, "z": 0.0, "visibility": v})
+        pose_vec.extend([x, y, 0.0])
+        valid_mask.append(1 if v >= conf_thr else 0)
+
+    return {
+        "frame_idx": frame_idx,
+        "time_sec": frame_idx / float(fps),
+        "has_pose": bool(has_pose),
+        "keypoints": keypoints,
+        "pose_vec": pose_vec,
+        "valid_mask": valid_mask,
+    }
+
+
 def extract_pose_to_json(
     video_path: str,
     model_path: str | Path | None = None,
     conf_thr: float = 0.2,
+    should_cancel: Callable[[], bool] | None = None,
+    cancel_check_every: int = 150,
+    resume_chunks: list[PoseChunk] | None = None,
+    on_chunk: Callable[[PoseChunk], None] | None = None,
+    chunk_frames: int = 900,
+    rewarm_frames: int = 30,
+    max_frames: int | None = None,
 ) -> dict[str, Any]:
-    """Run MediaPipe PoseLandmarker and return JSON-serializable result."""
+    """Run MediaPipe PoseLandmarker and return JSON-serializable result.
+
+    If should_cancel is given it is polled every cancel_check_every frames;
+    when it returns True the loop stops and ExtractionCancelled is raised.
+
+    Checkpointing: on_chunk receives every chunk_frames newly processed frames,
+    and the pending partial chunk when the loop is interrupted by an exception
+    (e.g. a soft time limit). Passing those chunks back as resume_chunks skips
+    the covered frames; the rewarm_frames before the resume point are run
+    through the landmarker again (results discarded) so tracking state is warm.
+
+    max_frames stops after that many frames (used by the benchmark).
+    """
     model_file = ensure_model(model_path)
     fps, n_raw, _w, _h = get_video_meta(video_path)
 
@@ -148,65 +278,105 @@ def extract_pose_to_json(
         num_poses=1,
     )
 
-    cap = cv2.VideoCapture(video_path)
-    frames_out: list[dict[str, Any]] = []
-    frame_idx = 0
-
-    with vision.PoseLandmarker.create_from_options(options) as landmarker:
-        pbar = tqdm(total=n_raw, desc="Pose extraction", leave=False)
-        while True:
-            ok, frame_bgr = cap.read()
-            if not ok:
-                break
-
-            frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-            mp_image = Image(image_format=ImageFormat.SRGB, data=frame_rgb)
-
-            timestamp_ms = int(round((frame_idx / fps) * 1000.0))
-            result = landmarker.detect_for_video(mp_image, timestamp_ms)
-
-            has_pose = (result.pose_landmarks is not None) and (len(result.pose_landmarks) > 0)
-
-            kps_norm = np.zeros((J, 2), dtype=np.float32)
-            conf = np.zeros((J,), dtype=np.float32)
-
-            if has_pose:
-                lm33 = result.pose_landmarks[0]  # 33 landmarks
-                for jn in JOINT_NAMES:
-                    mp_idx = MP_TO_COCO17[jn]
-                    kp = lm33[mp_idx]
-                    kps_norm[name2i[jn], 0] = float(kp.x)
-                    kps_norm[name2i[jn], 1] = float(kp.y)
-                    conf[name2i[jn]] = float(getattr(kp, "visibility", 1.0))
-
-            # render-friendly normalization (motion preserved)
-            kps_n = normalize_pose(kps_norm) if has_pose else kps_norm
-
-            keypoints, pose_vec, valid_mask = [], [], []
-            for j in range(J):
-                x, y = float(kps_n[j, 0]), float(kps_n[j, 1])
-                v = float(conf[j])
-                keypoints.append({"x": x, "y": y, "z": 0.0, "visibility": v})
-                pose_vec.extend([x, y, 0.0])
-                valid_mask.append(1 if v >= conf_thr else 0)
-
-            frames_out.append(
-                {
-                    "frame_idx": frame_idx,
-                    "time_sec": frame_idx / float(fps),
-                    "has_pose": bool(has_pose),
-                    "keypoints": keypoints,
-                    "pose_vec": pose_vec,
-                    "valid_mask": valid_mask,
-                }
-            )
-
-            frame_idx += 1
-            pbar.update(1)
-
+    done = _contiguous_prefix(resume_chunks or [])
+    kps_rows: list[np.ndarray] = [c.keypoints for c in done]
+    conf_rows: list[np.ndarray] = [c.conf for c in done]
+    pose_rows: list[np.ndarray] = [c.has_pose for c in done]
+    resume_frame = done[-1].end_frame if done else 0
+
+    # frames processed in this run and not yet passed to on_chunk
+    pending_kps: list[np.ndarray] = []
+    pending_conf: list[np.ndarray] = []
+    pending_pose: list[bool] = []
+    pending_start = resume_frame
+
+    def flush() -> None:
+        nonlocal pending_start
+        if not pending_pose:
+            return
+        chunk = PoseChunk(
+            start_frame=pending_start,
+            keypoints=np.stack(pending_kps),
+            conf=np.stack(pending_conf),
+            has_pose=np.array(pending_pose, dtype=bool),
+        )
+        kps_rows.append(chunk.keypoints)
+        conf_rows.append(chunk.conf)
+        pose_rows.append(chunk.has_pose)
+        pending_kps.clear()
+        pending_conf.clear()
+        pending_pose.clear()
+        pending_start = chunk.end_frame
+        if on_chunk is not None:
+            on_chunk(chunk)
+
+    frame_idx = max(resume_frame - rewarm_frames, 0)
+    cap = _seek(cv2.VideoCapture(video_path), video_path, frame_idx)
+
+    pbar = tqdm(total=n_raw, initial=frame_idx, desc="Pose extraction", leave=False)
+    try:
+        with vision.PoseLandmarker.create_from_options(options) as landmarker:
+            while max_frames is None or frame_idx < max_frames:
+                ok, frame_bgr = cap.read()
+                if not ok:
+                    break
+
+                frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+                mp_image = Image(image_format=ImageFormat.SRGB, data=frame_rgb)
+
+                timestamp_ms = int(round((frame_idx / fps) * 1000.0))
+                result = landmarker.detect_for_video(mp_image, timestamp_ms)
+
+                if frame_idx >= resume_frame:
+                    has_pose = (result.pose_landmarks is not None) and (len(result.pose_landmarks) > 0)
+
+                    kps_norm = np.zeros((J, 2), dtype=np.float32)
+                    conf = np.zeros((J,), dtype=np.float32)
+
+                    if has_pose:
+                        lm33 = result.pose_landmarks[0]  # 33 landmarks
+                        for jn in JOINT_NAMES:
+                            mp_idx = MP_TO_COCO17[jn]
+                            kp = lm33[mp_idx]
+                            kps_norm[name2i[jn], 0] = float(kp.x)
+                            kps_norm[name2i[jn], 1] = float(kp.y)
+                            conf[name2i[jn]] = float(getattr(kp, "visibility", 1.0))
+
+                    # render-friendly normalization (motion preserved)
+                    kps_n = normalize_pose(kps_norm) if has_pose else kps_norm
+
+                    pending_kps.append(kps_n.astype(np.float32, copy=False))
+                    pending_conf.append(conf)
+                    pending_pose.append(bool(has_pose))
+
+                frame_idx += 1
+                pbar.update(1)
+
+                if len(pending_pose) >= chunk_frames:
+                    flush()
+
+                if should_cancel is not None and frame_idx % cancel_check_every == 0 and should_cancel():
+                    raise ExtractionCancelled(frame_idx)
+        flush()
+    except ExtractionCancelled:
+        raise
+    except BaseException:
+        # 중단(soft time limit 등) 직전까지 처리한 프레임을 checkpoint로 남김
+        try:
+            flush()
+        except Exception:
+            pass
+        raise
+    finally:
         pbar.close()
+        cap.release()
 
-    cap.release()
+    keypoints = np.concatenate(kps_rows) if kps_rows else np.zeros((0, J, 2), dtype=np.float32)
+    confs = np.concatenate(conf_rows) if conf_rows else np.zeros((0, J), dtype=np.float32)
+    has_poses = np.concatenate(pose_rows) if pose_rows else np.zeros((0,), dtype=bool)
+    frames_out = [
+        _build_frame(i, fps, keypoints[i], confs[i], bool(has_poses[i]), conf_thr) for i in range(len(has_poses))
+    ]
 
     return {
         "meta": {
@@ -225,5 +395,5 @@ def extract_pose_to_json(
 
 
 def dump_json_to_bytes(data: dict[str, Any]) -> bytes:
-    """Serialize JSON with utf-8 for upload."""
-    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
\ No newline at end of file
+    """Serialize compact JSON with utf-8 for upload."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
\ No newline at end of file
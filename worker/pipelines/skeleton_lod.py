@@ -0,0 +1,116 @@
+"""Downsampled (LOD) skeleton levels for timeline previews.
+
+A level keeps about 1/factor of the frames. Frames are chosen by a motion-aware
+selector: samples are spread evenly over a blend of elapsed time and accumulated
+joint motion, so fast movements keep more frames than still poses while static
+stretches are still sampled. Level payloads ("KPL1") are the kept frame indices
+(delta-encoded uint32) followed by a keypoint_codec payload for those frames.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+
+import numpy as np
+
+from worker.pipelines.keypoint_codec import DecodedKeypoints, decode_keypoints, encode_keypoints
+
+MAGIC = b"KPL1"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBHI")  # magic, version, reserved, factor, num_frames (kept)
+
+
+def motion_energy(keypoints: np.ndarray, has_pose: np.ndarray) -> np.ndarray:
+    """Per-frame mean joint displacement from the previous frame, (n,) float32.
+
+    Frames where a pose appears or disappears get the largest observed motion so
+    the selector favours them.
+    """
+    kps = np.asarray(keypoints, dtype=np.float32)
+    flags = np.asarray(has_pose, dtype=bool)
+    energy = np.zeros(flags.shape[0], dtype=np.float32)
+    if flags.shape[0] < 2:
+        return energy
+    step = np.linalg.norm(np.diff(kps, axis=0), axis=-1).mean(axis=-1)
+    both = flags[1:] & flags[:-1]
+    energy[1:] = np.where(both, step, 0.0)
+    transition = flags[1:] != flags[:-1]
+    energy[1:][transition] = energy.max() if energy.any() else 1.0
+    return energy
+
+
+def select_keyframes(
+    keypoints: np.ndarray,
+    has_pose: np.ndarray,
+    factor: int,
+    motion_weight: float = 0.5,
+) -> np.ndarray:
+    """Sorted indices of about ceil(n / factor) frames (first and last always kept).
+
+    motion_weight=0 gives uniform decimation, 1 samples purely by accumulated motion.
+    """
+    n = int(np.asarray(has_pose).shape[0])
+    target = max(2, math.ceil(n / max(factor, 1)))
+    if target >= n:
+        return np.arange(n)
+
+    cum_time = np.arange(n, dtype=np.float64) / (n - 1)
+    cum_motion = np.cumsum(motion_energy(keypoints, has_pose), dtype=np.float64)
+    if cum_motion[-1] > 0:
+        cum_motion /= cum_motion[-1]
+        weight = min(max(motion_weight, 0.0), 1.0)
+        # time term keeps the blend strictly increasing, so searchsorted is well defined
+        blend = weight * cum_motion + (1.0 - weight) * cum_time
+    else:
+        blend = cum_time
+
+    picks = np.searchsorted(blend, np.linspace(0.0, 1.0, target), side="left")
+    return np.unique(np.concatenate(([0, n - 1], np.minimum(picks, n - 1))))
+
+
+def encode_level(
+    frame_idx: np.ndarray,
+    keypoints: np.ndarray,
+    conf: np.ndarray,
+    has_pose: np.ndarray,
+    factor: int,
+) -> bytes:
+    """Encode the kept frames of a level (arrays already indexed by frame_idx)."""
+    idx = np.asarray(frame_idx, dtype=np.int64)
+    deltas = np.diff(idx, prepend=0).astype("<u4")
+    return b"".join(
+        (
+            _HEADER.pack(MAGIC, VERSION, 0, factor, idx.shape[0]),
+            deltas.tobytes(),
+            encode_keypoints(keypoints, conf, has_pose),
+        )
+    )
+
+
+def decode_level(data: bytes) -> tuple[int, np.ndarray, DecodedKeypoints]:
+    """Inverse of encode_level: (factor, frame indices, decoded keypoints)."""
+    if len(data) < _HEADER.size:
+        raise ValueError("LOD payload too short")
+    magic, version, _, factor, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"unsupported LOD payload: {magic!r} v{version}")
+    offset = _HEADER.size
+    deltas = np.frombuffer(data, "<u4", count, offset)
+    frame_idx = np.cumsum(deltas, dtype=np.int64)
+    return factor, frame_idx, decode_keypoints(data[offset + 4 * count :])
+
+
+def build_levels(
+    keypoints: np.ndarray,
+    conf: np.ndarray,
+    has_pose: np.ndarray,
+    factors: list[int],
+    motion_weight: float = 0.5,
+) -> dict[int, tuple[np.ndarray, bytes]]:
+    """factor -> (kept frame indices, encoded level) for each factor > 1."""
+    levels: dict[int, tuple[np.ndarray, bytes]] = {}
+    for factor in sorted({f for f in factors if f > 1}):
+        idx = select_keyframes(keypoints, has_pose, factor, motion_weight)
+        levels[factor] = (idx, encode_level(idx, keypoints[idx], conf[idx], has_pose[idx], factor))
+    return levels
@@ -4,20 +4,53 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import tempfile
+import os
+import shutil
 from io import BytesIO
 from pathlib import Path
+from datetime import datetime
 from typing import Any
 
+from celery import chain
 from minio.error import S3Error
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import get_settings
 from app.db.engine import get_engine
-from app.models import AssetStatus, SkeletonSource
+from app.integrations.content_encoding import (
+    IDENTITY,
+    content_encoding_headers,
+    encode_content,
+    normalize_encoding,
+)
+from app.integrations.skeleton_chunks import (
+    SKELETON_CHUNK_FORMAT,
+    chunk_index_key,
+    chunk_object_key,
+    chunk_prefix,
+    frames_per_chunk,
+    lod_object_key,
+)
+from app.integrations.task_contracts import (
+    EXTRACT_QUEUE_IO,
+    EXTRACT_QUEUE_MEDIUM,
+    EXTRACT_SKELETON_FINALIZE_TASK,
+    EXTRACT_SKELETON_INFER_TASK,
+    EXTRACT_SKELETON_TASK,
+)
+from app.models import AssetStatus, Job, JobStatus, SkeletonSource, SkeletonSourceLevel
 from app.storage.minio_client import get_minio_client
 from worker.celery_app import celery_app
-from worker.pipelines.pose_extractor import dump_json_to_bytes, extract_pose_to_json
+from worker.video_cache import VideoCache
+from worker.pipelines.keypoint_codec import DEFAULT_COORD_LEVELS, encode_keypoints, skeleton_json_to_arrays
+from worker.pipelines.skeleton_lod import build_levels
+from worker.pipelines.pose_extractor import (
+    ExtractionCancelled,
+    PoseChunk,
+    dump_json_to_bytes,
+    extract_pose_to_json,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +68,10 @@ async def _update_source_success(
     source_id: int,
     object_key: str,
     meta: dict[str, Any],
+    content_encoding: str = IDENTITY,
+    frame_chunk_prefix: str | None = None,
+    frame_chunk_frames: int | None = None,
+    levels: list[dict[str, Any]] | None = None,
 ) -> None:
     async with sessionmaker() as session:
         source = await session.get(SkeletonSource, source_id)
@@ -42,6 +79,22 @@ async def _update_source_success(
             raise RuntimeError(f"SkeletonSource not found: {source_id}")
 
         source.object_key = object_key
+        source.content_encoding = content_encoding
+        source.chunk_prefix = frame_chunk_prefix
+        source.chunk_frames = frame_chunk_frames
+        # 재시도로 다시 기록되는 경우 이전 LOD 레벨 교체
+        await session.execute(delete(SkeletonSourceLevel).where(SkeletonSourceLevel.skeleton_source_id == source_id))
+        for level in levels or []:
+            session.add(
+                SkeletonSourceLevel(
+                    skeleton_source_id=source_id,
+                    factor=level["factor"],
+                    object_key=level["object_key"],
+                    num_frames=level["num_frames"],
+                    size_bytes=level["size_bytes"],
+                    content_encoding=content_encoding,
+                )
+            )
         source.fps = meta.get("fps")
         source.num_frames = meta.get("num_frames")
         source.num_joints = meta.get("num_joints")
@@ -73,40 +126,228 @@ async def _update_source_failed(
     await engine.dispose()
 
 
+async def _mark_job_started(
+    sessionmaker: async_sessionmaker,
+    engine: Any,
+    task_id: str,
+    attempt: int,
+    hostname: str | None,
+) -> JobStatus | None:
+    """Job을 STARTED로 표시하고 이전 상태 반환 (Job 기록이 없으면 None)
+
+    대기 중에 취소가 요청된 작업은 바로 CANCELLED로 표시하고 CANCELLED를 반환합니다.
+    """
+    async with sessionmaker() as session:
+        result = await session.execute(select(Job).where(Job.task_id == task_id).with_for_update())
+        job = result.scalar_one_or_none()
+        previous = job.status if job else None
+        if job and job.status != JobStatus.REVOKED and job.cancel_requested_at is not None:
+            job.status = JobStatus.CANCELLED
+            job.finished_at = datetime.utcnow()
+            previous = JobStatus.CANCELLED
+        elif job and job.status != JobStatus.REVOKED:
+            job.status = JobStatus.STARTED
+            job.attempts = attempt
+            job.worker_hostname = hostname
+            job.started_at = datetime.utcnow()
+        await session.commit()
+
+    await engine.dispose()
+    return previous
+
+
+async def _mark_job_finished(
+    sessionmaker: async_sessionmaker,
+    engine: Any,
+    task_id: str,
+    status: JobStatus,
+    error_message: str | None = None,
+) -> None:
+    """Job 상태 갱신 (SUCCEEDED/FAILED/CANCELLED면 finished_at 기록)"""
+    values: dict[str, Any] = {"status": status, "error_message": error_message[:500] if error_message else None}
+    if status in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED):
+        values["finished_at"] = datetime.utcnow()
+    async with sessionmaker() as session:
+        await session.execute(
+            update(Job).where(Job.task_id == task_id, Job.status != JobStatus.REVOKED).values(**values)
+        )
+        await session.commit()
+
+    await engine.dispose()
+
+
+async def _check_job(sessionmaker: async_sessionmaker, engine: Any, task_id: str) -> JobStatus | None:
+    """Job 상태 확인 (취소가 요청된 작업은 CANCELLED로 표시하고 CANCELLED 반환)"""
+    async with sessionmaker() as session:
+        result = await session.execute(select(Job).where(Job.task_id == task_id).with_for_update())
+        job = result.scalar_one_or_none()
+        status = job.status if job else None
+        if job and job.status != JobStatus.REVOKED and job.cancel_requested_at is not None:
+            job.status = JobStatus.CANCELLED
+            job.finished_at = datetime.utcnow()
+            status = JobStatus.CANCELLED
+        await session.commit()
+
+    await engine.dispose()
+    return status
+
+
+async def _is_cancel_requested(sessionmaker: async_sessionmaker, engine: Any, task_id: str) -> bool:
+    async with sessionmaker() as session:
+        result = await session.execute(select(Job.cancel_requested_at).where(Job.task_id == task_id))
+        requested = result.scalar_one_or_none() is not None
+
+    await engine.dispose()
+    return requested
+
+
 def _build_object_key(project_id: int, track_slot: int, source_id: int) -> str:
     return f"skeleton/{project_id}/track_{track_slot}/{source_id}.json"
 
 
-def _download_video_to_temp(video_object_key: str) -> Path:
+def _work_dir(source_id: int) -> Path:
+    """단계 간 공유 작업 디렉터리 (I/O 워커와 CPU 워커가 같은 볼륨을 마운트)"""
+    return Path(get_settings().extract_work_dir) / str(source_id)
+
+
+def _work_video_path(source_id: int, video_object_key: str) -> Path:
+    return _work_dir(source_id) / f"video{Path(video_object_key).suffix}"
+
+
+def _work_result_path(source_id: int) -> Path:
+    return _work_dir(source_id) / "skeleton.json"
+
+
+def _work_chunk_dir(source_id: int) -> Path:
+    return _work_dir(source_id) / "chunks"
+
+
+def _work_lod_path(source_id: int, factor: int) -> Path:
+    return _work_dir(source_id) / f"lod_x{factor}.kpl"
+
+
+def _parse_lod_factors(value: str) -> list[int]:
+    return sorted({int(part) for part in value.split(",") if part.strip() and int(part) > 1})
+
+
+def _write_frame_chunks(
+    source_id: int, arrays: tuple[Any, Any, Any], chunk_frames: int, content_encoding: str, level: int
+) -> list[dict[str, int]]:
+    """추출 결과를 chunk_frames 단위 kpd chunk 파일(압축)로 기록하고 chunk 목록 반환"""
+    chunk_dir = _work_chunk_dir(source_id)
+    shutil.rmtree(chunk_dir, ignore_errors=True)
+    chunk_dir.mkdir(parents=True)
+
+    keypoints, conf, has_pose = arrays
+    chunks = []
+    for index, start in enumerate(range(0, len(has_pose), chunk_frames)):
+        end = min(start + chunk_frames, len(has_pose))
+        payload = encode_content(
+            encode_keypoints(keypoints[start:end], conf[start:end], has_pose[start:end]), content_encoding, level
+        )
+        (chunk_dir / f"{index:05d}.kpd").write_bytes(payload)
+        chunks.append({"index": index, "start_frame": start, "num_frames": end - start, "size_bytes": len(payload)})
+    return chunks
+
+
+def _write_lod_levels(
+    source_id: int,
+    arrays: tuple[Any, Any, Any],
+    factors: list[int],
+    motion_weight: float,
+    content_encoding: str,
+    level: int,
+) -> list[dict[str, int]]:
+    """다운샘플 LOD 레벨 파일(압축)을 기록하고 레벨 목록 반환"""
+    levels = []
+    for factor, (frame_idx, payload) in build_levels(*arrays, factors, motion_weight).items():
+        encoded = encode_content(payload, content_encoding, level)
+        _work_lod_path(source_id, factor).write_bytes(encoded)
+        levels.append({"factor": factor, "num_frames": int(len(frame_idx)), "size_bytes": len(encoded)})
+    return levels
+
+
+def _upload_lod_levels(source_id: int, prefix: str, infer_result: dict, content_encoding: str) -> list[dict[str, Any]]:
+    """LOD 레벨 업로드 후 object_key를 포함한 레벨 목록 반환"""
+    headers = content_encoding_headers(content_encoding)
+    levels = []
+    for level in infer_result.get("levels", []):
+        object_key = lod_object_key(prefix, level["factor"])
+        payload = _work_lod_path(source_id, level["factor"]).read_bytes()
+        _upload_bytes(object_key, payload, "application/octet-stream", headers)
+        levels.append({**level, "object_key": object_key})
+    return levels
+
+
+def _upload_frame_chunks(source_id: int, prefix: str, infer_result: dict, content_encoding: str) -> None:
+    """chunk 파일을 업로드한 뒤 index 업로드 (index가 있으면 모든 chunk가 있음)"""
+    chunk_dir = _work_chunk_dir(source_id)
+    headers = content_encoding_headers(content_encoding)
+    chunks = infer_result["chunks"]
+    for chunk in chunks:
+        payload = (chunk_dir / f"{chunk['index']:05d}.kpd").read_bytes()
+        _upload_bytes(chunk_object_key(prefix, chunk["index"]), payload, "application/octet-stream", headers)
+
+    meta = infer_result["meta"]
+    index = {
+        "format": SKELETON_CHUNK_FORMAT,
+        "coord_levels": DEFAULT_COORD_LEVELS,
+        "fps": meta.get("fps"),
+        "num_frames": meta.get("num_frames"),
+        "num_joints": meta.get("num_joints"),
+        "chunk_frames": infer_result["chunk_frames"],
+        "content_encoding": content_encoding,
+        "chunks": [{**chunk, "object_key": chunk_object_key(prefix, chunk["index"])} for chunk in chunks],
+    }
+    _upload_json(chunk_index_key(prefix), dump_json_to_bytes(index))
+
+
+def _remove_work_dir(source_id: int) -> None:
+    shutil.rmtree(_work_dir(source_id), ignore_errors=True)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """캐시 파일을 작업 디렉터리로 연결 (hard link는 캐시에서 제거되어도 유지됨)"""
+    tmp = dst.with_name(dst.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        # 다른 파일 시스템이면 복사
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _download_video(source_id: int, video_object_key: str) -> Path:
+    """영상을 작업 디렉터리로 가져옴 (로컬 캐시 우선, 임시 파일에 받은 뒤 rename하므로 부분 파일이 보이지 않음)"""
     settings = get_settings()
     bucket = settings.minio_bucket
     if not bucket:
         raise RuntimeError("MinIO bucket not configured")
 
+    target = _work_video_path(source_id, video_object_key)
+    target.parent.mkdir(parents=True, exist_ok=True)
     client = get_minio_client()
-    response = None
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(video_object_key).suffix) as tmp:
-        try:
-            response = client.get_object(bucket, video_object_key)
-            tmp.write(response.read())
-            tmp.flush()
-        except S3Error as e:
-            raise RuntimeError(f"Failed to download video from MinIO: {e}") from e
-        finally:
-            try:
-                if response:
-                    response.close()
-            except Exception:
-                pass
-            try:
-                if response:
-                    response.release_conn()
-            except Exception:
-                pass
-    return Path(tmp.name)
+    try:
+        if settings.worker_video_cache_max_bytes > 0:
+            etag = client.stat_object(bucket, video_object_key).etag
+            cache = VideoCache(settings.worker_video_cache_dir, settings.worker_video_cache_max_bytes)
+            cache.get_or_fetch(
+                video_object_key,
+                etag,
+                lambda tmp: client.fget_object(bucket, video_object_key, str(tmp)),
+                use=lambda cached: _link_or_copy(cached, target),
+            )
+        else:
+            client.fget_object(bucket, video_object_key, str(target))
+    except S3Error as e:
+        raise RuntimeError(f"Failed to download video from MinIO: {e}") from e
+    if target.stat().st_size == 0:
+        raise RuntimeError(f"Downloaded video is empty: {video_object_key}")
+    return target
 
 
-def _upload_json(object_key: str, payload: bytes) -> None:
+def _upload_bytes(object_key: str, payload: bytes, content_type: str, metadata: dict[str, str] | None = None) -> None:
     settings = get_settings()
     bucket = settings.minio_bucket
     if not bucket:
@@ -119,10 +360,72 @@ def _upload_json(object_key: str, payload: bytes) -> None:
         object_name=object_key,
         data=BytesIO(payload),
         length=len(payload),
-        content_type="application/json",
+        content_type=content_type,
+        metadata=metadata,
     )
 
 
+def _upload_json(object_key: str, payload: bytes, content_encoding: str = IDENTITY) -> None:
+    """JSON 업로드 (압축된 payload면 Content-Encoding 헤더와 함께 저장)"""
+    _upload_bytes(object_key, payload, "application/json", content_encoding_headers(content_encoding))
+
+
+def _checkpoint_prefix(source_id: int) -> str:
+    return f"checkpoints/skeleton/{source_id}/"
+
+
+def _save_checkpoint_chunk(source_id: int, chunk: PoseChunk) -> None:
+    """처리한 프레임 구간을 checkpoint chunk로 업로드 (시작 프레임 번호로 정렬되는 이름)
+
+    checkpoint는 best-effort이므로 업로드 실패는 추출을 중단시키지 않습니다.
+    빠진 chunk 이후는 재시도 시 다시 추출됩니다.
+    """
+    object_key = f"{_checkpoint_prefix(source_id)}{chunk.start_frame:08d}.npz"
+    try:
+        _upload_bytes(object_key, chunk.to_bytes(), "application/octet-stream")
+    except Exception:
+        logger.warning("Failed to save checkpoint source_id=%s frame=%s", source_id, chunk.start_frame, exc_info=True)
+        return
+    logger.info("Checkpoint saved source_id=%s frames=[%s, %s)", source_id, chunk.start_frame, chunk.end_frame)
+
+
+def _load_checkpoint_chunks(source_id: int) -> list[PoseChunk]:
+    """이전 시도가 남긴 checkpoint chunk 로드 (실패 시 처음부터 다시 추출)"""
+    settings = get_settings()
+    bucket = settings.minio_bucket
+    if not bucket:
+        return []
+
+    client = get_minio_client()
+    chunks: list[PoseChunk] = []
+    try:
+        for obj in client.list_objects(bucket, prefix=_checkpoint_prefix(source_id), recursive=True):
+            response = client.get_object(bucket, obj.object_name)
+            try:
+                chunks.append(PoseChunk.from_bytes(response.read()))
+            finally:
+                response.close()
+                response.release_conn()
+    except Exception:
+        logger.warning("Failed to load checkpoint for source_id=%s; starting over", source_id, exc_info=True)
+        return []
+    return chunks
+
+
+def _delete_checkpoint(source_id: int) -> None:
+    settings = get_settings()
+    bucket = settings.minio_bucket
+    if not bucket:
+        return
+
+    client = get_minio_client()
+    try:
+        for obj in client.list_objects(bucket, prefix=_checkpoint_prefix(source_id), recursive=True):
+            client.remove_object(bucket, obj.object_name)
+    except Exception:
+        logger.warning("Failed to delete checkpoint for source_id=%s", source_id, exc_info=True)
+
+
 def _get_sessionmaker_and_engine() -> tuple[async_sessionmaker[AsyncSession], Any]:
     """각 작업마다 새로운 engine과 sessionmaker를 생성
     
@@ -135,6 +438,7 @@ def _get_sessionmaker_and_engine() -> tuple[async_sessionmaker[AsyncSession], An
     """
     from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
     from app.core.config import get_settings
+    from app.db.engine import engine_connect_args
     
     settings = get_settings()
     # 각 작업마다 새로운 engine 생성 (캐시 사용 안 함)
@@ -144,6 +448,7 @@ def _get_sessionmaker_and_engine() -> tuple[async_sessionmaker[AsyncSession], An
         # 각 작업마다 독립적인 연결 풀 사용
         pool_size=1,
         max_overflow=0,
+        connect_args=engine_connect_args(settings),
     )
     
     sessionmaker = async_sessionmaker(
@@ -206,15 +511,58 @@ def _run_async(coro):
                 asyncio.set_event_loop(None)
 
 
-@celery_app.task(name="extract_skeleton", bind=True, max_retries=3)
+def _retry_countdown(retries: int, base_sec: int) -> int:
+    """지수 backoff (최대 10분)"""
+    return min(base_sec * 2**retries, 600)
+
+
+def _fail_stage(task: Any, exc: Exception, source_id: int, job_task_id: str, countdown: int) -> Exception:
+    """단계 실패 처리 후 self.retry 예외 반환
+
+    재시도가 남아 있으면 Job만 RETRYING으로 표시하고,
+    마지막 시도면 Job/SkeletonSource를 FAILED로 표시하고 작업 파일을 정리합니다.
+    """
+    final = task.request.retries >= task.max_retries
+    try:
+        # 실패 시에도 새로운 engine 생성 (이전 engine이 이미 dispose되었을 수 있음)
+        sessionmaker, engine = _get_sessionmaker_and_engine()
+        if final:
+            _run_async(_update_source_failed(sessionmaker, engine, source_id, str(exc)))
+        job_status = JobStatus.FAILED if final else JobStatus.RETRYING
+        _run_async(_mark_job_finished(sessionmaker, engine, job_task_id, job_status, str(exc)))
+    except Exception:
+        logger.exception("Failed to mark failure for source_id=%s", source_id)
+    if final:
+        _delete_checkpoint(source_id)
+        _remove_work_dir(source_id)
+    return task.retry(exc=exc, countdown=countdown)
+
+
+def _stop_cancelled(sessionmaker: async_sessionmaker, engine: Any, source_id: int, job_task_id: str) -> None:
+    """취소된 작업의 상태 기록과 정리 (재시도하지 않음)"""
+    _delete_checkpoint(source_id)
+    _remove_work_dir(source_id)
+    try:
+        _run_async(_update_source_failed(sessionmaker, engine, source_id, "Extraction cancelled"))
+        _run_async(_mark_job_finished(sessionmaker, engine, job_task_id, JobStatus.CANCELLED))
+    except Exception:
+        logger.exception("Failed to mark job as CANCELLED for %s", source_id)
+
+
+@celery_app.task(name=EXTRACT_SKELETON_TASK, bind=True, max_retries=5)
 def extract_skeleton_task(
     self,
     source_id: int,
     video_object_key: str,
     project_id: int,
     track_slot: int,
+    infer_queue: str = EXTRACT_QUEUE_MEDIUM,
+    infer_priority: int | None = None,
 ) -> dict:
-    """스켈레톤 추출 작업."""
+    """스켈레톤 추출 1단계 (I/O 풀): 영상을 공유 작업 디렉터리로 다운로드하고 추론/마무리 chain 발행
+
+    API가 발행하는 task이며 이 task id가 Job.task_id입니다.
+    """
     logger.info(
         "Extract skeleton task started source_id=%s video=%s project_id=%s track_slot=%s",
         source_id,
@@ -223,58 +571,195 @@ def extract_skeleton_task(
         track_slot,
     )
 
-    # 각 작업마다 새로운 engine과 sessionmaker 생성
     sessionmaker, engine = _get_sessionmaker_and_engine()
+    job_task_id = self.request.id
+
+    status = _run_async(_check_job(sessionmaker, engine, job_task_id))
+    if status in (JobStatus.REVOKED, JobStatus.CANCELLED):
+        logger.info("Extract skeleton task skipped (%s) source_id=%s", status.value, source_id)
+        if status == JobStatus.CANCELLED:
+            _stop_cancelled(sessionmaker, engine, source_id, job_task_id)
+        return {"status": status.value, "source_id": source_id}
+
+    stage_kwargs = {
+        "source_id": source_id,
+        "video_object_key": video_object_key,
+        "project_id": project_id,
+        "track_slot": track_slot,
+        "job_task_id": job_task_id,
+    }
+    try:
+        video_path = _download_video(source_id, video_object_key)
+        chain(
+            extract_skeleton_infer_task.signature(
+                kwargs=stage_kwargs, queue=infer_queue, priority=infer_priority, immutable=True
+            ),
+            extract_skeleton_finalize_task.signature(kwargs=stage_kwargs, queue=EXTRACT_QUEUE_IO),
+        ).apply_async()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Extract skeleton download failed source_id=%s: %s", source_id, exc)
+        raise _fail_stage(self, exc, source_id, job_task_id, _retry_countdown(self.request.retries, 10))
+
+    logger.info("Extract skeleton downloaded source_id=%s path=%s -> %s", source_id, video_path, infer_queue)
+    return {"status": "DOWNLOADED", "source_id": source_id, "infer_queue": infer_queue}
+
+
+@celery_app.task(name=EXTRACT_SKELETON_INFER_TASK, bind=True, max_retries=3)
+def extract_skeleton_infer_task(
+    self,
+    source_id: int,
+    video_object_key: str,
+    project_id: int,
+    track_slot: int,
+    job_task_id: str,
+) -> dict:
+    """스켈레톤 추출 2단계 (CPU 풀): pose 추론 후 결과 JSON을 공유 작업 디렉터리에 기록"""
+    sessionmaker, engine = _get_sessionmaker_and_engine()
+
+    previous = _run_async(
+        _mark_job_started(sessionmaker, engine, job_task_id, self.request.retries + 1, self.request.hostname)
+    )
+    if previous in (JobStatus.REVOKED, JobStatus.CANCELLED):
+        # revoke가 broker에 도달하기 전에 받았거나, 대기 중에 취소된 작업
+        logger.info("Extract skeleton infer skipped (%s) source_id=%s", previous.value, source_id)
+        if previous == JobStatus.CANCELLED:
+            _stop_cancelled(sessionmaker, engine, source_id, job_task_id)
+        else:
+            _remove_work_dir(source_id)
+        return {"status": previous.value, "source_id": source_id}
+
+    def should_cancel() -> bool:
+        try:
+            return _run_async(_is_cancel_requested(sessionmaker, engine, job_task_id))
+        except Exception:
+            logger.warning("Failed to check cancellation for source_id=%s", source_id, exc_info=True)
+            return False
 
     try:
-        # 1) Download video from MinIO
-        video_path = _download_video_to_temp(video_object_key)
+        # 다른 호스트의 워커라 공유 볼륨에 영상이 없으면 직접 다운로드
+        video_path = _work_video_path(source_id, video_object_key)
+        if not video_path.exists():
+            video_path = _download_video(source_id, video_object_key)
+
+        # 이전 시도의 checkpoint가 있으면 이어서 진행
+        settings = get_settings()
+        resume_chunks = _load_checkpoint_chunks(source_id)
+        if resume_chunks:
+            logger.info(
+                "Resuming extraction source_id=%s from frame %s",
+                source_id,
+                max(chunk.end_frame for chunk in resume_chunks),
+            )
+        data = extract_pose_to_json(
+            video_path=str(video_path),
+            should_cancel=should_cancel,
+            cancel_check_every=settings.extract_cancel_check_frames,
+            resume_chunks=resume_chunks,
+            on_chunk=lambda chunk: _save_checkpoint_chunk(source_id, chunk),
+            chunk_frames=settings.extract_checkpoint_frames,
+            rewarm_frames=settings.extract_rewarm_frames,
+        )
+        # 압축은 CPU 단계에서 처리 (I/O 워커는 압축된 결과를 그대로 업로드)
+        content_encoding = normalize_encoding(settings.skeleton_content_encoding)
+        _work_result_path(source_id).write_bytes(
+            encode_content(dump_json_to_bytes(data), content_encoding, settings.skeleton_compression_level)
+        )
+        # 구간 조회용 프레임 chunk, 타임라인 미리보기용 LOD 레벨
+        arrays = skeleton_json_to_arrays(data)
+        chunk_frames, chunks = None, []
+        fps = data.get("meta", {}).get("fps")
+        if settings.skeleton_chunk_sec > 0 and fps:
+            chunk_frames = frames_per_chunk(fps, settings.skeleton_chunk_sec)
+            chunks = _write_frame_chunks(
+                source_id, arrays, chunk_frames, content_encoding, settings.skeleton_compression_level
+            )
+        levels = _write_lod_levels(
+            source_id,
+            arrays,
+            _parse_lod_factors(settings.skeleton_lod_factors),
+            settings.skeleton_lod_motion_weight,
+            content_encoding,
+            settings.skeleton_compression_level,
+        )
+    except ExtractionCancelled as exc:
+        logger.info("Extract skeleton cancelled source_id=%s frame=%s", source_id, exc.frame_idx)
+        _stop_cancelled(sessionmaker, engine, source_id, job_task_id)
+        return {"status": "CANCELLED", "source_id": source_id}
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Extract skeleton failed source_id=%s: %s", source_id, exc)
+        raise _fail_stage(self, exc, source_id, job_task_id, 60)
+
+    meta = data.get("meta", {})
+    return {
+        "status": "INFERRED",
+        "source_id": source_id,
+        "content_encoding": content_encoding,
+        "chunk_frames": chunk_frames,
+        "chunks": chunks,
+        "levels": levels,
+        "meta": {
+            "fps": meta.get("fps"),
+            "num_frames": meta.get("num_frames"),
+            "num_joints": meta.get("num_joints"),
+            "pose_model": meta.get("pose_model"),
+        },
+    }
 
-        # 2) Run pose extraction (MediaPipe)
-        data = extract_pose_to_json(video_path=str(video_path))
-        payload = dump_json_to_bytes(data)
 
-        # 3) Upload skeleton JSON back to MinIO
+@celery_app.task(name=EXTRACT_SKELETON_FINALIZE_TASK, bind=True, max_retries=5)
+def extract_skeleton_finalize_task(
+    self,
+    infer_result: dict,
+    source_id: int,
+    video_object_key: str,
+    project_id: int,
+    track_slot: int,
+    job_task_id: str,
+) -> dict:
+    """스켈레톤 추출 3단계 (I/O 풀): 결과 업로드, SkeletonSource READY 처리, 작업 파일 정리"""
+    if infer_result.get("status") != "INFERRED":
+        # 취소 등으로 추론 단계가 결과 없이 끝난 경우
+        return infer_result
+
+    sessionmaker, engine = _get_sessionmaker_and_engine()
+    try:
         object_key = _build_object_key(project_id, track_slot, source_id)
-        _upload_json(object_key, payload)
+        content_encoding = infer_result.get("content_encoding", IDENTITY)
+        _upload_json(object_key, _work_result_path(source_id).read_bytes(), content_encoding)
+
+        prefix = chunk_prefix(project_id, track_slot, source_id)
+        chunk_frames = infer_result.get("chunk_frames")
+        if chunk_frames:
+            _upload_frame_chunks(source_id, prefix, infer_result, content_encoding)
+        levels = _upload_lod_levels(source_id, prefix, infer_result, content_encoding)
 
-        # 4) Update DB -> READY
-        meta = data.get("meta", {})
+        meta = infer_result["meta"]
         _run_async(
             _update_source_success(
                 sessionmaker,
                 engine,
                 source_id,
                 object_key,
-                {
-                    "fps": meta.get("fps"),
-                    "num_frames": meta.get("num_frames"),
-                    "num_joints": meta.get("num_joints"),
-                    "pose_model": meta.get("pose_model"),
-                },
+                meta,
+                content_encoding,
+                prefix if chunk_frames else None,
+                chunk_frames,
+                levels,
             )
         )
-
-        logger.info("Extract skeleton task completed source_id=%s object_key=%s", source_id, object_key)
-        return {
-            "status": "READY",
-            "source_id": source_id,
-            "object_key": object_key,
-            "num_frames": meta.get("num_frames"),
-            "fps": meta.get("fps"),
-        }
+        _run_async(_mark_job_finished(sessionmaker, engine, job_task_id, JobStatus.SUCCEEDED))
     except Exception as exc:  # noqa: BLE001
-        logger.exception("Extract skeleton failed source_id=%s: %s", source_id, exc)
-        try:
-            # 실패 시에도 새로운 engine 생성 (이전 engine이 이미 dispose되었을 수 있음)
-            sessionmaker, engine = _get_sessionmaker_and_engine()
-            _run_async(_update_source_failed(sessionmaker, engine, source_id, str(exc)))
-        except Exception:
-            logger.exception("Failed to mark source as FAILED for %s", source_id)
-        raise self.retry(exc=exc, countdown=60)
-    finally:
-        try:
-            if "video_path" in locals():
-                Path(video_path).unlink(missing_ok=True)
-        except Exception:
-            logger.warning("Failed to clean temp video for source_id=%s", source_id)
+        logger.exception("Extract skeleton finalize failed source_id=%s: %s", source_id, exc)
+        raise _fail_stage(self, exc, source_id, job_task_id, _retry_countdown(self.request.retries, 10))
+
+    _delete_checkpoint(source_id)
+    _remove_work_dir(source_id)
+
+    logger.info("Extract skeleton task completed source_id=%s object_key=%s", source_id, object_key)
+    return {
+        "status": "READY",
+        "source_id": source_id,
+        "object_key": object_key,
+        "num_frames": meta.get("num_frames"),
+        "fps": meta.get("fps"),
+    }
@@ -0,0 +1,154 @@
+"""기존 스켈레톤 객체 재압축 Celery Task (1회성 마이그레이션)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from io import BytesIO
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.integrations.content_encoding import (
+    IDENTITY,
+    content_encoding_headers,
+    decode_content,
+    encode_content,
+    normalize_encoding,
+)
+from app.integrations.task_contracts import SKELETON_RECOMPRESS_TASK
+from app.models import AssetStatus, SkeletonSource
+from app.storage.minio_client import get_minio_client
+from worker.celery_app import celery_app
+from worker.tasks.extract_skeleton import _get_sessionmaker_and_engine, _run_async
+
+logger = logging.getLogger(__name__)
+
+
+async def _next_sources(
+    sessionmaker: async_sessionmaker[AsyncSession], after_id: int, encoding: str, limit: int
+) -> list[tuple[int, str, str | None]]:
+    """재압축 대상 (id, object_key, content_encoding) 조회 (id keyset 페이지네이션)"""
+    async with sessionmaker() as session:
+        result = await session.execute(
+            select(SkeletonSource.id, SkeletonSource.object_key, SkeletonSource.content_encoding)
+            .where(
+                SkeletonSource.id > after_id,
+                SkeletonSource.status == AssetStatus.READY,
+                SkeletonSource.object_key.is_not(None),
+                func.coalesce(SkeletonSource.content_encoding, IDENTITY) != encoding,
+            )
+            .order_by(SkeletonSource.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+
+async def _set_encoding(
+    sessionmaker: async_sessionmaker[AsyncSession], source_id: int, object_key: str, encoding: str
+) -> None:
+    async with sessionmaker() as session:
+        await session.execute(
+            update(SkeletonSource)
+            .where(SkeletonSource.id == source_id, SkeletonSource.object_key == object_key)
+            .values(content_encoding=encoding)
+        )
+        await session.commit()
+
+
+def _recompress_object(bucket: str, object_key: str, stored_encoding: str | None, encoding: str, level: int) -> tuple[int, int]:
+    """객체를 읽어 encoding으로 다시 저장하고 (이전 크기, 새 크기) 반환
+
+    DB 기록보다 객체의 Content-Encoding 헤더를 우선합니다 (업로드 후 DB 갱신 전에 중단된 경우 등).
+    """
+    client = get_minio_client()
+    response = client.get_object(bucket, object_key)
+    try:
+        data = response.read()
+        current = response.headers.get("Content-Encoding") or stored_encoding
+    finally:
+        response.close()
+        response.release_conn()
+
+    payload = encode_content(decode_content(data, current), encoding, level)
+    client.put_object(
+        bucket_name=bucket,
+        object_name=object_key,
+        data=BytesIO(payload),
+        length=len(payload),
+        content_type="application/json",
+        metadata=content_encoding_headers(encoding),
+    )
+    return len(data), len(payload)
+
+
+async def _recompress_all(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    engine: Any,
+    bucket: str,
+    target: str,
+    level: int,
+    batch_size: int,
+    dry_run: bool,
+    report: dict[str, Any],
+) -> None:
+    """대상 소스를 id 순서로 재압축 (한 이벤트 루프에서 실행하고 끝나면 engine 정리)"""
+    try:
+        after_id = 0
+        while True:
+            sources = await _next_sources(sessionmaker, after_id, target, batch_size)
+            if not sources:
+                break
+            after_id = sources[-1][0]
+            for source_id, object_key, stored_encoding in sources:
+                if dry_run:
+                    report["recompressed"] += 1
+                    continue
+                try:
+                    before, after = await asyncio.to_thread(
+                        _recompress_object, bucket, object_key, stored_encoding, target, level
+                    )
+                    await _set_encoding(sessionmaker, source_id, object_key, target)
+                except Exception:
+                    logger.warning("Failed to recompress skeleton source_id=%s", source_id, exc_info=True)
+                    report["failed"] += 1
+                    continue
+                report["recompressed"] += 1
+                report["bytes_before"] += before
+                report["bytes_after"] += after
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(name=SKELETON_RECOMPRESS_TASK)
+def recompress_skeletons_task(encoding: str | None = None, batch_size: int = 100, dry_run: bool = False) -> dict:
+    """READY 스켈레톤 객체를 encoding(기본: SKELETON_CONTENT_ENCODING)으로 재압축
+
+    이미 같은 encoding인 소스는 건너뛰므로 중단 후 다시 실행해도 됩니다.
+    """
+    settings = get_settings()
+    bucket = settings.minio_bucket
+    if not bucket:
+        raise RuntimeError("MinIO bucket not configured")
+    target = normalize_encoding(encoding or settings.skeleton_content_encoding)
+
+    report: dict[str, Any] = {
+        "encoding": target,
+        "dry_run": dry_run,
+        "recompressed": 0,
+        "failed": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+    # engine 연결은 생성된 이벤트 루프에 묶이므로 전체 작업을 하나의 _run_async로 실행
+    sessionmaker, engine = _get_sessionmaker_and_engine()
+    _run_async(
+        _recompress_all(
+            sessionmaker, engine, bucket, target, settings.skeleton_compression_level, batch_size, dry_run, report
+        )
+    )
+
+    logger.info("Skeleton recompression finished: %s", report)
+    return report
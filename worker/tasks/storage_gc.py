@@ -0,0 +1,36 @@
+"""저장소 GC Celery Task (beat로 주기 실행)."""
+
+from __future__ import annotations
+
+import logging
+
+from app.integrations.task_contracts import STORAGE_GC_TASK
+from app.services.storage_gc_service import StorageGcReport, StorageGcService
+from worker.celery_app import celery_app
+from worker.tasks.extract_skeleton import _get_sessionmaker_and_engine, _run_async
+
+logger = logging.getLogger(__name__)
+
+
+async def _run(dry_run: bool) -> StorageGcReport:
+    # engine 연결은 생성된 이벤트 루프에 묶이므로 같은 루프에서 정리
+    sessionmaker, engine = _get_sessionmaker_and_engine()
+    try:
+        return await StorageGcService.run(sessionmaker, dry_run=dry_run)
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(name=STORAGE_GC_TASK)
+def storage_gc_task(dry_run: bool = False) -> dict:
+    """참조되지 않는 SkeletonSource / MinIO 객체 정리 후 결과(삭제 수, 회수 용량) 반환"""
+    report = _run_async(_run(dry_run))
+    logger.info(
+        "Storage GC reclaimed %d bytes (sources=%d, media=%d, orphans=%d, errors=%d)",
+        report.bytes_reclaimed,
+        report.sources_deleted,
+        report.media_objects_deleted,
+        report.orphan_objects_deleted,
+        report.delete_errors,
+    )
+    return report.as_dict()
@@ -0,0 +1,128 @@
+"""워커 로컬 디스크의 원본 영상 LRU 캐시
+
+object key + ETag를 키로 영상을 보관하므로 재시도나 재추출 시 MinIO에서 다시 받지 않습니다.
+- 채우기는 임시 파일에 받은 뒤 rename하므로 부분 파일이 캐시에 보이지 않습니다.
+- 키별 flock으로 같은 영상을 여러 프로세스(prefork 자식, threads)가 동시에 받지 않습니다.
+- 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은(mtime) 파일부터 제거합니다.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_LOCK_SUFFIX = ".lock"
+_PART_MARKER = ".part-"
+
+
+def _lock_file(path: Path, blocking: bool = True) -> IO[str] | None:
+    """path를 열어 배타 잠금 후 파일 객체 반환 (non-blocking이면 다른 프로세스가 쥐고 있을 때 None)
+
+    잠그는 사이 evict가 lock 파일을 지우고 새로 만들어졌을 수 있으므로,
+    잠근 파일이 아직 path와 같은 inode인지 확인하고 아니면 다시 엽니다.
+    """
+    while True:
+        fh = open(path, "a")
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            fh.close()
+            return None
+        try:
+            if os.stat(path).st_ino == os.fstat(fh.fileno()).st_ino:
+                return fh
+        except FileNotFoundError:
+            pass
+        fh.close()
+
+
+@contextmanager
+def _flock(path: Path) -> Iterator[None]:
+    fh = _lock_file(path)
+    try:
+        yield
+    finally:
+        fh.close()  # close하면 잠금도 해제됨
+
+
+class VideoCache:
+    def __init__(self, root: str | Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, object_key: str, etag: str) -> Path:
+        digest = hashlib.sha256(f"{object_key}\0{etag}".encode()).hexdigest()
+        return self.root / f"{digest}{Path(object_key).suffix}"
+
+    def get_or_fetch(
+        self,
+        object_key: str,
+        etag: str,
+        fetch: Callable[[Path], None],
+        use: Callable[[Path], None] | None = None,
+    ) -> Path:
+        """캐시된 영상 경로 반환 (없으면 fetch(임시 경로)로 받아서 채움)
+
+        use(경로)는 항목 잠금을 쥔 채 호출되므로 그동안 evict가 파일을 지우지 않습니다.
+        반환 후에는 경로가 제거될 수 있으므로 hard link / 복사는 use에서 하세요.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(object_key, etag)
+
+        with _flock(path.with_name(path.name + _LOCK_SUFFIX)):
+            if path.exists():
+                os.utime(path)  # LRU 순서 갱신
+                logger.info("Video cache hit key=%s", object_key)
+            else:
+                tmp = path.with_name(f"{path.name}{_PART_MARKER}{os.getpid()}")
+                try:
+                    fetch(tmp)
+                    os.replace(tmp, path)
+                finally:
+                    tmp.unlink(missing_ok=True)
+                logger.info("Video cache fill key=%s size=%s", object_key, path.stat().st_size)
+            if use is not None:
+                use(path)
+
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Path | None = None) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목 제거"""
+        with _flock(self.root / ".evict.lock"):
+            entries = []
+            for entry in self.root.iterdir():
+                if entry.name.startswith(".") or entry.name.endswith(_LOCK_SUFFIX) or _PART_MARKER in entry.name:
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                if entry == keep:
+                    continue
+                # 사용 중(채우는 중, 작업 디렉터리로 연결 중)인 항목은 건너뜀
+                lock_path = Path(str(entry) + _LOCK_SUFFIX)
+                fh = _lock_file(lock_path, blocking=False)
+                if fh is None:
+                    continue
+                try:
+                    entry.unlink(missing_ok=True)
+                    # 잠금을 쥔 채 지우므로, 기다리던 프로세스는 inode가 바뀐 것을 보고 새 lock 파일을 엶
+                    lock_path.unlink(missing_ok=True)
+                finally:
+                    fh.close()
+                total -= size
+                logger.info("Video cache evict %s", entry.name)